@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import json
 import math
+import os
 import re
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from src.core.filter_presets import AUDIO_FILTER_PRESETS, VIDEO_FILTER_PRESETS
 
@@ -64,7 +68,7 @@ class TransitionSettings:
 class RenderOptions:
     frame_rate: float = 30.0
     resolution: Tuple[int, int] = (1920, 1080)
-    video_codec: str = "h264"  # h264 or hevc
+    video_codec: str = "h264"  # h264, hevc, or auto (fastest hardware codec)
     video_bitrate: str = "8000k"
     audio_bitrate: str = "192k"
     burn_subtitles: bool = False
@@ -87,12 +91,61 @@ class RenderOptions:
     logo_x: int = 50
     logo_y: int = 50
     logo_remove_background: bool = False
+    # FFmpeg threading: 0 lets FFmpeg pick per-stage thread counts itself
+    ffmpeg_threads: int = 0
+    thread_queue_size: int = 512
+    # Number of scene clips encoded concurrently (1 = one after another)
+    max_parallel_scenes: int = 1
+    # When both clips and the combined video are wanted, stream each clip's
+    # packets to the final muxer while it is encoded instead of re-reading it
+    tee_output: bool = False
+    # Scene clips written by each FFmpeg process; above one, consecutive
+    # scenes share a process so start-up and encoder init are paid per batch
+    scene_batch_size: int = 1
 
 
 @dataclass
 class RenderBatchResult:
     scenes: List[RenderResult] = field(default_factory=list)
     combined: Optional[RenderResult] = None
+    # Settings that could not be honoured, for the UI to show with the result
+    warnings: List[str] = field(default_factory=list)
+
+
+@dataclass
+class TeeMuxer:
+    """Final muxer fed by every scene encode through a named pipe."""
+
+    process: subprocess.Popen
+    fifos: List[Path]
+    output_path: Path
+    log_path: Path
+
+    def target(self, index: int) -> Optional[Path]:
+        """Pipe for scene ``index``, or ``None`` once the muxer has gone away."""
+        # A writer opening a FIFO blocks until a reader shows up, so never
+        # hand out a pipe the muxer can no longer consume.
+        if self.process.poll() is not None:
+            return None
+        return self.fifos[index - 1]
+
+    def release(self, fifo: Path) -> None:
+        """Unblock a writer stuck opening ``fifo`` after the muxer died.
+
+        Briefly standing in as the reader lets the writer's ``open()``
+        return; its writes then fail with EPIPE, which the tee slave's
+        ``onfail=ignore`` drops without touching the clip output.
+        """
+        try:
+            fd = os.open(fifo, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError:
+            return
+        os.close(fd)
+
+    def abort(self) -> None:
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
 
 
 @dataclass
@@ -104,12 +157,94 @@ class SrtEntry:
 
 ProgressCallback = Optional[Callable[[str, float, Optional[str]], None]]
 
+# Keep FFmpeg's stderr down to actual errors: the banner and the periodic
+# stats line otherwise pile up in memory for every captured process.
+FFMPEG_QUIET_ARGS: Tuple[str, ...] = ("-hide_banner", "-nostats", "-loglevel", "error")
+
+# UI transition keys -> libavfilter xfade transition names.
+XFADE_TRANSITIONS: Dict[str, Optional[str]] = {
+    "none": None,
+    "fade": "fade",
+    "dissolve": "dissolve",
+    "crossfade": "fade",
+    "wipe_left": "wipeleft",
+    "wipe_right": "wiperight",
+    "wipe_up": "wipeup",
+    "wipe_down": "wipedown",
+    "slide_left": "slideleft",
+    "slide_right": "slideright",
+    "slide_up": "slideup",
+    "slide_down": "slidedown",
+    "smooth_left": "smoothleft",
+    "smooth_right": "smoothright",
+    "blur": "fadeblack",
+    "fade_white": "fadewhite",
+    "circle_open": "circleopen",
+    "circle_close": "circleclose",
+    "pixelize": "pixelize",
+    "radial": "radial",
+}
+
+# Hardware encoders to try, in order, when hardware acceleration is on.
+HARDWARE_ENCODERS: Dict[str, Tuple[str, ...]] = {
+    "h264": ("h264_videotoolbox", "h264_nvenc", "h264_qsv", "h264_amf"),
+    "hevc": ("hevc_videotoolbox", "hevc_nvenc", "hevc_qsv", "hevc_amf"),
+    "av1": ("av1_nvenc", "av1_qsv", "av1_amf"),
+}
+
+# Codecs "auto" tries, fastest first. Only a codec with a working hardware
+# encoder is chosen; otherwise auto falls back to software H.264.
+AUTO_CODEC_ORDER: Tuple[str, ...] = ("av1", "hevc", "h264")
+
+# Concurrent NVENC sessions to allow across all scene encodes. Consumer
+# GeForce drivers have capped this at 3 to 8 depending on the version;
+# staying at the lowest keeps parallel renders from failing to open one.
+NVENC_MAX_SESSIONS = 3
+
+# Most scenes one single-pass FFmpeg run may take. Each scene adds inputs,
+# open files and a branch of the concat/xfade graph, and one bad scene
+# fails the whole run; longer plans go through per-scene clips and concat.
+SINGLE_PASS_MAX_SCENES = 32
+
+# How often a teed scene encode checks that the combined muxer is alive,
+# and how long the muxer may take to finish once every scene is written.
+TEE_POLL_SECONDS = 0.5
+TEE_MUXER_TIMEOUT = 300.0
+
+# xfade transitions that xfade_opencl implements on the GPU.
+OPENCL_XFADE_TRANSITIONS = frozenset({
+    "fade",
+    "wipeleft",
+    "wiperight",
+    "wipeup",
+    "wipedown",
+    "slideleft",
+    "slideright",
+    "slideup",
+    "slidedown",
+})
+
+# Length in seconds of the fade_in / fade_out animations per intensity.
+FADE_ANIMATION_SECONDS: Dict[str, float] = {"subtle": 0.5, "medium": 1.0, "strong": 1.5}
+
 
 class VideoComposer:
     """High level interface for FFmpeg based rendering."""
 
     def __init__(self) -> None:
         self._check_dependencies()
+        # directory -> (mtime_ns, regular files); shared by scene threads
+        self._listing_cache: Dict[Path, Tuple[int, List[Path]]] = {}
+        self._listing_lock = threading.Lock()
+        # audio path -> ((mtime_ns, size), duration); probed at most once per
+        # file version however many render stages ask for it
+        self._duration_cache: Dict[Path, Tuple[Tuple[int, int], float]] = {}
+        self._duration_lock = threading.Lock()
+        # codec -> first hardware encoder that actually works, or None
+        self._hardware_encoders: Dict[str, Optional[str]] = {}
+        self._hardware_encoder_lock = threading.Lock()
+        self._opencl_xfade: Optional[bool] = None
+        self._encode_speed_cache: Dict[Tuple[str, ...], Optional[float]] = {}
 
     def _check_dependencies(self) -> None:
         self.ffmpeg_available = self._command_available(["ffmpeg", "-version"])
@@ -133,6 +268,41 @@ class VideoComposer:
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
+    def preview_project(
+        self,
+        audio_directory: str,
+        image_directory: str,
+        options: Optional[RenderOptions] = None,
+    ) -> Dict[str, Any]:
+        """Count a project's inputs and total its audio without rendering.
+
+        Probes go through the duration and encoder caches, so a render
+        started right after a preview does not probe the same things again.
+        With ``options`` the first image is also encoded for a second to
+        estimate how long the render will take.
+        """
+        audio_dir = Path(audio_directory)
+        image_dir = Path(image_directory)
+        if not audio_dir.is_dir():
+            raise VideoComposerError(f"Thư mục audio không tồn tại: {audio_directory}")
+        if not image_dir.is_dir():
+            raise VideoComposerError(f"Thư mục image không tồn tại: {image_directory}")
+
+        audio_files = self._find_audio_files(audio_dir)
+        image_files = self._find_image_files(image_dir)
+        self._prefetch_durations(audio_files)
+        durations = [self._probe_duration(path) for path in audio_files]
+        encoder_args = self._video_encoder_args(options or RenderOptions())
+        speed = self._encode_speed(image_files[0], options) if options and image_files else None
+        return {
+            "audio_files": len(audio_files),
+            "image_files": len(image_files),
+            "total_duration": sum(durations),
+            "longest_duration": max(durations, default=0.0),
+            "video_encoder": encoder_args[encoder_args.index("-c:v") + 1],
+            "estimated_render_seconds": sum(durations) / speed if speed else None,
+        }
+
     def render_project(
         self,
         audio_directory: str,
@@ -185,44 +355,56 @@ class VideoComposer:
             shutil.rmtree(temp_dir, ignore_errors=True)
             raise VideoComposerError("Không có cặp audio/image hợp lệ.")
 
+        self._prefetch_durations(plan["audio"] for plan in segment_plan)
+
         total_steps = len(segment_plan) + (1 if create_combined else 0)
         completed_steps = 0
 
+        tee: Optional[TeeMuxer] = None
         try:
             scene_outputs: List[Path] = []
             scene_durations: List[float] = []
 
+            if self._can_render_single_pass(segment_plan, options, create_individual, create_combined):
+                if progress_callback:
+                    progress_callback("combined", 0.0, "Đang dựng video hoàn chỉnh")
+                batch_result.combined = self._render_combined_single_pass(
+                    segment_plan=segment_plan,
+                    output_dir=output_dir,
+                    temp_dir=temp_dir,
+                    options=options,
+                    clip_results=batch_result.scenes if create_individual else None,
+                    on_progress=(
+                        (lambda ratio: progress_callback("combined", ratio, "Đang dựng video hoàn chỉnh"))
+                        if progress_callback
+                        else None
+                    ),
+                )
+                if progress_callback:
+                    progress_callback("combined", 1.0, "Hoàn thành video ghép")
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return batch_result
+
+            if self._can_tee_combined(segment_plan, options, create_individual, create_combined):
+                tee = self._start_tee_muxer(len(segment_plan), temp_dir, options)
+
             if create_individual or create_combined:
-                for index, plan in enumerate(segment_plan, start=1):
-                    if progress_callback:
-                        progress_callback(
-                            "scene",
-                            completed_steps / max(total_steps, 1),
-                            f"Rendering clip {index}/{len(segment_plan)}",
-                        )
-                    result = self._render_scene(
-                        index=index,
-                        audio_file=plan["audio"],
-                        image_file=plan["image"],
-                        subtitle_file=plan.get("subtitle"),
-                        output_dir=output_dir,
-                        temp_dir=temp_dir,
-                        options=options,
-                    )
+                scene_results = self._render_scenes(
+                    segment_plan=segment_plan,
+                    output_dir=output_dir,
+                    temp_dir=temp_dir,
+                    options=options,
+                    total_steps=total_steps,
+                    progress_callback=progress_callback,
+                    tee=tee,
+                )
+                for result in scene_results:
                     batch_result.scenes.append(result)
-                    if result.success:
-                        scene_outputs.append(Path(result.output_path))
-                        scene_durations.append(result.duration)
-                    else:
+                    if not result.success:
                         raise VideoComposerError(result.error or "Render thất bại")
-
-                    completed_steps += 1
-                    if progress_callback:
-                        progress_callback(
-                            "scene",
-                            completed_steps / max(total_steps, 1),
-                            f"Hoàn thành clip {index}",
-                        )
+                    scene_outputs.append(Path(result.output_path))
+                    scene_durations.append(result.duration)
+                completed_steps += len(scene_results)
 
             if create_combined and scene_outputs:
                 if progress_callback:
@@ -231,12 +413,27 @@ class VideoComposer:
                         completed_steps / max(total_steps, 1),
                         "Đang ghép video hoàn chỉnh",
                     )
-                combined_result = self._render_combined(
-                    clips=scene_outputs,
-                    durations=scene_durations,
-                    output_dir=output_dir,
-                    options=options,
-                )
+                combined_result = None
+                if tee is not None:
+                    combined_result = self._finish_tee_muxer(
+                        tee, len(scene_outputs), output_dir, scene_durations, options
+                    )
+                if combined_result is None:
+                    soft_subtitles = not options.burn_subtitles and any(
+                        plan.get("subtitle") for plan in segment_plan
+                    )
+                    if soft_subtitles and self._transition_applies(options, scene_durations):
+                        batch_result.warnings.append(
+                            "Không áp dụng được hiệu ứng chuyển cảnh: phụ đề mềm chỉ ghép được "
+                            "bằng cắt nối thẳng. Hãy burn phụ đề vào video để giữ chuyển cảnh."
+                        )
+                    combined_result = self._render_combined(
+                        clips=scene_outputs,
+                        durations=scene_durations,
+                        output_dir=output_dir,
+                        options=options,
+                        keep_subtitles=soft_subtitles,
+                    )
                 batch_result.combined = combined_result
                 completed_steps += 1
                 if progress_callback:
@@ -255,24 +452,306 @@ class VideoComposer:
         except Exception as exc:
             shutil.rmtree(temp_dir, ignore_errors=True)
             raise
+        finally:
+            if tee is not None:
+                tee.abort()
 
         return batch_result
 
+    def _render_scenes(
+        self,
+        segment_plan: List[Dict[str, Path]],
+        output_dir: Path,
+        temp_dir: Path,
+        options: RenderOptions,
+        total_steps: int,
+        progress_callback: ProgressCallback,
+        tee: Optional[TeeMuxer] = None,
+    ) -> List[RenderResult]:
+        """Render every planned scene, in parallel when the options allow it.
+
+        Results come back in plan order. Rendering stops at the first failed
+        scene; scenes that were never started are left out of the result.
+        With ``tee`` set, each scene's packets are also written to the
+        combined muxer's pipe; teed scenes must be rendered one after another.
+        With ``scene_batch_size`` above one, consecutive scenes share a
+        single FFmpeg process (see ``_render_scene_batch``).
+        """
+        scene_count = len(segment_plan)
+        batch_size = max(1, options.scene_batch_size) if tee is None else 1
+        parallel = max(1, options.max_parallel_scenes)
+        if self._uses_nvenc(options):
+            # Every clip in every running batch holds an encoder session.
+            batch_size = min(batch_size, NVENC_MAX_SESSIONS)
+            parallel = min(parallel, max(1, NVENC_MAX_SESSIONS // batch_size))
+        batches = [
+            list(range(start, min(start + batch_size, scene_count)))
+            for start in range(0, scene_count, batch_size)
+        ]
+        workers = max(1, min(parallel, len(batches)))
+        lock = threading.Lock()
+        completed = [0]
+
+        def report(message: str) -> None:
+            if progress_callback:
+                progress_callback("scene", completed[0] / max(total_steps, 1), message)
+
+        def render(batch: List[int]) -> List[RenderResult]:
+            first, last = batch[0] + 1, batch[-1] + 1
+            if workers == 1:
+                report(
+                    f"Rendering clip {first}/{scene_count}"
+                    if first == last
+                    else f"Rendering clips {first}-{last}/{scene_count}"
+                )
+            if len(batch) == 1:
+                plan = segment_plan[batch[0]]
+                results = [
+                    self._render_scene(
+                        index=first,
+                        audio_file=plan["audio"],
+                        image_file=plan["image"],
+                        subtitle_file=plan.get("subtitle"),
+                        output_dir=output_dir,
+                        temp_dir=temp_dir,
+                        options=options,
+                        tee=tee,
+                    )
+                ]
+            else:
+                results = self._render_scene_batch(
+                    [(position + 1, segment_plan[position]) for position in batch],
+                    output_dir,
+                    temp_dir,
+                    options,
+                )
+            done = sum(1 for result in results if result.success)
+            if done:
+                with lock:
+                    completed[0] += done
+                    report(f"Hoàn thành clip {last}" if workers == 1 else f"Hoàn thành {completed[0]}/{scene_count} clip")
+            return results
+
+        def until_failure(results: List[RenderResult]) -> Tuple[List[RenderResult], bool]:
+            for position, result in enumerate(results):
+                if not result.success:
+                    return results[: position + 1], True
+            return results, False
+
+        if workers == 1:
+            ordered: List[RenderResult] = []
+            for batch in batches:
+                results, failed = until_failure(render(batch))
+                ordered.extend(results)
+                if failed:
+                    break
+            return ordered
+
+        report(f"Rendering {scene_count} clips ({workers} song song)")
+        # Longest-processing-time first: the pool hands out jobs in submit
+        # order, so queueing the longest scenes first keeps one long clip
+        # from running alone at the end while the other workers sit idle.
+        longest_first = sorted(
+            range(len(batches)),
+            key=lambda position: sum(
+                self._estimate_scene_cost(segment_plan[scene]) for scene in batches[position]
+            ),
+            reverse=True,
+        )
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scene") as pool:
+            futures = {
+                position: pool.submit(render, batches[position])
+                for position in longest_first
+            }
+            ordered = []
+            for position in range(len(batches)):
+                results, failed = until_failure(futures[position].result())
+                ordered.extend(results)
+                if failed:
+                    for pending in futures.values():
+                        pending.cancel()
+                    break
+        return ordered
+
+    def _render_scene_batch(
+        self,
+        scenes: List[Tuple[int, Dict[str, Path]]],
+        output_dir: Path,
+        temp_dir: Path,
+        options: RenderOptions,
+    ) -> List[RenderResult]:
+        """Render several scene clips from one FFmpeg process.
+
+        Each scene keeps its own branch of a shared filter graph and its own
+        output file, so the clips match ``_render_scene``'s, but process
+        start-up and encoder initialisation are paid once per batch rather
+        than once per clip. A failed run fails every scene in the batch.
+        """
+        queue_size = str(options.thread_queue_size)
+        logo_file: Optional[str] = None
+        if options.logo_enabled and options.logo_file and Path(options.logo_file).exists():
+            logo_file = str(options.logo_file)
+
+        cmd: List[str] = ["ffmpeg", "-y", *FFMPEG_QUIET_ARGS, *self._filter_thread_args(options)]
+        filter_parts: List[str] = []
+        output_args: List[str] = []
+        outputs: List[Tuple[int, Dict[str, Path], float, Path]] = []
+        input_index = 0
+
+        for index, plan in scenes:
+            subtitle_file = plan.get("subtitle")
+            duration = self._probe_duration(plan["audio"])
+            if duration <= 0:
+                # Let the single-scene path report this clip on its own.
+                return [
+                    self._render_scene(
+                        index=scene_index,
+                        audio_file=scene_plan["audio"],
+                        image_file=scene_plan["image"],
+                        subtitle_file=scene_plan.get("subtitle"),
+                        output_dir=output_dir,
+                        temp_dir=temp_dir,
+                        options=options,
+                    )
+                    for scene_index, scene_plan in scenes
+                ]
+
+            image_input = input_index
+            audio_input = input_index + 1
+            cmd.extend([
+                "-thread_queue_size", queue_size,
+                "-framerate", f"{options.frame_rate}",
+                "-i", str(plan["image"]),
+                "-thread_queue_size", queue_size,
+                "-i", str(plan["audio"]),
+            ])
+            input_index += 2
+
+            logo_input = None
+            if logo_file:
+                cmd.extend(["-i", logo_file])
+                logo_input = input_index
+                input_index += 1
+
+            music_input = None
+            music_duration = 0.0
+            if options.background_music_directory:
+                music_file = self._get_background_music(options.background_music_directory, duration)
+                if music_file:
+                    cmd.extend(["-i", str(music_file)])
+                    music_input = input_index
+                    input_index += 1
+                    music_duration = self._probe_duration(music_file)
+
+            subtitle_input = None
+            if subtitle_file and not options.burn_subtitles:
+                cmd.extend(["-i", str(subtitle_file)])
+                subtitle_input = input_index
+                input_index += 1
+
+            parts, video_stream, audio_stream = self._scene_filter_graph(
+                options=options,
+                duration=duration,
+                image_input=image_input,
+                audio_input=audio_input,
+                subtitle_file=subtitle_file,
+                logo_input=logo_input,
+                music_input=music_input,
+                music_duration=music_duration,
+                prefix=f"s{index}_",
+            )
+            filter_parts.extend(parts)
+
+            temp_output = temp_dir / f"clip_{index:03d}.mp4"
+            output_args.extend(["-map", video_stream, "-map", audio_stream])
+            output_args.extend(self._video_encoder_args(options))
+            output_args.extend(["-threads", str(max(options.ffmpeg_threads, 0))])
+            output_args.extend(["-c:a", "aac", "-b:a", options.audio_bitrate])
+            if subtitle_input is not None:
+                output_args.extend(["-map", f"{subtitle_input}:0", "-c:s", "mov_text"])
+            output_args.extend([
+                "-t", f"{duration:.4f}",
+                "-r", f"{options.frame_rate}",
+                "-movflags", "+faststart",
+                str(temp_output),
+            ])
+            outputs.append((index, plan, duration, temp_output))
+
+        cmd.extend(["-filter_complex", ";".join(filter_parts)])
+        cmd.extend(output_args)
+
+        process = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+        results: List[RenderResult] = []
+        for index, plan, duration, temp_output in outputs:
+            subtitle_file = plan.get("subtitle")
+            if process.returncode != 0:
+                results.append(RenderResult(
+                    index,
+                    str(plan["audio"]),
+                    str(plan["image"]),
+                    str(subtitle_file) if subtitle_file else None,
+                    str(temp_output),
+                    duration,
+                    False,
+                    process.stderr.strip() or "FFmpeg render failed",
+                ))
+                continue
+            output_path = output_dir / temp_output.name
+            shutil.move(str(temp_output), str(output_path))
+            results.append(RenderResult(
+                index,
+                str(plan["audio"]),
+                str(plan["image"]),
+                str(subtitle_file) if subtitle_file else None,
+                str(output_path),
+                duration,
+                True,
+            ))
+        return results
+
+    @staticmethod
+    def _estimate_scene_cost(plan: Dict[str, Path]) -> int:
+        """Cheap render-time proxy: the size of the scene's audio file."""
+        try:
+            return plan["audio"].stat().st_size
+        except OSError:
+            return 0
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    def _list_files(self, directory: Path) -> List[Path]:
+        """Regular files in ``directory``, cached until the directory changes.
+
+        Adding, removing or renaming an entry bumps the directory's mtime, so
+        a single ``stat`` decides whether the cached listing is still valid.
+        """
+        mtime = directory.stat().st_mtime_ns
+        with self._listing_lock:
+            cached = self._listing_cache.get(directory)
+        if cached and cached[0] == mtime:
+            return list(cached[1])
+
+        # scandir reports the entry type from the directory read itself,
+        # so there is no extra stat per file.
+        with os.scandir(directory) as entries:
+            files = [Path(entry.path) for entry in entries if entry.is_file()]
+        with self._listing_lock:
+            self._listing_cache[directory] = (mtime, files)
+        return list(files)
+
     def _find_audio_files(self, directory: Path) -> List[Path]:
         return [
             path
-            for path in directory.iterdir()
-            if path.is_file() and path.suffix.lower() in {".wav", ".mp3", ".m4a", ".aac", ".flac", ".ogg"}
+            for path in self._list_files(directory)
+            if path.suffix.lower() in {".wav", ".mp3", ".m4a", ".aac", ".flac", ".ogg"}
         ]
 
     def _find_image_files(self, directory: Path) -> List[Path]:
         return [
             path
-            for path in directory.iterdir()
-            if path.is_file() and path.suffix.lower() in {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".gif", ".webp"}
+            for path in self._list_files(directory)
+            if path.suffix.lower() in {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".gif", ".webp"}
         ]
 
     def _build_segment_plan(
@@ -322,9 +801,10 @@ class VideoComposer:
 
     def _build_subtitle_lookup(self, subtitle_dir: Optional[Path]) -> Dict[str, Path]:
         lookup: Dict[str, Path] = {}
-        if subtitle_dir and subtitle_dir.exists():
-            for path in subtitle_dir.glob("*.srt"):
-                lookup[path.stem.lower()] = path
+        if subtitle_dir and subtitle_dir.is_dir():
+            for path in self._list_files(subtitle_dir):
+                if path.suffix == ".srt":
+                    lookup[path.stem.lower()] = path
         return lookup
 
     def _build_plan_sync_images(
@@ -467,6 +947,7 @@ class VideoComposer:
         cmd = [
             "ffmpeg",
             "-y",
+            *FFMPEG_QUIET_ARGS,
             "-f",
             "concat",
             "-safe",
@@ -486,6 +967,7 @@ class VideoComposer:
         cmd = [
             "ffmpeg",
             "-y",
+            *FFMPEG_QUIET_ARGS,
             "-ss",
             f"{max(start, 0.0):.6f}",
             "-t",
@@ -670,7 +1152,11 @@ class VideoComposer:
         output_dir: Path,
         temp_dir: Path,
         options: RenderOptions,
+        tee: Optional[TeeMuxer] = None,
     ) -> RenderResult:
+        # Checked per scene: once the muxer has exited, scenes take the
+        # plain path and the combined video falls back to concat.
+        tee_fifo = tee.target(index) if tee else None
         duration = self._probe_duration(audio_file)
         if duration <= 0:
             return RenderResult(index, str(audio_file), str(image_file), str(subtitle_file) if subtitle_file else None, "", 0.0, False, "Không xác định được thời lượng audio")
@@ -678,15 +1164,20 @@ class VideoComposer:
         output_path = output_dir / f"clip_{index:03d}.mp4"
         temp_output = temp_dir / f"clip_{index:03d}.mp4"
 
+        queue_size = str(options.thread_queue_size)
         cmd: List[str] = [
             "ffmpeg",
             "-y",
-            "-loop",
-            "1",
+            *FFMPEG_QUIET_ARGS,
+            *self._filter_thread_args(options),
+            "-thread_queue_size",
+            queue_size,
             "-framerate",
             f"{options.frame_rate}",
             "-i",
             str(image_file),  # Input 0: image
+            "-thread_queue_size",
+            queue_size,
             "-i",
             str(audio_file),  # Input 1: audio
         ]
@@ -725,76 +1216,23 @@ class VideoComposer:
             f"{options.frame_rate}",
         ])
 
-        video_steps = self._video_filter_steps(
-            options=options,
-            duration=duration,
-            frame_rate=options.frame_rate,
-            resolution=options.resolution,
-        )
-        audio_chain = self._audio_filter_chain(options)
-
         # Determine what complex processing we need
         has_logo = logo_input_index is not None
         has_background_music = music_input_index is not None
         needs_complex_filter = has_logo or has_background_music or (options.burn_subtitles and subtitle_file)
 
         if needs_complex_filter:
-            # Build complex filter with better error handling and debugging
-            filter_parts = []
-
-            # Start with base animation + filter chain for video
-            base_chain = ",".join(step for step in video_steps if step)
-            video_label_index = 0
-            filter_parts.append(f"[0:v]{base_chain}[v{video_label_index}]")
-            video_stream = f"[v{video_label_index}]"
-
-            # Add logo overlay if enabled
-            if has_logo:
-                # First add logo preprocessing filters if needed
-                logo_preprocessing = self._build_logo_preprocessing(options, logo_input_index)
-                overlay_source = f"[{logo_input_index}:v]"
-                if logo_preprocessing:
-                    filter_parts.append(f"[{logo_input_index}:v]{logo_preprocessing}[logo_pre]")
-                    overlay_source = "[logo_pre]"
-
-                video_label_index += 1
-                next_video_stream = f"[v{video_label_index}]"
-                filter_parts.append(
-                    f"{video_stream}{overlay_source}overlay={options.logo_x}:{options.logo_y}{next_video_stream}"
-                )
-                video_stream = next_video_stream
-
-            # Add subtitle filter if burning subtitles
-            if options.burn_subtitles and subtitle_file:
-                subtitle_filter = self._build_subtitle_filter(subtitle_file, options.subtitle_style)
-                video_label_index += 1
-                next_video_stream = f"[v{video_label_index}]"
-                filter_parts.append(f"{video_stream}{subtitle_filter}{next_video_stream}")
-                video_stream = next_video_stream
-
-            # Ensure consistent pixel format at the end
-            video_label_index += 1
-            final_video_stream = f"[v{video_label_index}]"
-            filter_parts.append(f"{video_stream}format=yuv420p{final_video_stream}")
-            video_stream = final_video_stream
-
-            # Handle audio mixing
-            audio_stream = "1:a"  # Default to original audio input (stream spec)
-            audio_label_index = 0
-            if has_background_music:
-                music_duration = self._probe_duration(background_music_file)
-                audio_mix_filter = self._build_audio_mix_filter_corrected(music_input_index, duration, music_duration)
-                if audio_mix_filter:
-                    filter_parts.append(audio_mix_filter)
-                    audio_stream = "[aout]"
-
-            if audio_chain:
-                for expression in audio_chain:
-                    audio_label_index += 1
-                    target_label = f"[a{audio_label_index}]"
-                    source_label = audio_stream if audio_stream.startswith("[") else f"[{audio_stream}]"
-                    filter_parts.append(f"{source_label}{expression}{target_label}")
-                    audio_stream = target_label
+            music_duration = self._probe_duration(background_music_file) if has_background_music else 0.0
+            filter_parts, video_stream, audio_stream = self._scene_filter_graph(
+                options=options,
+                duration=duration,
+                image_input=0,
+                audio_input=1,
+                subtitle_file=subtitle_file,
+                logo_input=logo_input_index,
+                music_input=music_input_index,
+                music_duration=music_duration,
+            )
 
             # Combine all filters and add debug output
             complex_filter = ";".join(filter_parts)
@@ -804,18 +1242,16 @@ class VideoComposer:
             print(f"DEBUG: Video stream: {video_stream}, Audio stream: {audio_stream}")
             
             cmd.extend(["-filter_complex", complex_filter])
-            # Use proper mapping format
-            if video_stream.startswith("["):
-                cmd.extend(["-map", video_stream])
-            else:
-                cmd.extend(["-map", f"[{video_stream}]"])
-            
-            if audio_stream.startswith("["):
-                cmd.extend(["-map", audio_stream])
-            else:
-                cmd.extend(["-map", audio_stream])
+            cmd.extend(["-map", video_stream, "-map", audio_stream])
         else:
             # Simple processing - no complex filter needed
+            video_steps = self._video_filter_steps(
+                options=options,
+                duration=duration,
+                frame_rate=options.frame_rate,
+                resolution=options.resolution,
+            )
+            audio_chain = self._audio_filter_chain(options)
             vf_parts = list(video_steps) + ["format=yuv420p"]
             video_filter = ",".join(part for part in vf_parts if part)
             cmd.extend(["-vf", video_filter])
@@ -825,6 +1261,7 @@ class VideoComposer:
             cmd.extend(["-map", "0:v:0", "-map", "1:a:0"])
 
         cmd.extend(self._video_encoder_args(options))
+        cmd.extend(["-threads", str(max(options.ffmpeg_threads, 0))])
         cmd.extend(["-c:a", "aac", "-b:a", options.audio_bitrate])
 
         # Add subtitle stream if not burning
@@ -832,9 +1269,25 @@ class VideoComposer:
             cmd.extend(["-c:s", "mov_text"])
             cmd.extend(["-map", f"{input_sub_index}:0"])
 
-        cmd.extend(["-shortest", "-movflags", "+faststart", str(temp_output)])
+        cmd.append("-shortest")
+        if tee_fifo is not None:
+            # One encode, two outputs: the clip file and the combined muxer's
+            # pipe. A dead muxer must not cost us the clip itself.
+            cmd.extend([
+                "-flags",
+                "+global_header",
+                "-f",
+                "tee",
+                f"[f=mp4:movflags=+faststart]{temp_output.as_posix()}"
+                f"|[f=nut:onfail=ignore]{tee_fifo.as_posix()}",
+            ])
+        else:
+            cmd.extend(["-movflags", "+faststart", str(temp_output)])
 
-        process = subprocess.run(cmd, capture_output=True, text=True)
+        if tee_fifo is not None:
+            process = self._run_teed_encode(cmd, tee, tee_fifo)
+        else:
+            process = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL)
         if process.returncode != 0:
             return RenderResult(
                 index,
@@ -858,80 +1311,625 @@ class VideoComposer:
             True,
         )
 
+    def _scene_filter_graph(
+        self,
+        options: RenderOptions,
+        duration: float,
+        image_input: int,
+        audio_input: int,
+        subtitle_file: Optional[Path] = None,
+        logo_input: Optional[int] = None,
+        music_input: Optional[int] = None,
+        music_duration: float = 0.0,
+        prefix: str = "",
+    ) -> Tuple[List[str], str, str]:
+        """Build the filter_complex chains for one scene.
+
+        Returns the chains plus the final video and audio stream specifiers.
+        Labels are namespaced with ``prefix`` so several scenes can share a
+        single graph; the audio specifier is a bare ``N:a`` when no audio
+        filter touches it.
+        """
+        filter_parts: List[str] = []
+
+        # Start with base animation + filter chain for video
+        video_steps = self._video_filter_steps(
+            options=options,
+            duration=duration,
+            frame_rate=options.frame_rate,
+            resolution=options.resolution,
+        )
+        base_chain = ",".join(step for step in video_steps if step)
+        video_label_index = 0
+        filter_parts.append(f"[{image_input}:v]{base_chain}[{prefix}v{video_label_index}]")
+        video_stream = f"[{prefix}v{video_label_index}]"
+
+        # Add logo overlay if enabled
+        if logo_input is not None:
+            # First add logo preprocessing filters if needed
+            logo_preprocessing = self._build_logo_preprocessing(options, logo_input)
+            overlay_source = f"[{logo_input}:v]"
+            if logo_preprocessing:
+                filter_parts.append(f"[{logo_input}:v]{logo_preprocessing}[{prefix}logo_pre]")
+                overlay_source = f"[{prefix}logo_pre]"
+
+            video_label_index += 1
+            next_video_stream = f"[{prefix}v{video_label_index}]"
+            filter_parts.append(
+                f"{video_stream}{overlay_source}overlay={options.logo_x}:{options.logo_y}{next_video_stream}"
+            )
+            video_stream = next_video_stream
+
+        # Add subtitle filter if burning subtitles
+        if options.burn_subtitles and subtitle_file:
+            subtitle_filter = self._build_subtitle_filter(subtitle_file, options.subtitle_style)
+            video_label_index += 1
+            next_video_stream = f"[{prefix}v{video_label_index}]"
+            filter_parts.append(f"{video_stream}{subtitle_filter}{next_video_stream}")
+            video_stream = next_video_stream
+
+        # Ensure consistent pixel format at the end
+        video_label_index += 1
+        final_video_stream = f"[{prefix}v{video_label_index}]"
+        filter_parts.append(f"{video_stream}format=yuv420p{final_video_stream}")
+        video_stream = final_video_stream
+
+        # Handle audio mixing
+        audio_stream = f"{audio_input}:a"  # Default to original audio input (stream spec)
+        audio_label_index = 0
+        if music_input is not None:
+            audio_mix_filter = self._build_audio_mix_filter_corrected(
+                music_input, duration, music_duration, audio_input=audio_input, prefix=prefix
+            )
+            if audio_mix_filter:
+                filter_parts.append(audio_mix_filter)
+                audio_stream = f"[{prefix}aout]"
+
+        for expression in self._audio_filter_chain(options):
+            audio_label_index += 1
+            target_label = f"[{prefix}a{audio_label_index}]"
+            source_label = audio_stream if audio_stream.startswith("[") else f"[{audio_stream}]"
+            filter_parts.append(f"{source_label}{expression}{target_label}")
+            audio_stream = target_label
+
+        return filter_parts, video_stream, audio_stream
+
+    def _can_render_single_pass(
+        self,
+        segment_plan: List[Dict[str, Path]],
+        options: RenderOptions,
+        create_individual: bool,
+        create_combined: bool,
+    ) -> bool:
+        """Whether one FFmpeg run can produce everything that was asked for."""
+        if not create_combined or options.keep_intermediate:
+            return False
+        if len(segment_plan) > SINGLE_PASS_MAX_SCENES:
+            return False
+        # Soft subtitle tracks cannot be joined by the concat filter.
+        if not options.burn_subtitles and any(plan.get("subtitle") for plan in segment_plan):
+            return False
+        if create_individual:
+            # The clips would be split off the same graph and encoded a
+            # second time. That only pays when the combined video has to be
+            # re-encoded for its transitions anyway; a plain concat joins the
+            # finished clips by stream copy.
+            # Every clip plus the complete video holds its own encoder.
+            if self._uses_nvenc(options) and len(segment_plan) + 1 > NVENC_MAX_SESSIONS:
+                return False
+            durations = [self._probe_duration(plan["audio"]) for plan in segment_plan]
+            return self._transition_applies(options, durations)
+        return True
+
+    def _transition_applies(self, options: RenderOptions, durations: List[float]) -> bool:
+        """Whether the combined video joins its scenes with an xfade chain."""
+        transition_duration = float(options.transition.duration)
+        return bool(
+            self._map_transition_name(options.transition.type)
+            and len(durations) > 1
+            and transition_duration > 0
+            and min(durations) > transition_duration
+        )
+
+    def _can_tee_combined(
+        self,
+        segment_plan: List[Dict[str, Path]],
+        options: RenderOptions,
+        create_individual: bool,
+        create_combined: bool,
+    ) -> bool:
+        """Whether scene encodes can feed the combined muxer directly."""
+        if not (options.tee_output and create_individual and create_combined):
+            return False
+        if not hasattr(os, "mkfifo"):
+            return False
+        # The muxer reads the pipes strictly in order.
+        if options.max_parallel_scenes > 1:
+            return False
+        if not options.burn_subtitles and any(plan.get("subtitle") for plan in segment_plan):
+            return False
+        # The concat muxer can only cut; transitions need the clips re-read.
+        durations = [self._probe_duration(plan["audio"]) for plan in segment_plan]
+        return not self._transition_applies(options, durations)
+
+    def _start_tee_muxer(self, scene_count: int, temp_dir: Path, options: RenderOptions) -> TeeMuxer:
+        fifos = [temp_dir / f"pipe_{index:03d}.nut" for index in range(1, scene_count + 1)]
+        list_file = temp_dir / "tee_concat.txt"
+        with list_file.open("w", encoding="utf-8") as handle:
+            for fifo in fifos:
+                os.mkfifo(fifo)
+                handle.write(f"file '{fifo.as_posix()}'\n")
+
+        output_path = temp_dir / f"tee_{options.combined_filename or 'complete_video.mp4'}"
+        log_path = temp_dir / "tee_muxer.log"
+        cmd = [
+            "ffmpeg",
+            "-y",
+            *FFMPEG_QUIET_ARGS,
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(list_file),
+            "-c",
+            "copy",
+            "-movflags",
+            "+faststart",
+            str(output_path),
+        ]
+        with log_path.open("w", encoding="utf-8") as log_handle:
+            process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=log_handle)
+        return TeeMuxer(process, fifos, output_path, log_path)
+
+    def _run_teed_encode(self, cmd: List[str], tee: TeeMuxer, fifo: Path) -> subprocess.CompletedProcess:
+        """Run a teed scene encode, releasing its pipe if the muxer dies."""
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        while True:
+            try:
+                stdout, stderr = process.communicate(timeout=TEE_POLL_SECONDS)
+                break
+            except subprocess.TimeoutExpired:
+                # The encoder may not have reached its open() yet, so keep
+                # releasing for as long as it runs without a muxer.
+                if tee.process.poll() is not None:
+                    tee.release(fifo)
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+    def _finish_tee_muxer(
+        self,
+        tee: TeeMuxer,
+        scene_count: int,
+        output_dir: Path,
+        durations: List[float],
+        options: RenderOptions,
+    ) -> Optional[RenderResult]:
+        """Wait for the teed combined video; ``None`` means fall back to concat."""
+        if scene_count != len(tee.fifos) or tee.process.poll() not in (None, 0):
+            tee.abort()
+            return None
+        try:
+            returncode = tee.process.wait(timeout=TEE_MUXER_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            tee.abort()
+            return None
+        if returncode != 0 or not tee.output_path.exists():
+            return None
+        combined_path = output_dir / (options.combined_filename or "complete_video.mp4")
+        shutil.move(str(tee.output_path), str(combined_path))
+        return RenderResult(0, "", "", None, str(combined_path), sum(durations), True)
+
+    def _render_combined_single_pass(
+        self,
+        segment_plan: List[Dict[str, Path]],
+        output_dir: Path,
+        temp_dir: Path,
+        options: RenderOptions,
+        on_progress: Optional[Callable[[float], None]] = None,
+        clip_results: Optional[List[RenderResult]] = None,
+    ) -> RenderResult:
+        """Encode every scene straight into the final video with one FFmpeg run.
+
+        Each scene keeps its own filter chain; the chains meet in a concat
+        filter (or an xfade chain when a transition is set), so no
+        intermediate clip is written or re-read. When ``clip_results`` is
+        given, each scene is also split off to its own clip file from the
+        same graph and the clips' results are appended to it.
+        """
+        combined_path = output_dir / (options.combined_filename or "complete_video.mp4")
+        temp_output = temp_dir / combined_path.name
+        queue_size = str(options.thread_queue_size)
+
+        logo_file: Optional[str] = None
+        if options.logo_enabled and options.logo_file and Path(options.logo_file).exists():
+            logo_file = str(options.logo_file)
+
+        cmd: List[str] = ["ffmpeg", "-y", *FFMPEG_QUIET_ARGS, *self._filter_thread_args(options)]
+        filter_parts: List[str] = []
+        video_segments: List[str] = []
+        audio_segments: List[str] = []
+        durations: List[float] = []
+        clip_args: List[str] = []
+        clips: List[Tuple[int, Dict[str, Path], float, Path]] = []
+        input_index = 0
+
+        for scene, plan in enumerate(segment_plan):
+            duration = self._probe_duration(plan["audio"])
+            if duration <= 0:
+                raise VideoComposerError(f"Không xác định được thời lượng audio: {plan['audio'].name}")
+
+            image_input = input_index
+            audio_input = input_index + 1
+            cmd.extend([
+                "-thread_queue_size", queue_size,
+                "-framerate", f"{options.frame_rate}",
+                "-i", str(plan["image"]),
+                "-thread_queue_size", queue_size,
+                "-i", str(plan["audio"]),
+            ])
+            input_index += 2
+
+            logo_input = None
+            if logo_file:
+                cmd.extend(["-i", logo_file])
+                logo_input = input_index
+                input_index += 1
+
+            music_input = None
+            music_duration = 0.0
+            if options.background_music_directory:
+                music_file = self._get_background_music(options.background_music_directory, duration)
+                if music_file:
+                    cmd.extend(["-i", str(music_file)])
+                    music_input = input_index
+                    input_index += 1
+                    music_duration = self._probe_duration(music_file)
+
+            prefix = f"s{scene}_"
+            parts, video_stream, audio_stream = self._scene_filter_graph(
+                options=options,
+                duration=duration,
+                image_input=image_input,
+                audio_input=audio_input,
+                subtitle_file=plan.get("subtitle"),
+                logo_input=logo_input,
+                music_input=music_input,
+                music_duration=music_duration,
+                prefix=prefix,
+            )
+            filter_parts.extend(parts)
+
+            # Trim both streams to the scene length and normalise the audio
+            # format so the concat filter sees identical segments.
+            video_chain = (
+                f"{video_stream}trim=duration={duration:.4f},setpts=PTS-STARTPTS,"
+                f"fps={options.frame_rate},settb=AVTB"
+            )
+            audio_source = audio_stream if audio_stream.startswith("[") else f"[{audio_stream}]"
+            audio_chain = (
+                f"{audio_source}atrim=duration={duration:.4f},asetpts=PTS-STARTPTS,"
+                f"aresample=48000,aformat=sample_fmts=fltp:channel_layouts=stereo"
+            )
+            if clip_results is None:
+                filter_parts.append(f"{video_chain}[{prefix}vseg]")
+                filter_parts.append(f"{audio_chain}[{prefix}aseg]")
+            else:
+                filter_parts.append(f"{video_chain},split=2[{prefix}vseg][{prefix}vclip]")
+                filter_parts.append(f"{audio_chain},asplit=2[{prefix}aseg][{prefix}aclip]")
+                clip_output = temp_dir / f"clip_{scene + 1:03d}.mp4"
+                clip_args.extend(["-map", f"[{prefix}vclip]", "-map", f"[{prefix}aclip]"])
+                clip_args.extend(["-r", f"{options.frame_rate}"])
+                clip_args.extend(self._video_encoder_args(options))
+                clip_args.extend(["-threads", str(max(options.ffmpeg_threads, 0))])
+                clip_args.extend(["-c:a", "aac", "-b:a", options.audio_bitrate])
+                clip_args.extend(["-movflags", "+faststart", str(clip_output)])
+                clips.append((scene + 1, plan, duration, clip_output))
+            video_segments.append(f"[{prefix}vseg]")
+            audio_segments.append(f"[{prefix}aseg]")
+            durations.append(duration)
+
+        transition = self._map_transition_name(options.transition.type)
+        transition_duration = float(options.transition.duration)
+        if self._transition_applies(options, durations):
+            use_opencl = (
+                options.use_hardware_acceleration
+                and transition in OPENCL_XFADE_TRANSITIONS
+                and self._opencl_xfade_available()
+            )
+            expression, video_out, audio_out, total_duration = self._build_transition_filter(
+                video_segments, audio_segments, durations, transition, transition_duration, use_opencl
+            )
+            filter_parts.append(expression)
+            if use_opencl:
+                cmd[1:1] = ["-init_hw_device", "opencl=ocl", "-filter_hw_device", "ocl"]
+        else:
+            interleaved = "".join(v + a for v, a in zip(video_segments, audio_segments))
+            filter_parts.append(f"{interleaved}concat=n={len(durations)}:v=1:a=1[vout][aout]")
+            video_out, audio_out, total_duration = "[vout]", "[aout]", sum(durations)
+
+        cmd.extend(["-filter_complex", ";".join(filter_parts), "-map", video_out, "-map", audio_out])
+        cmd.extend(["-r", f"{options.frame_rate}"])
+        cmd.extend(self._video_encoder_args(options))
+        cmd.extend(["-threads", str(max(options.ffmpeg_threads, 0))])
+        cmd.extend(["-c:a", "aac", "-b:a", options.audio_bitrate])
+        cmd.extend(["-movflags", "+faststart", str(temp_output)])
+        cmd.extend(clip_args)
+
+        process = self._run_ffmpeg(cmd, total_duration, on_progress)
+        if process.returncode != 0:
+            raise VideoComposerError(process.stderr.strip() or "Dựng video hoàn chỉnh thất bại")
+
+        shutil.move(str(temp_output), str(combined_path))
+        for index, plan, duration, clip_output in clips:
+            output_path = output_dir / clip_output.name
+            shutil.move(str(clip_output), str(output_path))
+            subtitle_file = plan.get("subtitle")
+            clip_results.append(RenderResult(
+                index,
+                str(plan["audio"]),
+                str(plan["image"]),
+                str(subtitle_file) if subtitle_file else None,
+                str(output_path),
+                duration,
+                True,
+            ))
+        return RenderResult(0, "", "", None, str(combined_path), total_duration, True)
+
+    def _run_ffmpeg(
+        self,
+        cmd: List[str],
+        total_duration: float,
+        on_progress: Optional[Callable[[float], None]] = None,
+    ) -> subprocess.CompletedProcess:
+        """Run FFmpeg, reporting how far the encode has got via ``on_progress``.
+
+        ``-progress pipe:1`` streams key=value blocks on stdout while the
+        encode runs; stderr goes to a temporary file so neither pipe can
+        fill up and stall the child while the other is being read.
+        """
+        if on_progress is None or total_duration <= 0:
+            return subprocess.run(cmd, capture_output=True, text=True)
+
+        progress_cmd = [cmd[0], "-progress", "pipe:1", *cmd[1:]]
+        with tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace") as error_log:
+            process = subprocess.Popen(
+                progress_cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=error_log,
+                text=True,
+            )
+            for line in process.stdout:
+                key, _, value = line.partition("=")
+                if key != "out_time_us":
+                    continue
+                try:
+                    position = int(value) / 1_000_000
+                except ValueError:  # "N/A" before the first frame
+                    continue
+                on_progress(min(max(position / total_duration, 0.0), 1.0))
+            returncode = process.wait()
+            error_log.seek(0)
+            stderr = error_log.read()
+        return subprocess.CompletedProcess(progress_cmd, returncode, "", stderr)
+
     def _render_combined(
         self,
         clips: List[Path],
         durations: List[float],
         output_dir: Path,
         options: RenderOptions,
+        keep_subtitles: bool = False,
     ) -> RenderResult:
+        """Join finished scene clips into the combined video.
+
+        The clips already carry their background music, logo and burned
+        subtitles, so only the join itself is left. A transition re-encodes
+        through an xfade chain; otherwise, or when ``keep_subtitles`` asks
+        for the clips' soft subtitle tracks, they are concatenated.
+        """
         if not clips:
             raise VideoComposerError("Không có clip để ghép.")
 
         combined_path = output_dir / (options.combined_filename or "complete_video.mp4")
-        
-        # For combined video, we should NOT add background music again 
-        # because individual clips already have it mixed in
-        # We simply concatenate the pre-rendered clips
-        
-        # Always use simple concatenation for combined video to avoid complex filter issues
-        return self._combine_without_transition(clips, durations, combined_path)
+        if not keep_subtitles and self._transition_applies(options, durations):
+            return self._combine_with_transition(clips, durations, combined_path, options)
+        return self._combine_without_transition(clips, durations, combined_path, options)
+
+    def _combine_with_transition(
+        self,
+        clips: List[Path],
+        durations: List[float],
+        output_path: Path,
+        options: RenderOptions,
+    ) -> RenderResult:
+        """Join clips with the selected xfade transition.
+
+        At most ``SINGLE_PASS_MAX_SCENES`` clips go into one FFmpeg run.
+        Longer lists are joined group by group into intermediate clips,
+        which are then joined the same way, with the transition between
+        groups as well.
+        """
+        pending = list(zip(clips, durations))
+        group_size = max(2, SINGLE_PASS_MAX_SCENES)
+        with tempfile.TemporaryDirectory(prefix="xfade_", dir=output_path.parent) as work_dir:
+            level = 0
+            while True:
+                groups = [
+                    pending[start:start + group_size]
+                    for start in range(0, len(pending), group_size)
+                ]
+                if len(groups) == 1:
+                    total_duration = self._xfade_clips(groups[0], output_path, options)
+                    break
+                joined: List[Tuple[Path, float]] = []
+                for number, group in enumerate(groups, start=1):
+                    if len(group) == 1:
+                        joined.append(group[0])
+                        continue
+                    target = Path(work_dir) / f"level{level}_{number:03d}.mp4"
+                    joined.append((target, self._xfade_clips(group, target, options)))
+                pending = joined
+                level += 1
+        return RenderResult(0, "", "", None, str(output_path), total_duration, True)
+
+    def _xfade_clips(
+        self,
+        clips: List[Tuple[Path, float]],
+        output_path: Path,
+        options: RenderOptions,
+    ) -> float:
+        """Encode ``clips`` into ``output_path`` through one xfade chain."""
+        transition = self._map_transition_name(options.transition.type)
+        transition_duration = float(options.transition.duration)
+        use_opencl = (
+            options.use_hardware_acceleration
+            and transition in OPENCL_XFADE_TRANSITIONS
+            and self._opencl_xfade_available()
+        )
+
+        cmd: List[str] = ["ffmpeg", "-y", *FFMPEG_QUIET_ARGS, *self._filter_thread_args(options)]
+        if use_opencl:
+            cmd.extend(["-init_hw_device", "opencl=ocl", "-filter_hw_device", "ocl"])
+        filter_parts: List[str] = []
+        video_inputs: List[str] = []
+        audio_inputs: List[str] = []
+        for index, (clip, _) in enumerate(clips):
+            cmd.extend(["-i", str(clip)])
+            # xfade needs matching timebases and frame rates on both sides.
+            filter_parts.append(f"[{index}:v]settb=AVTB,fps={options.frame_rate},format=yuv420p[cv{index}]")
+            filter_parts.append(
+                f"[{index}:a]aresample=48000,aformat=sample_fmts=fltp:channel_layouts=stereo[ca{index}]"
+            )
+            video_inputs.append(f"[cv{index}]")
+            audio_inputs.append(f"[ca{index}]")
+
+        expression, video_out, audio_out, total_duration = self._build_transition_filter(
+            video_inputs,
+            audio_inputs,
+            [duration for _, duration in clips],
+            transition,
+            transition_duration,
+            use_opencl,
+        )
+        if expression:
+            filter_parts.append(expression)
+
+        cmd.extend(["-filter_complex", ";".join(filter_parts), "-map", video_out, "-map", audio_out])
+        cmd.extend(["-r", f"{options.frame_rate}"])
+        cmd.extend(self._video_encoder_args(options))
+        cmd.extend(["-threads", str(max(options.ffmpeg_threads, 0))])
+        cmd.extend(["-c:a", "aac", "-b:a", options.audio_bitrate])
+        cmd.extend(["-movflags", "+faststart", str(output_path)])
+
+        process = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+        if process.returncode != 0:
+            raise VideoComposerError(process.stderr.strip() or "Ghép video thất bại")
+        return total_duration
 
     def _combine_without_transition(
         self,
         clips: List[Path],
         durations: List[float],
         output_path: Path,
+        options: Optional[RenderOptions] = None,
     ) -> RenderResult:
         concat_file = output_path.with_suffix(".txt")
         with concat_file.open("w", encoding="utf-8") as handle:
             for clip in clips:
                 handle.write(f"file '{clip.as_posix()}'\n")
 
-        cmd = [
+        base_cmd = [
             "ffmpeg",
             "-y",
+            *FFMPEG_QUIET_ARGS,
             "-f",
             "concat",
             "-safe",
             "0",
             "-i",
             str(concat_file),
-            "-c",
-            "copy",
-            str(output_path),
         ]
-        process = subprocess.run(cmd, capture_output=True, text=True)
-        concat_file.unlink(missing_ok=True)
-        if process.returncode != 0:
-            raise VideoComposerError(process.stderr.strip() or "Ghép video thất bại")
+        errors: List[str] = []
+        try:
+            # Cheapest first: clips rendered with the same options normally
+            # share codec parameters, so a plain remux is enough.
+            for codec_args in self._concat_codec_ladder(options):
+                process = subprocess.run(
+                    base_cmd + codec_args + [str(output_path)], capture_output=True, text=True
+                )
+                if process.returncode == 0:
+                    break
+                errors.append(process.stderr.strip())
+            else:
+                raise VideoComposerError(errors[-1] if errors and errors[-1] else "Ghép video thất bại")
+        finally:
+            concat_file.unlink(missing_ok=True)
 
         total_duration = sum(durations)
         return RenderResult(0, "", "", None, str(output_path), total_duration, True)
 
+    def _concat_codec_ladder(self, options: Optional[RenderOptions]) -> List[List[str]]:
+        """Codec arguments to try, in order, when joining clips."""
+        audio_bitrate = options.audio_bitrate if options else "192k"
+        ladder = [
+            ["-c", "copy"],
+            ["-c:v", "copy", "-c:a", "flac"],
+            ["-c:v", "copy", "-c:a", "aac", "-b:a", audio_bitrate],
+        ]
+        if options is not None:
+            ladder.append(
+                self._video_encoder_args(options)
+                + ["-c:a", "aac", "-b:a", audio_bitrate, "-movflags", "+faststart"]
+            )
+        return ladder
+
     def _build_transition_filter(
         self,
-        count: int,
+        video_inputs: List[str],
+        audio_inputs: List[str],
         durations: List[float],
         transition: str,
         transition_duration: float,
+        use_opencl: bool = False,
     ) -> Tuple[str, str, str, float]:
-        video_label = "[0:v]"
-        audio_label = "[0:a]"
+        """Chain ``xfade``/``acrossfade`` across the given segment labels.
+
+        With ``use_opencl`` each segment is uploaded once and blended with
+        ``xfade_opencl``, so the frames stay on the GPU between transitions;
+        the command must then set up an ``ocl`` filter device.
+        """
         filter_parts: List[str] = []
+        xfade = "xfade"
+        if use_opencl:
+            xfade = "xfade_opencl"
+            uploaded = []
+            for idx, label in enumerate(video_inputs):
+                filter_parts.append(f"{label}hwupload[xu{idx}]")
+                uploaded.append(f"[xu{idx}]")
+            video_inputs = uploaded
+
+        video_label = video_inputs[0]
+        audio_label = audio_inputs[0]
         current_duration = durations[0]
 
-        for idx in range(1, count):
+        for idx in range(1, len(video_inputs)):
             v_in = video_label
             a_in = audio_label
-            next_v = f"[{idx}:v]"
-            next_a = f"[{idx}:a]"
-            v_out = f"[v{idx}]"
-            a_out = f"[a{idx}]"
+            next_v = video_inputs[idx]
+            next_a = audio_inputs[idx]
+            v_out = f"[xv{idx}]"
+            a_out = f"[xa{idx}]"
 
             offset = max(current_duration - transition_duration, 0.0)
             filter_parts.append(
-                f"{v_in}{next_v}xfade=transition={transition}:duration={transition_duration:.4f}:offset={offset:.4f}{v_out}"
+                f"{v_in}{next_v}{xfade}=transition={transition}:duration={transition_duration:.4f}:offset={offset:.4f}{v_out}"
             )
             filter_parts.append(
                 f"{a_in}{next_a}acrossfade=d={transition_duration:.4f}{a_out}"
@@ -940,10 +1938,45 @@ class VideoComposer:
             audio_label = a_out
             current_duration = current_duration + durations[idx] - transition_duration
 
+        if use_opencl:
+            filter_parts.append(f"{video_label}hwdownload,format=yuv420p[xvout]")
+            video_label = "[xvout]"
+
         filter_expression = ";".join(filter_parts)
         return filter_expression, video_label, audio_label, max(current_duration, 0.0)
 
+    def _prefetch_durations(self, files: Iterable[Path]) -> None:
+        """Probe ``files`` concurrently so later stages find them cached.
+
+        Each probe is a short-lived ffprobe process that mostly waits on I/O,
+        so running them side by side up front replaces a serial probe per
+        scene in front of every encode.
+        """
+        pending = list(dict.fromkeys(files))
+        if len(pending) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(pending)), thread_name_prefix="probe") as pool:
+            list(pool.map(self._probe_duration, pending))
+
     def _probe_duration(self, audio_file: Path) -> float:
+        try:
+            stat = audio_file.stat()
+        except OSError:
+            return 0.0
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._duration_lock:
+            cached = self._duration_cache.get(audio_file)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        duration = self._run_ffprobe_duration(audio_file)
+        if duration > 0:
+            with self._duration_lock:
+                self._duration_cache[audio_file] = (version, duration)
+        return duration
+
+    @staticmethod
+    def _run_ffprobe_duration(audio_file: Path) -> float:
         cmd = [
             "ffprobe",
             "-v",
@@ -996,22 +2029,39 @@ class VideoComposer:
                 f"{base},zoompan=z={zoom_expr}:x={x_expr}:y={y_expr}:d={frames}:s={width}x{height}:fps={frame_rate},setsar=1"
             )
         if anim_type in {"pan_left", "pan_right", "pan_up", "pan_down"}:
-            divisor = max(frames - 1, 1)
-            x_expr = "'0'"
-            y_expr = "'0'"
+            # Scale the still once to an oversized frame, repeat it in memory
+            # and move a crop window across it; per-frame work is a plain
+            # crop instead of zoompan's rescale of every output frame.
+            margin = {"subtle": 1.05, "medium": 1.1, "strong": 1.15}.get(intensity, 1.1)
+            pan_width = int(math.ceil(width * margin / 2)) * 2
+            pan_height = int(math.ceil(height * margin / 2)) * 2
+            progress = f"min(t/{max(duration, 0.001):.3f},1)"
+            x_expr = "0"
+            y_expr = "0"
             if anim_type == "pan_left":
-                x_expr = f"'(iw-ow)*on/{divisor}'"
+                x_expr = f"(iw-ow)*{progress}"
             elif anim_type == "pan_right":
-                x_expr = f"'(iw-ow)*(1-on/{divisor})'"
+                x_expr = f"(iw-ow)*(1-{progress})"
             elif anim_type == "pan_up":
-                y_expr = f"'(ih-oh)*(1-on/{divisor})'"
+                y_expr = f"(ih-oh)*(1-{progress})"
             elif anim_type == "pan_down":
-                y_expr = f"'(ih-oh)*on/{divisor}'"
+                y_expr = f"(ih-oh)*{progress}"
             return (
-                f"{base},zoompan=z='1.0':x={x_expr}:y={y_expr}:d={frames}:s={width}x{height}:fps={frame_rate},setsar=1"
+                f"scale={pan_width}:{pan_height}:force_original_aspect_ratio=increase,"
+                f"crop={pan_width}:{pan_height},setsar=1,loop=loop=-1:size=1,"
+                f"fps={frame_rate},crop={width}:{height}:x='{x_expr}':y='{y_expr}'"
             )
 
-        return f"{base},setsar=1"
+        # The still is read once (no -loop on the input), so repeat the
+        # already scaled frame in memory instead of decoding and rescaling
+        # the image file for every output frame.
+        still = f"{base},setsar=1,loop=loop=-1:size=1"
+        if anim_type in {"fade_in", "fade_out"}:
+            fade = min(FADE_ANIMATION_SECONDS.get(intensity, 1.0), duration / 2)
+            if anim_type == "fade_in":
+                return f"{still},fade=t=in:st=0:d={fade:.3f}"
+            return f"{still},fade=t=out:st={max(duration - fade, 0.0):.3f}:d={fade:.3f}"
+        return still
 
     def _build_subtitle_filter(self, subtitle_file: Path, style: SubtitleStyle) -> str:
         subtitle_path = str(subtitle_file).replace("\\", "/").replace(":", r"\\:")
@@ -1024,11 +2074,166 @@ class VideoComposer:
         )
         return f"subtitles='{subtitle_path}':force_style='{force_style}'"
 
-    def _video_encoder_args(self, options: RenderOptions) -> List[str]:
-        hw = options.use_hardware_acceleration
+    def _filter_thread_args(self, options: RenderOptions) -> List[str]:
+        """Global options that size FFmpeg's filter-graph worker pools."""
+        threads = max(options.ffmpeg_threads, 0)
+        if not threads:
+            return []
+        return ["-filter_threads", str(threads), "-filter_complex_threads", str(threads)]
+
+    def _hardware_encoder(self, codec: str) -> Optional[str]:
+        """First encoder from ``HARDWARE_ENCODERS`` that can open on this machine.
+
+        ``ffmpeg -encoders`` lists NVENC and VideoToolbox whenever they are
+        compiled in, so each candidate gets a one-frame test encode instead.
+        The answer is cached for the composer's lifetime.
+        """
+        with self._hardware_encoder_lock:
+            if codec not in self._hardware_encoders:
+                self._hardware_encoders[codec] = next(
+                    (
+                        encoder
+                        for encoder in HARDWARE_ENCODERS.get(codec, ())
+                        if self._probe_encoder(encoder)
+                    ),
+                    None,
+                )
+            return self._hardware_encoders[codec]
+
+    @staticmethod
+    def _probe_encoder(encoder: str) -> bool:
+        cmd = [
+            "ffmpeg",
+            *FFMPEG_QUIET_ARGS,
+            "-f",
+            "lavfi",
+            "-i",
+            "color=c=black:s=256x256:d=0.04",
+            "-frames:v",
+            "1",
+            "-c:v",
+            encoder,
+            "-f",
+            "null",
+            "-",
+        ]
+        try:
+            return subprocess.run(
+                cmd, capture_output=True, stdin=subprocess.DEVNULL, timeout=15
+            ).returncode == 0
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+
+    def _encode_speed(self, image_file: Path, options: RenderOptions) -> Optional[float]:
+        """Seconds of video encoded per wall-clock second for ``image_file``.
+
+        Runs the scene's video chain and encoder for one second into a null
+        muxer. Process start-up is part of the timing on purpose, since every
+        scene pays it too. Results are cached per command line.
+        """
+        cmd = [
+            "ffmpeg",
+            *FFMPEG_QUIET_ARGS,
+            *self._filter_thread_args(options),
+            "-framerate",
+            f"{options.frame_rate}",
+            "-i",
+            str(image_file),
+            "-t",
+            "1",
+            "-r",
+            f"{options.frame_rate}",
+            "-vf",
+            ",".join([
+                *self._video_filter_steps(
+                    options=options,
+                    duration=1.0,
+                    frame_rate=options.frame_rate,
+                    resolution=options.resolution,
+                ),
+                "format=yuv420p",
+            ]),
+            *self._video_encoder_args(options),
+            "-threads",
+            str(max(options.ffmpeg_threads, 0)),
+            "-f",
+            "null",
+            "-",
+        ]
+        key = tuple(cmd)
+        if key not in self._encode_speed_cache:
+            started = time.perf_counter()
+            try:
+                completed = subprocess.run(
+                    cmd, capture_output=True, stdin=subprocess.DEVNULL, timeout=60
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                completed = None
+            elapsed = time.perf_counter() - started
+            ok = completed is not None and completed.returncode == 0
+            self._encode_speed_cache[key] = 1.0 / elapsed if ok and elapsed > 0 else None
+        return self._encode_speed_cache[key]
+
+    def _uses_nvenc(self, options: RenderOptions) -> bool:
+        if not options.use_hardware_acceleration:
+            return False
+        encoder = self._hardware_encoder(self._resolve_codec(options))
+        return bool(encoder and encoder.endswith("_nvenc"))
+
+    def _opencl_xfade_available(self) -> bool:
+        """Whether FFmpeg can run an ``xfade_opencl`` round trip here.
+
+        Probes the exact upload -> blend -> download shape the transition
+        graph uses, once per composer.
+        """
+        with self._hardware_encoder_lock:
+            if self._opencl_xfade is None:
+                cmd = [
+                    "ffmpeg",
+                    *FFMPEG_QUIET_ARGS,
+                    "-init_hw_device",
+                    "opencl=ocl",
+                    "-filter_hw_device",
+                    "ocl",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=c=black:s=64x64:d=0.2",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "color=c=white:s=64x64:d=0.2",
+                    "-filter_complex",
+                    "[0:v]format=yuv420p,hwupload[a];[1:v]format=yuv420p,hwupload[b];"
+                    "[a][b]xfade_opencl=transition=fade:duration=0.1:offset=0.05,"
+                    "hwdownload,format=yuv420p",
+                    "-f",
+                    "null",
+                    "-",
+                ]
+                try:
+                    self._opencl_xfade = subprocess.run(
+                        cmd, capture_output=True, stdin=subprocess.DEVNULL, timeout=15
+                    ).returncode == 0
+                except (OSError, subprocess.TimeoutExpired):
+                    self._opencl_xfade = False
+            return self._opencl_xfade
+
+    def _resolve_codec(self, options: RenderOptions) -> str:
+        """The codec ``options.video_codec`` names, with ``auto`` resolved."""
         codec = options.video_codec.lower()
-        if hw:
-            encoder = "hevc_videotoolbox" if codec == "hevc" else "h264_videotoolbox"
+        if codec != "auto":
+            return codec
+        if options.use_hardware_acceleration:
+            for candidate in AUTO_CODEC_ORDER:
+                if self._hardware_encoder(candidate):
+                    return candidate
+        return "h264"
+
+    def _video_encoder_args(self, options: RenderOptions) -> List[str]:
+        codec = self._resolve_codec(options)
+        encoder = self._hardware_encoder(codec) if options.use_hardware_acceleration else None
+        if encoder and encoder.endswith("_videotoolbox"):
             return [
                 "-c:v",
                 encoder,
@@ -1039,6 +2244,45 @@ class VideoComposer:
                 "-pix_fmt",
                 "yuv420p",
             ]
+        if encoder and encoder.endswith("_nvenc"):
+            return [
+                "-c:v",
+                encoder,
+                "-preset",
+                "p4",
+                "-rc",
+                "vbr",
+                "-b:v",
+                options.video_bitrate,
+                "-pix_fmt",
+                "yuv420p",
+            ]
+        if encoder and encoder.endswith("_qsv"):
+            # Quick Sync takes NV12, not planar yuv420p
+            return [
+                "-c:v",
+                encoder,
+                "-preset",
+                "medium",
+                "-b:v",
+                options.video_bitrate,
+                "-pix_fmt",
+                "nv12",
+            ]
+        if encoder and encoder.endswith("_amf"):
+            return [
+                "-c:v",
+                encoder,
+                "-quality",
+                "balanced",
+                "-rc",
+                "vbr_peak",
+                "-b:v",
+                options.video_bitrate,
+                "-pix_fmt",
+                "yuv420p",
+            ]
+        # No working hardware encoder: fall back to x264/x265
         encoder = "libx265" if codec == "hevc" else "libx264"
         return [
             "-c:v",
@@ -1075,40 +2319,18 @@ class VideoComposer:
             json.dump(manifest, handle, indent=2, ensure_ascii=False)
 
     def _map_transition_name(self, transition: str) -> Optional[str]:
-        mapping = {
-            "none": None,
-            "fade": "fade",
-            "dissolve": "dissolve",
-            "crossfade": "fade",
-            "wipe_left": "wipeleft",
-            "wipe_right": "wiperight",
-            "wipe_up": "wipeup",
-            "wipe_down": "wipedown",
-            "slide_left": "slideleft",
-            "slide_right": "slideright",
-            "slide_up": "slideup",
-            "slide_down": "slidedown",
-            "smooth_left": "smoothleft",
-            "smooth_right": "smoothright",
-            "blur": "fadeblack",
-            "fade_white": "fadewhite",
-            "circle_open": "circleopen",
-            "circle_close": "circleclose",
-            "pixelize": "pixelize",
-            "radial": "radial",
-        }
-        return mapping.get(transition, "fade" if transition else None)
+        return XFADE_TRANSITIONS.get(transition, "fade" if transition else None)
 
     def _get_background_music(self, music_directory: str, target_duration: float) -> Optional[Path]:
         """Get background music file and prepare it to match target duration"""
         music_dir = Path(music_directory)
-        if not music_dir.exists():
+        if not music_dir.is_dir():
             return None
             
         # Find music files
         music_files = [
-            path for path in music_dir.iterdir()
-            if path.is_file() and path.suffix.lower() in {".mp3", ".wav", ".m4a", ".aac", ".flac", ".ogg"}
+            path for path in self._list_files(music_dir)
+            if path.suffix.lower() in {".mp3", ".wav", ".m4a", ".aac", ".flac", ".ogg"}
         ]
         
         if not music_files:
@@ -1142,20 +2364,27 @@ class VideoComposer:
         # Return preprocessing filter chain or None if no preprocessing needed
         return ",".join(logo_filters) if logo_filters else None
 
-    def _build_audio_mix_filter_corrected(self, music_input_index: int, target_duration: float, music_duration: float) -> str:
+    def _build_audio_mix_filter_corrected(
+        self,
+        music_input_index: int,
+        target_duration: float,
+        music_duration: float,
+        audio_input: int = 1,
+        prefix: str = "",
+    ) -> str:
         """Build corrected audio mixing filter with proper input indices"""
         # If music is shorter than target, loop it
         if music_duration > 0 and music_duration < target_duration:
             loops_needed = int(target_duration / music_duration) + 1
             sample_rate = 48000  # Standard sample rate
             loop_size = int(sample_rate * music_duration)
-            music_filter = f"[{music_input_index}:a]aloop=loop={loops_needed}:size={loop_size}[bgm]"
+            music_filter = f"[{music_input_index}:a]aloop=loop={loops_needed}:size={loop_size}[{prefix}bgm]"
             # Mix main audio with background music (30% background volume)
-            mix_filter = "[1:a][bgm]amix=inputs=2:duration=first:weights='1 0.3'[aout]"
+            mix_filter = f"[{audio_input}:a][{prefix}bgm]amix=inputs=2:duration=first:weights='1 0.3'[{prefix}aout]"
             return f"{music_filter};{mix_filter}"
         else:
             # Mix directly (music will be trimmed to match video duration by -shortest)
-            return f"[1:a][{music_input_index}:a]amix=inputs=2:duration=first:weights='1 0.3'[aout]"
+            return f"[{audio_input}:a][{music_input_index}:a]amix=inputs=2:duration=first:weights='1 0.3'[{prefix}aout]"
 
     def _video_filter_steps(
         self,
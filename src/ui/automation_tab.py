@@ -2,8 +2,9 @@
 Automation Tab - Tab tự động hoá với batch rename và subtitle generation
 """
 
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Optional
+from typing import DefaultDict, Dict, List, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox,
@@ -15,7 +16,7 @@ from PySide6.QtGui import QFont
 
 from src.core.batch_rename import BatchRenamer, RenameResult
 from src.core.subtitle_generator import SubtitleGenerator, SubtitleResult
-from src.ui.unified_styles import UnifiedStyles
+from src.ui.unified_styles import ThemePalette, UnifiedStyles
 
 
 class RenameWorker(QObject):
@@ -100,23 +101,79 @@ class SubtitleWorker(QObject):
 
 class AutomationTab(QWidget):
     """Tab chứa các tính năng tự động hoá"""
+
+    # Per-category sheets; placeholders are ThemePalette field names
+    # (see _sheet). Kept to one line per rule so there is little
+    # whitespace for Qt's parser to skip.
+    _STYLE_TEMPLATES: Dict[str, str] = {
+        "input": (
+            "QLineEdit, QComboBox, QTextEdit {{ background-color: {surface}; border: 1.5px solid {outline}; "
+            "border-radius: 8px; padding: 10px 14px; color: {text_primary}; font-size: 13px; min-height: 40px; "
+            "selection-background-color: {primary}; selection-color: {highlight_text}; }}"
+            "QLineEdit:hover, QComboBox:hover, QTextEdit:hover {{ border-color: {text_secondary}; }}"
+            "QLineEdit:focus, QComboBox:focus, QTextEdit:focus {{ border-color: {primary}; border-width: 2px; "
+            "outline: none; background-color: {surface}; }}"
+            "QComboBox::drop-down {{ border: none; width: 24px; }}"
+            "QComboBox::down-arrow {{ image: none; width: 0; height: 0; }}"
+        ),
+        "group": (
+            "QGroupBox {{ border: 1.5px solid {outline}; border-radius: 12px; background-color: {surface}; "
+            "padding: 24px; margin-top: 8px; font-weight: 600; }}"
+            "QGroupBox::title {{ subcontrol-origin: margin; subcontrol-position: top left; left: 16px; top: -8px; "
+            "padding: 0 8px; background-color: {surface}; color: {text_primary}; }}"
+        ),
+        "header": (
+            "color: {text_muted}; text-transform: uppercase; letter-spacing: 0.1em; font-weight: 700; "
+            "font-size: 11px; margin-bottom: 16px;"
+        ),
+        "section_title": "color: {text_primary}; font-weight: 600; font-size: 15px; line-height: 1.4;",
+        "overline": (
+            "color: {text_muted}; font-size: 11px; font-weight: 700; text-transform: uppercase; "
+            "letter-spacing: 0.08em; margin-bottom: 6px;"
+        ),
+        "caption": "color: {text_secondary}; font-size: 12px; line-height: 1.5;",
+        "status": "color: {primary_alt}; font-size: 12px;",
+        "text_panel": (
+            "QTextEdit {{ background-color: {surface_container}; border: 1.5px solid {outline}; border-radius: 8px; "
+            "color: {text_primary}; font-size: 12px; padding: 12px; line-height: 1.5; "
+            "font-family: 'SF Mono', 'Monaco', 'Consolas', monospace; }}"
+        ),
+        "checkbox": (
+            "QCheckBox {{ color: {text_secondary}; font-size: 13px; font-weight: 500; spacing: 8px; }}"
+            "QCheckBox::indicator {{ width: 18px; height: 18px; border: 1.5px solid {outline}; border-radius: 4px; "
+            "background-color: {surface}; }}"
+            "QCheckBox::indicator:hover {{ border-color: {primary}; }}"
+            "QCheckBox::indicator:checked {{ background-color: {primary}; border-color: {primary}; }}"
+            "QCheckBox::indicator:checked:hover {{ background-color: {primary_alt}; }}"
+        ),
+    }
+    # Registry category -> method that restyles it, in refresh order.
+    _STYLE_APPLIERS = (
+        ("group", "_apply_group_style"),
+        ("header", "_apply_header_label_style"),
+        ("section_title", "_apply_section_title_style"),
+        ("overline", "_apply_overline_style"),
+        ("caption", "_apply_caption_style"),
+        ("status", "_apply_status_style"),
+        ("text_panel", "_apply_text_panel_style"),
+        ("checkbox", "_apply_checkbox_style"),
+        ("input", "apply_input_style"),
+    )
     
     def __init__(self):
         super().__init__()
         self.batch_renamer = BatchRenamer()
         self.subtitle_generator = SubtitleGenerator()
+        # Palette the tab was last styled with; see refresh_theme.
+        self._applied_palette: Optional[ThemePalette] = None
         self._threads: List[QThread] = []
         self._workers: List[QObject] = []
-        self._group_boxes: List[QGroupBox] = []
-        self._header_labels: List[QLabel] = []
-        self._section_titles: List[QLabel] = []
-        self._overline_labels: List[QLabel] = []
-        self._caption_labels: List[QLabel] = []
-        self._status_labels: List[QLabel] = []
-        self._input_widgets: List[QWidget] = []
-        self._button_configs: List[tuple] = []
-        self._text_panels: List[QTextEdit] = []
-        self._checkboxes: List[QCheckBox] = []
+        # Formatted _STYLE_TEMPLATES for _sheets_palette; see _sheet.
+        self._sheets: Dict[str, str] = {}
+        self._sheets_palette: Optional[ThemePalette] = None
+        # Style category -> {id(widget): widget}; see _STYLE_APPLIERS.
+        self._styled: DefaultDict[str, Dict[int, QWidget]] = defaultdict(dict)
+        self._button_configs: Dict[int, Tuple[QPushButton, str, str]] = {}
         self.init_ui()
         self.refresh_theme()
 
@@ -437,40 +494,26 @@ class AutomationTab(QWidget):
         
         return group
     
-    def apply_input_style(self, widget):
-        """Apply consistent input styling"""
-        from PySide6.QtWidgets import QComboBox, QTextEdit
+    def _sheet(self, category: str) -> str:
+        """Return ``category``'s sheet for the active palette.
 
-        palette = UnifiedStyles.palette()
-        widget.setStyleSheet(
-            f"""
-            QLineEdit, QComboBox, QTextEdit {{
-                background-color: {palette.surface};
-                border: 1.5px solid {palette.outline};
-                border-radius: 8px;
-                padding: 10px 14px;
-                color: {palette.text_primary};
-                font-size: 13px;
-                min-height: 40px;
-                selection-background-color: {palette.primary};
-                selection-color: {palette.highlight_text};
-            }}
-            QLineEdit:hover, QComboBox:hover, QTextEdit:hover {{
-                border-color: {palette.text_secondary};
-            }}
-            QLineEdit:focus, QComboBox:focus, QTextEdit:focus {{
-                border-color: {palette.primary};
-                border-width: 2px;
-                outline: none;
-                background-color: {palette.surface};
-            }}
-            QComboBox::drop-down {{ border: none; width: 24px; }}
-            QComboBox::down-arrow {{ image: none; width: 0; height: 0; }}
+        Formatted once per theme, so every widget in a category is handed
+        the same string instead of a freshly built copy.
         """
-        )
+        palette = UnifiedStyles.palette()
+        if palette is not self._sheets_palette:
+            self._sheets_palette = palette
+            self._sheets = {}
+        sheet = self._sheets.get(category)
+        if sheet is None:
+            sheet = self._STYLE_TEMPLATES[category].format_map(vars(palette))
+            self._sheets[category] = sheet
+        return sheet
 
-        if widget not in self._input_widgets:
-            self._input_widgets.append(widget)
+    def apply_input_style(self, widget):
+        """Apply consistent input styling"""
+        widget.setStyleSheet(self._sheet("input"))
+        self._styled["input"][id(widget)] = widget
 
     def apply_button_style(self, button, color_scheme="primary", size="medium"):
         scheme_map = {
@@ -481,165 +524,55 @@ class AutomationTab(QWidget):
             "preset": "ghost",
         }
         UnifiedStyles.apply_button_style(button, scheme_map.get(color_scheme, color_scheme), size)
-        if all(button is not btn for btn, _, __ in self._button_configs):
-            self._button_configs.append((button, color_scheme, size))
+        self._button_configs[id(button)] = (button, color_scheme, size)
 
     def _apply_group_style(self, group: QGroupBox) -> None:
-        palette = UnifiedStyles.palette()
-        group.setStyleSheet(
-            f"""
-            QGroupBox {{
-                border: 1.5px solid {palette.outline};
-                border-radius: 12px;
-                background-color: {palette.surface};
-                padding: 24px;
-                margin-top: 8px;
-                font-weight: 600;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 16px;
-                top: -8px;
-                padding: 0 8px;
-                background-color: {palette.surface};
-                color: {palette.text_primary};
-            }}
-        """
-        )
-        if group not in self._group_boxes:
-            self._group_boxes.append(group)
+        group.setStyleSheet(self._sheet("group"))
+        self._styled["group"][id(group)] = group
 
     def _apply_header_label_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(
-            f"""
-            color: {palette.text_muted};
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-            font-weight: 700;
-            font-size: 11px;
-            margin-bottom: 16px;
-        """
-        )
-        if label not in self._header_labels:
-            self._header_labels.append(label)
+        label.setStyleSheet(self._sheet("header"))
+        self._styled["header"][id(label)] = label
 
     def _apply_section_title_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(f"color: {palette.text_primary}; font-weight: 600; font-size: 15px; line-height: 1.4;")
-        if label not in self._section_titles:
-            self._section_titles.append(label)
+        label.setStyleSheet(self._sheet("section_title"))
+        self._styled["section_title"][id(label)] = label
 
     def _apply_overline_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(
-            f"""
-            color: {palette.text_muted};
-            font-size: 11px;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            margin-bottom: 6px;
-        """
-        )
-        if label not in self._overline_labels:
-            self._overline_labels.append(label)
+        label.setStyleSheet(self._sheet("overline"))
+        self._styled["overline"][id(label)] = label
 
     def _apply_caption_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(f"color: {palette.text_secondary}; font-size: 12px; line-height: 1.5;")
-        if label not in self._caption_labels:
-            self._caption_labels.append(label)
+        label.setStyleSheet(self._sheet("caption"))
+        self._styled["caption"][id(label)] = label
 
     def _apply_status_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(f"color: {palette.primary_alt}; font-size: 12px;")
-        if label not in self._status_labels:
-            self._status_labels.append(label)
+        label.setStyleSheet(self._sheet("status"))
+        self._styled["status"][id(label)] = label
 
     def _apply_text_panel_style(self, panel: QTextEdit) -> None:
-        palette = UnifiedStyles.palette()
-        panel.setStyleSheet(
-            f"""
-            QTextEdit {{
-                background-color: {palette.surface_container};
-                border: 1.5px solid {palette.outline};
-                border-radius: 8px;
-                color: {palette.text_primary};
-                font-size: 12px;
-                padding: 12px;
-                line-height: 1.5;
-                font-family: 'SF Mono', 'Monaco', 'Consolas', monospace;
-            }}
-        """
-        )
-        if panel not in self._text_panels:
-            self._text_panels.append(panel)
+        panel.setStyleSheet(self._sheet("text_panel"))
+        self._styled["text_panel"][id(panel)] = panel
 
     def _apply_checkbox_style(self, checkbox: QCheckBox) -> None:
-        palette = UnifiedStyles.palette()
-        checkbox.setStyleSheet(
-            f"""
-            QCheckBox {{
-                color: {palette.text_secondary};
-                font-size: 13px;
-                font-weight: 500;
-                spacing: 8px;
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 1.5px solid {palette.outline};
-                border-radius: 4px;
-                background-color: {palette.surface};
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: {palette.primary};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {palette.primary};
-                border-color: {palette.primary};
-            }}
-            QCheckBox::indicator:checked:hover {{
-                background-color: {palette.primary_alt};
-            }}
-        """
-        )
-        if checkbox not in self._checkboxes:
-            self._checkboxes.append(checkbox)
+        checkbox.setStyleSheet(self._sheet("checkbox"))
+        self._styled["checkbox"][id(checkbox)] = checkbox
 
     def refresh_theme(self) -> None:
         """Reapply palette-driven styles when theme changes."""
+        palette = UnifiedStyles.palette()
+        if palette == self._applied_palette:
+            # Same theme as last time: re-setting identical sheets would
+            # still re-polish every widget in the tab.
+            return
+        self._applied_palette = palette
         UnifiedStyles.refresh_stylesheet(self)
-        for group in self._group_boxes:
-            self._apply_group_style(group)
-
-        for label in self._header_labels:
-            self._apply_header_label_style(label)
-
-        for label in self._section_titles:
-            self._apply_section_title_style(label)
-
-        for label in self._overline_labels:
-            self._apply_overline_style(label)
-
-        for label in self._caption_labels:
-            self._apply_caption_style(label)
-
-        for label in self._status_labels:
-            self._apply_status_style(label)
-
-        for panel in self._text_panels:
-            self._apply_text_panel_style(panel)
-
-        for checkbox in self._checkboxes:
-            self._apply_checkbox_style(checkbox)
-
-        for widget in self._input_widgets:
-            self.apply_input_style(widget)
+        for category, applier in self._STYLE_APPLIERS:
+            apply_style = getattr(self, applier)
+            for widget in list(self._styled[category].values()):
+                apply_style(widget)
 
-        for button, scheme, size in self._button_configs:
+        for button, scheme, size in list(self._button_configs.values()):
             self.apply_button_style(button, scheme, size)
     
     # Event handlers
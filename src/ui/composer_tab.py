@@ -2,17 +2,24 @@
 Composer Tab - Tab ghép & render với video composition và subtitle styling
 """
 
+from dataclasses import dataclass
+from functools import partial
+import gc
+import os
 from pathlib import Path
 import subprocess
+import sys
+import threading
 from typing import Dict, List, Tuple, Optional
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox,
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout, QGroupBox,
     QLabel, QLineEdit, QPushButton, QComboBox, QSpinBox, QDoubleSpinBox, QCheckBox,
     QTextEdit, QFileDialog, QMessageBox, QScrollArea,
-    QColorDialog, QSlider, QFrame, QDialog, QProgressBar, QDialogButtonBox
+    QColorDialog, QSlider, QFrame, QDialog, QProgressBar, QDialogButtonBox,
+    QApplication
 )
-from PySide6.QtCore import Qt, QThread, Signal, QObject, QEvent
+from PySide6.QtCore import Qt, QThread, Signal, QObject, QEvent, QSignalBlocker, QTimer, QUrl
 from PySide6.QtGui import QFont, QColor
 from PySide6.QtGui import QDesktopServices
 
@@ -25,6 +32,7 @@ from src.core.video_composer import (
     RenderBatchResult,
 )
 from src.core.filter_presets import audio_presets_list, video_presets_list, FilterPreset
+from src.ui.unified_styles import ThemePalette, UnifiedStyles
 
 
 class RenderWorker(QObject):
@@ -34,6 +42,13 @@ class RenderWorker(QObject):
     error = Signal(str)
     progress = Signal(str, float, str)
 
+    # Renders running across every tab. Everything alive when the first one
+    # starts (the widget trees, presets, composers) outlives it, so it is
+    # parked in the permanent generation until the last render finishes and
+    # the collections triggered by progress traffic never walk it.
+    _active_renders = 0
+    _active_lock = threading.Lock()
+
     def __init__(
         self,
         audio_directory: str,
@@ -44,8 +59,11 @@ class RenderWorker(QObject):
         mode: str,
         create_individual: bool,
         create_combined: bool,
+        composer: Optional[VideoComposer] = None,
     ) -> None:
         super().__init__()
+        self._composer = composer
+        self._last_progress: Optional[Tuple[str, int, Optional[str]]] = None
         self._audio_directory = audio_directory
         self._image_directory = image_directory
         self._output_directory = output_directory
@@ -56,10 +74,37 @@ class RenderWorker(QObject):
         self._create_combined = create_combined
 
     def _progress_callback(self, stage: str, ratio: float, message: Optional[str]) -> None:
+        # Drop ticks that would not move the bar by a tenth of a percent or
+        # change the message; each emit posts an event to the GUI thread.
+        key = (stage, int(ratio * 1000), message)
+        if key == self._last_progress:
+            return
+        self._last_progress = key
         self.progress.emit(stage, ratio, message or "")
 
+    @classmethod
+    def _freeze_gc(cls) -> None:
+        with cls._active_lock:
+            if cls._active_renders == 0:
+                gc.freeze()
+            cls._active_renders += 1
+
+    @classmethod
+    def _thaw_gc(cls) -> None:
+        with cls._active_lock:
+            cls._active_renders -= 1
+            if cls._active_renders == 0:
+                gc.unfreeze()
+
     def run(self) -> None:
-        composer = VideoComposer()
+        self._freeze_gc()
+        try:
+            self._render()
+        finally:
+            self._thaw_gc()
+
+    def _render(self) -> None:
+        composer = self._composer or VideoComposer()
         try:
             result = composer.render_project(
                 audio_directory=self._audio_directory,
@@ -76,37 +121,166 @@ class RenderWorker(QObject):
             return
 
         self.finished.emit(result, self._mode)
-from src.ui.unified_styles import UnifiedStyles
+
+
+class ComposerLoader(QObject):
+    """Builds a VideoComposer off the GUI thread.
+
+    Construction probes ``ffmpeg``/``ffprobe`` with blocking subprocess
+    calls, so tabs warm one up here once they are first shown.
+    """
+
+    finished = Signal(object)
+    error = Signal(str)
+
+    def run(self) -> None:
+        try:
+            composer = VideoComposer()
+        except Exception as exc:
+            self.error.emit(str(exc))
+            return
+        self.finished.emit(composer)
+
+
+@dataclass
+class _SubtitleState:
+    """Subtitle styling as last set by the tab's controls."""
+
+    font_family: str = "Space Grotesk"
+    font_size: int = 48
+    text_color: str = "#FFFFFF"
+    outline_color: str = "#000000"
+    outline_width: float = 2.0
+    letter_spacing: float = 0.0
+    preview_text: str = "Type content to see preview"
+
+
+def create_form_layout(parent: Optional[QWidget] = None) -> QFormLayout:
+    """Create a label/field form with the tabs' shared spacing and alignment"""
+    form = QFormLayout(parent) if parent is not None else QFormLayout()
+    form.setSpacing(12)
+    form.setLabelAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+    form.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+    form.setRowWrapPolicy(QFormLayout.DontWrapRows)
+    return form
+
+
+class _PathInput(QWidget):
+    """Overline label above a line edit with a trailing button.
+
+    One grid on the row widget stands in for the old VBox/HBox nesting;
+    the label, edit and button pick up the tab's role rules, so the row
+    installs no stylesheet of its own.
+    """
+
+    def __init__(self, label_text: str, placeholder: str, button_text: str = "Browse", parent=None) -> None:
+        super().__init__(parent)
+        label = QLabel(label_text)
+        label.setProperty("role", "overline")
+        self.line_edit = QLineEdit()
+        self.line_edit.setPlaceholderText(placeholder)
+        self.line_edit.setProperty("role", "input")
+        self.browse_btn = QPushButton(button_text)
+        UnifiedStyles.apply_button_style(self.browse_btn, "outline", "small")
+
+        layout = QGridLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setVerticalSpacing(8)
+        layout.addWidget(label, 0, 0, 1, 2)
+        layout.addWidget(self.line_edit, 1, 0)
+        layout.addWidget(self.browse_btn, 1, 1)
+        layout.setColumnStretch(0, 1)
+
 
 class ComposerTab(QWidget):
     """Tab ghép & render video với subtitle styling"""
+
+    # Fonts offered for burned-in subtitles; shared by every tab instance.
+    _FONT_FAMILIES: Tuple[str, ...] = (
+        "Space Grotesk",
+        "Montserrat",
+        "Roboto",
+        "Open Sans",
+        "Arial",
+        "Helvetica",
+        "Arial Black",
+    )
+    # Combo contents, shared by every tab instance; (label, value) pairs
+    # become item text and item data.
+    _ANIMATION_CHOICES: Tuple[Tuple[str, str], ...] = (
+        ("None", "none"),
+        ("Zoom In", "zoom_in"),
+        ("Zoom Out", "zoom_out"),
+        ("Ken Burns (Zoom + Pan)", "ken_burns"),
+        ("Pan Left", "pan_left"),
+        ("Pan Right", "pan_right"),
+        ("Pan Up", "pan_up"),
+        ("Pan Down", "pan_down"),
+    )
+    _INTENSITY_CHOICES: Tuple[Tuple[str, str], ...] = (
+        ("Subtle", "subtle"),
+        ("Medium", "medium"),
+        ("Strong", "strong"),
+    )
+    _TRANSITION_CHOICES: Tuple[Tuple[str, str], ...] = (
+        ("None", "none"),
+        ("Fade", "fade"),
+        ("Dissolve", "dissolve"),
+        ("Crossfade", "crossfade"),
+        ("Wipe Left", "wipe_left"),
+        ("Wipe Right", "wipe_right"),
+        ("Wipe Up", "wipe_up"),
+        ("Wipe Down", "wipe_down"),
+        ("Slide Left", "slide_left"),
+        ("Slide Right", "slide_right"),
+        ("Slide Up", "slide_up"),
+        ("Slide Down", "slide_down"),
+        ("Smooth Left", "smooth_left"),
+        ("Smooth Right", "smooth_right"),
+        ("Fade to White", "fade_white"),
+        ("Blur Fade", "blur"),
+        ("Circle Open", "circle_open"),
+        ("Circle Close", "circle_close"),
+        ("Pixelize", "pixelize"),
+        ("Radial", "radial"),
+    )
+    _SYNC_MODE_CHOICES: Tuple[Tuple[str, str], ...] = (
+        ("Standard pairing (1:1 files)", "standard"),
+        ("Sync Audio • distribute visuals evenly", "sync_audio"),
+        ("Sync Images • reuse visuals to cover audio", "sync_images"),
+    )
+    _VIDEO_CODECS: Tuple[str, ...] = ("H.264 (VideoToolbox)", "HEVC H.265 (VideoToolbox)")
+    _ALIGNMENTS: Tuple[str, ...] = ("Left", "Center", "Right")
+    _COLOR_BUTTON_QSS = "QPushButton { background-color: %s; border: 1px solid %s; border-radius: 6px; }"
+    _PREVIEW_LABEL_QSS = (
+        "QLabel { font-family: %s; font-size: %spx; color: %s; "
+        "text-align: center; line-height: 1.2; letter-spacing: %spx; }"
+    )
     
     def __init__(self):
         super().__init__()
         self.setObjectName("ComposerTabRoot")
-        self.video_composer = VideoComposer()
+        # Palette the tab was last styled with; see refresh_theme.
+        self._applied_palette: Optional[ThemePalette] = None
+        # Built by ComposerLoader once the tab is first shown; see video_composer.
+        self._video_composer: Optional[VideoComposer] = None
+        self._composer_loading = False
         
         # Subtitle styling state
-        self.font_family = "Space Grotesk"
-        self.font_size = 48
-        self.text_color = "#FFFFFF"
-        self.outline_color = "#000000"
-        self.outline_width = 2.0
-        self.letter_spacing = 0.0
-        self.preview_text = "Type content to see preview"
-        
-        self._group_boxes: List[QGroupBox] = []
-        self._header_labels: List[QLabel] = []
-        self._section_titles: List[QLabel] = []
-        self._overline_labels: List[QLabel] = []
-        self._caption_labels: List[QLabel] = []
-        self._status_labels: List[QLabel] = []
-        self._text_panels: List[QTextEdit] = []
-        self._input_widgets: List[QWidget] = []
-        self._button_configs: List[tuple] = []
-        self._checkboxes: List[QCheckBox] = []
-        self._color_buttons: List[QPushButton] = []
-        self._info_frames: List[QFrame] = []
+        self._subtitle_state = _SubtitleState()
+        self._text_qcolor = QColor(self._subtitle_state.text_color)
+        self._outline_qcolor = QColor(self._subtitle_state.outline_color)
+        # Coalesces bursts of control changes into one preview restyle.
+        self._preview_refresh_timer = QTimer(self)
+        self._preview_refresh_timer.setSingleShot(True)
+        self._preview_refresh_timer.setInterval(30)
+        self._preview_refresh_timer.timeout.connect(self.update_preview_style)
+
+        # Shared by every header/section title; QFont is implicitly shared,
+        # so setFont() with the same instance skips a fresh font resolve.
+        self._header_font = QFont("Space Grotesk", 11, QFont.Bold)
+        self._section_font = QFont("Space Grotesk", 14, QFont.Bold)
+        
         self.video_filter_checkboxes: List[QCheckBox] = []
         self.audio_filter_checkboxes: List[QCheckBox] = []
         self._threads: List[QThread] = []
@@ -114,6 +288,15 @@ class ComposerTab(QWidget):
         self._active_mode: Optional[str] = None
         self._progress_dialog: Optional[ProgressDialog] = None
         self._last_output_dir: Optional[Path] = None
+        self._wheel_filter_installed = False
+        self._file_dialog: Optional[QFileDialog] = None
+        self._combined_name_dialog: Optional[QDialog] = None
+        self._combined_name_input: Optional[QLineEdit] = None
+        self._last_status_text: Optional[str] = None
+        self._pending_progress: Optional[Tuple[str, float]] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._flush_render_progress)
 
         self.init_ui()
         self.refresh_theme()
@@ -139,7 +322,7 @@ class ComposerTab(QWidget):
         
         # Header
         header = QLabel("CONTENT COMPOSITION & RENDER")
-        header.setFont(QFont("Space Grotesk", 11, QFont.Bold))
+        header.setFont(self._header_font)
         self._apply_header_label_style(header)
         layout.addWidget(header)
         
@@ -164,12 +347,16 @@ class ComposerTab(QWidget):
         motion_widget = self.create_motion_settings_widget()
         layout.addWidget(motion_widget)
 
-        effects_widget = self.create_effects_settings_widget()
-        layout.addWidget(effects_widget)
-
-        # Subtitle styling section
-        subtitle_section = self.create_subtitle_styling_section()
-        layout.addWidget(subtitle_section)
+        # The filter lists and the subtitle styling section are the heaviest
+        # widget trees; they are built on first show (see
+        # _ensure_sections_built)
+        self._section_placeholders: List[Tuple[QWidget, str]] = [
+            (QWidget(), "create_effects_settings_widget"),
+            (QWidget(), "create_subtitle_styling_section"),
+        ]
+        self._sections_layout = layout
+        for placeholder, _ in self._section_placeholders:
+            layout.addWidget(placeholder)
         
         # Two render buttons with English text
         render_buttons_layout = QHBoxLayout()
@@ -211,47 +398,34 @@ class ComposerTab(QWidget):
         layout = QVBoxLayout(group)
         layout.setSpacing(16)
 
-        # Audio directory
-        audio_layout = self.create_directory_input("AUDIO DIRECTORY", "Path to audio folder")
-        self.audio_directory = audio_layout[1]
-        audio_browse_btn = audio_layout[2]
-        audio_browse_btn.clicked.connect(self.browse_audio_directory)
-        layout.addLayout(audio_layout[0])
-        
-        # Image directory  
-        image_layout = self.create_directory_input("IMAGE DIRECTORY", "Path to image folder")
-        self.image_directory = image_layout[1]
-        image_browse_btn = image_layout[2]
-        image_browse_btn.clicked.connect(self.browse_image_directory)
-        layout.addLayout(image_layout[0])
-        
-        # Subtitle directory (optional)
-        subtitle_layout = self.create_directory_input("SUBTITLE DIRECTORY (OPTIONAL)", "Path to subtitle .srt folder")
-        self.subtitle_directory = subtitle_layout[1]
-        subtitle_browse_btn = subtitle_layout[2]
-        subtitle_browse_btn.clicked.connect(self.browse_subtitle_directory)
-        layout.addLayout(subtitle_layout[0])
-        
-        # Background Music directory (optional)
-        music_layout = self.create_directory_input("BACKGROUND MUSIC DIRECTORY (OPTIONAL)", "Path to background music folder")
-        self.music_directory = music_layout[1]
-        music_browse_btn = music_layout[2]
-        music_browse_btn.clicked.connect(self.browse_music_directory)
-        layout.addLayout(music_layout[0])
-        
-        # Output directory
-        output_layout = self.create_directory_input("OUTPUT DIRECTORY", "Path to save videos (.mp4)")
-        self.output_directory = output_layout[1]
-        output_browse_btn = output_layout[2]
-        output_browse_btn.clicked.connect(self.browse_output_directory)
-        layout.addLayout(output_layout[0])
+        directory_inputs = (
+            ("audio_directory", "AUDIO DIRECTORY", "Path to audio folder", self.browse_audio_directory),
+            ("image_directory", "IMAGE DIRECTORY", "Path to image folder", self.browse_image_directory),
+            (
+                "subtitle_directory",
+                "SUBTITLE DIRECTORY (OPTIONAL)",
+                "Path to subtitle .srt folder",
+                self.browse_subtitle_directory,
+            ),
+            (
+                "music_directory",
+                "BACKGROUND MUSIC DIRECTORY (OPTIONAL)",
+                "Path to background music folder",
+                self.browse_music_directory,
+            ),
+            ("output_directory", "OUTPUT DIRECTORY", "Path to save videos (.mp4)", self.browse_output_directory),
+        )
+        for attribute, label_text, placeholder, browse in directory_inputs:
+            row = _PathInput(label_text, placeholder)
+            row.browse_btn.clicked.connect(browse)
+            setattr(self, attribute, row.line_edit)
+            layout.addWidget(row)
 
         sync_label = QLabel("SYNC MODE")
         self._apply_overline_style(sync_label)
         self.sync_mode_combo = QComboBox()
-        self.sync_mode_combo.addItem("Standard pairing (1:1 files)", "standard")
-        self.sync_mode_combo.addItem("Sync Audio • distribute visuals evenly", "sync_audio")
-        self.sync_mode_combo.addItem("Sync Images • reuse visuals to cover audio", "sync_images")
+        for text, value in self._SYNC_MODE_CHOICES:
+            self.sync_mode_combo.addItem(text, value)
         self.apply_input_style(self.sync_mode_combo)
         layout.addWidget(sync_label)
         layout.addWidget(self.sync_mode_combo)
@@ -263,8 +437,8 @@ class ComposerTab(QWidget):
         group = QGroupBox()
         self._apply_group_style(group)
 
-        layout = QVBoxLayout(group)
-        layout.setSpacing(16)
+        layout = create_form_layout(group)
+        layout.setVerticalSpacing(16)
 
         # Frame rate
         frame_rate_label = QLabel("FRAME RATE")
@@ -274,21 +448,16 @@ class ComposerTab(QWidget):
         self.frame_rate.setText("30")
         self.apply_input_style(self.frame_rate)
 
-        layout.addWidget(frame_rate_label)
-        layout.addWidget(self.frame_rate)
+        layout.addRow(frame_rate_label, self.frame_rate)
 
         # Video codec
         codec_label = QLabel("VIDEO CODEC")
         self._apply_overline_style(codec_label)
         self.video_codec = QComboBox()
-        self.video_codec.addItems([
-            "H.264 (VideoToolbox)",
-            "HEVC H.265 (VideoToolbox)"
-        ])
+        self.video_codec.addItems(self._VIDEO_CODECS)
         self.apply_input_style(self.video_codec)
 
-        layout.addWidget(codec_label)
-        layout.addWidget(self.video_codec)
+        layout.addRow(codec_label, self.video_codec)
 
         # Audio bitrate
         bitrate_label = QLabel("AUDIO BITRATE")
@@ -298,8 +467,7 @@ class ComposerTab(QWidget):
         self.audio_bitrate.setText("192k")
         self.apply_input_style(self.audio_bitrate)
 
-        layout.addWidget(bitrate_label)
-        layout.addWidget(self.audio_bitrate)
+        layout.addRow(bitrate_label, self.audio_bitrate)
 
         # Video bitrate
         video_bitrate_label = QLabel("VIDEO BITRATE")
@@ -309,8 +477,7 @@ class ComposerTab(QWidget):
         self.video_bitrate.setText("8000k")
         self.apply_input_style(self.video_bitrate)
 
-        layout.addWidget(video_bitrate_label)
-        layout.addWidget(self.video_bitrate)
+        layout.addRow(video_bitrate_label, self.video_bitrate)
 
         # Resolution
         resolution_label = QLabel("OUTPUT RESOLUTION")
@@ -330,20 +497,25 @@ class ComposerTab(QWidget):
         resolution_layout.addWidget(multiply_label)
         resolution_layout.addWidget(self.resolution_height)
 
-        layout.addWidget(resolution_label)
-        layout.addLayout(resolution_layout)
+        layout.addRow(resolution_label, resolution_layout)
 
         # Burn subtitles checkbox - SET DEFAULT TO CHECKED
         self.burn_subtitles = QCheckBox("Burn subtitles directly into video")
         self.burn_subtitles.setChecked(True)  # Default checked
         self._apply_checkbox_style(self.burn_subtitles)
-        layout.addWidget(self.burn_subtitles)
+        layout.addRow(self.burn_subtitles)
 
         # Hardware acceleration
         self.use_hardware_checkbox = QCheckBox("Hardware acceleration (VideoToolbox)")
         self.use_hardware_checkbox.setChecked(True)
         self._apply_checkbox_style(self.use_hardware_checkbox)
-        layout.addWidget(self.use_hardware_checkbox)
+        layout.addRow(self.use_hardware_checkbox)
+
+        # Keep the per-scene clips next to the complete video
+        self.keep_clips_checkbox = QCheckBox("Keep individual clips when rendering the complete video")
+        self.keep_clips_checkbox.setChecked(False)
+        self._apply_checkbox_style(self.keep_clips_checkbox)
+        layout.addRow(self.keep_clips_checkbox)
 
         # Info box
         info_frame = QFrame()
@@ -360,7 +532,7 @@ class ComposerTab(QWidget):
         info_layout.addWidget(info_text)
         info_layout.addWidget(req_text)
 
-        layout.addWidget(info_frame)
+        layout.addRow(info_frame)
 
         return group
 
@@ -374,16 +546,15 @@ class ComposerTab(QWidget):
         
         # Header
         logo_title = QLabel("Logo & Overlay Settings")
-        logo_title.setFont(QFont("Space Grotesk", 14, QFont.Bold))
+        logo_title.setFont(self._section_font)
         self._apply_section_title_style(logo_title)
         layout.addWidget(logo_title)
         
         # Logo file input
-        logo_file_layout = self.create_file_input("LOGO FILE (OPTIONAL)", "Select logo image file (.png, .jpg, .svg)")
-        self.logo_file = logo_file_layout[1]
-        logo_browse_btn = logo_file_layout[2]
-        logo_browse_btn.clicked.connect(self.browse_logo_file)
-        layout.addLayout(logo_file_layout[0])
+        logo_row = _PathInput("LOGO FILE (OPTIONAL)", "Select logo image file (.png, .jpg, .svg)")
+        logo_row.browse_btn.clicked.connect(self.browse_logo_file)
+        self.logo_file = logo_row.line_edit
+        layout.addWidget(logo_row)
         
         # Logo settings grid
         logo_grid = QGridLayout()
@@ -459,7 +630,7 @@ class ComposerTab(QWidget):
         
         for text, (x, y) in positions:
             btn = QPushButton(text)
-            btn.clicked.connect(lambda checked, x=x, y=y: self.set_logo_position(x, y))
+            btn.clicked.connect(partial(self.set_logo_position, x, y))
             self.apply_button_style(btn, "preset")
             preset_layout.addWidget(btn)
         
@@ -566,17 +737,7 @@ class ComposerTab(QWidget):
         animation_label = QLabel("ANIMATION")
         self._apply_overline_style(animation_label)
         self.animation_type_combo = QComboBox()
-        animation_items = [
-            ("None", "none"),
-            ("Zoom In", "zoom_in"),
-            ("Zoom Out", "zoom_out"),
-            ("Ken Burns (Zoom + Pan)", "ken_burns"),
-            ("Pan Left", "pan_left"),
-            ("Pan Right", "pan_right"),
-            ("Pan Up", "pan_up"),
-            ("Pan Down", "pan_down"),
-        ]
-        for text, value in animation_items:
+        for text, value in self._ANIMATION_CHOICES:
             self.animation_type_combo.addItem(text, value)
         self.apply_input_style(self.animation_type_combo)
 
@@ -584,12 +745,7 @@ class ComposerTab(QWidget):
         intensity_label = QLabel("ANIMATION INTENSITY")
         self._apply_overline_style(intensity_label)
         self.animation_intensity_combo = QComboBox()
-        intensity_items = [
-            ("Subtle", "subtle"),
-            ("Medium", "medium"),
-            ("Strong", "strong"),
-        ]
-        for text, value in intensity_items:
+        for text, value in self._INTENSITY_CHOICES:
             self.animation_intensity_combo.addItem(text, value)
         self.animation_intensity_combo.setCurrentIndex(1)
         self.apply_input_style(self.animation_intensity_combo)
@@ -598,29 +754,7 @@ class ComposerTab(QWidget):
         transition_label = QLabel("TRANSITION")
         self._apply_overline_style(transition_label)
         self.transition_type_combo = QComboBox()
-        transition_items = [
-            ("None", "none"),
-            ("Fade", "fade"),
-            ("Dissolve", "dissolve"),
-            ("Crossfade", "crossfade"),
-            ("Wipe Left", "wipe_left"),
-            ("Wipe Right", "wipe_right"),
-            ("Wipe Up", "wipe_up"),
-            ("Wipe Down", "wipe_down"),
-            ("Slide Left", "slide_left"),
-            ("Slide Right", "slide_right"),
-            ("Slide Up", "slide_up"),
-            ("Slide Down", "slide_down"),
-            ("Smooth Left", "smooth_left"),
-            ("Smooth Right", "smooth_right"),
-            ("Fade to White", "fade_white"),
-            ("Blur Fade", "blur"),
-            ("Circle Open", "circle_open"),
-            ("Circle Close", "circle_close"),
-            ("Pixelize", "pixelize"),
-            ("Radial", "radial"),
-        ]
-        for text, value in transition_items:
+        for text, value in self._TRANSITION_CHOICES:
             self.transition_type_combo.addItem(text, value)
         self.apply_input_style(self.transition_type_combo)
 
@@ -649,12 +783,7 @@ class ComposerTab(QWidget):
         """Create subtitle styling section with new layout"""
         # Main container
         container = QFrame()
-        container.setStyleSheet("""
-            QFrame {
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        container.setProperty("role", "bare")
         
         main_layout = QHBoxLayout(container)
         main_layout.setSpacing(24)
@@ -668,7 +797,7 @@ class ComposerTab(QWidget):
         
         # Header
         controls_title = QLabel("Subtitle Styling (Burn-in)")
-        controls_title.setFont(QFont("Space Grotesk", 14, QFont.Bold))
+        controls_title.setFont(self._section_font)
         self._apply_section_title_style(controls_title)
         controls_layout.addWidget(controls_title)
 
@@ -692,18 +821,8 @@ class ComposerTab(QWidget):
         font_label = QLabel("FONT")
         self._apply_overline_style(font_label)
         self.font_combo = QComboBox()
-        self.font_combo.addItems(
-            [
-                "Space Grotesk",
-                "Montserrat",
-                "Roboto",
-                "Open Sans",
-                "Arial",
-                "Helvetica",
-                "Arial Black",
-            ]
-        )
-        self.font_combo.currentTextChanged.connect(self.update_font_family)
+        self.font_combo.addItems(self._FONT_FAMILIES)
+        self._bind_preview(self.font_combo.currentTextChanged, "font_family")
         self.apply_input_style(self.font_combo)
         
         # Font size
@@ -712,7 +831,7 @@ class ComposerTab(QWidget):
         self.font_size_input = QSpinBox()
         self.font_size_input.setRange(12, 120)
         self.font_size_input.setValue(48)
-        self.font_size_input.valueChanged.connect(self.update_font_size)
+        self._bind_preview(self.font_size_input.valueChanged, "font_size")
         self.apply_input_style(self.font_size_input)
         
         font_grid.addWidget(font_label, 0, 0)
@@ -733,10 +852,10 @@ class ComposerTab(QWidget):
         text_color_layout = QHBoxLayout()
         self.text_color_btn = QPushButton()
         self.text_color_btn.setFixedSize(48, 40)
-        self._apply_color_button_style(self.text_color_btn, self.text_color)
+        self._apply_color_button_style(self.text_color_btn, self._subtitle_state.text_color)
         self.text_color_btn.clicked.connect(self.choose_text_color)
         
-        self.text_color_input = QLineEdit(self.text_color)
+        self.text_color_input = QLineEdit(self._subtitle_state.text_color)
         self.text_color_input.textChanged.connect(self.update_text_color)
         self.apply_input_style(self.text_color_input)
         
@@ -750,10 +869,10 @@ class ComposerTab(QWidget):
         outline_color_layout = QHBoxLayout()
         self.outline_color_btn = QPushButton()
         self.outline_color_btn.setFixedSize(48, 40)
-        self._apply_color_button_style(self.outline_color_btn, self.outline_color)
+        self._apply_color_button_style(self.outline_color_btn, self._subtitle_state.outline_color)
         self.outline_color_btn.clicked.connect(self.choose_outline_color)
         
-        self.outline_color_input = QLineEdit(self.outline_color)
+        self.outline_color_input = QLineEdit(self._subtitle_state.outline_color)
         self.outline_color_input.textChanged.connect(self.update_outline_color)
         self.apply_input_style(self.outline_color_input)
         
@@ -777,7 +896,7 @@ class ComposerTab(QWidget):
         self.outline_width_input = QSpinBox()
         self.outline_width_input.setRange(0, 10)
         self.outline_width_input.setValue(2)
-        self.outline_width_input.valueChanged.connect(self.update_outline_width)
+        self._bind_preview(self.outline_width_input.valueChanged, "outline_width", float)
         self.apply_input_style(self.outline_width_input)
         
         # Letter spacing
@@ -786,7 +905,7 @@ class ComposerTab(QWidget):
         self.letter_spacing_input = QSpinBox()
         self.letter_spacing_input.setRange(-5, 10)
         self.letter_spacing_input.setValue(0)
-        self.letter_spacing_input.valueChanged.connect(self.update_letter_spacing)
+        self._bind_preview(self.letter_spacing_input.valueChanged, "letter_spacing", float)
         self.apply_input_style(self.letter_spacing_input)
         
         advanced_grid.addWidget(width_label, 0, 0)
@@ -813,7 +932,7 @@ class ComposerTab(QWidget):
         alignment_label = QLabel("ALIGNMENT")
         self._apply_overline_style(alignment_label)
         self.alignment_combo = QComboBox()
-        self.alignment_combo.addItems(["Left", "Center", "Right"])
+        self.alignment_combo.addItems(self._ALIGNMENTS)
         self.alignment_combo.setCurrentIndex(1)  # Default to Center
         self.alignment_combo.currentIndexChanged.connect(self.update_alignment)
         self.apply_input_style(self.alignment_combo)
@@ -825,7 +944,21 @@ class ComposerTab(QWidget):
         
         controls_layout.addLayout(position_grid)
         
-        # Right Panel - Preview
+        # Right Panel - Preview (built on first show, see _ensure_preview_built)
+        self._preview_placeholder = QWidget()
+        self._subtitle_section_layout = main_layout
+
+        # Add to main layout
+        main_layout.addWidget(controls_group)
+        main_layout.addWidget(self._preview_placeholder)
+        
+        return container
+        
+    def _ensure_preview_built(self) -> None:
+        """Build the subtitle preview panel the first time the tab is shown."""
+        if hasattr(self, "preview_label"):
+            return
+
         preview_group = QGroupBox()
         self._apply_group_style(preview_group)
         
@@ -834,7 +967,7 @@ class ComposerTab(QWidget):
         
         # Preview header
         preview_title = QLabel("Preview")
-        preview_title.setFont(QFont("Space Grotesk", 14, QFont.Bold))
+        preview_title.setFont(self._section_font)
         self._apply_section_title_style(preview_title)
         preview_layout.addWidget(preview_title)
 
@@ -846,7 +979,7 @@ class ComposerTab(QWidget):
         preview_frame_layout = QVBoxLayout(self.preview_frame)
         preview_frame_layout.setAlignment(Qt.AlignCenter)
         
-        self.preview_label = QLabel(self.preview_text)
+        self.preview_label = QLabel(self._subtitle_state.preview_text)
         self.preview_label.setAlignment(Qt.AlignCenter)
         self.preview_label.setWordWrap(True)
         self.update_preview_style()
@@ -858,15 +991,15 @@ class ComposerTab(QWidget):
         preset_layout = QHBoxLayout()
         
         preset_vi_btn = QPushButton("Tiếng Việt")
-        preset_vi_btn.clicked.connect(lambda: self.set_preview_text("Xin chào! Đây là phụ đề mẫu."))
+        preset_vi_btn.clicked.connect(partial(self.set_preview_text, "Xin chào! Đây là phụ đề mẫu."))
         self.apply_button_style(preset_vi_btn, "preset", "small")
         
         preset_en_btn = QPushButton("English")
-        preset_en_btn.clicked.connect(lambda: self.set_preview_text("Hello! This is a sample subtitle."))
+        preset_en_btn.clicked.connect(partial(self.set_preview_text, "Hello! This is a sample subtitle."))
         self.apply_button_style(preset_en_btn, "preset", "small")
         
         preset_clear_btn = QPushButton("Clear")
-        preset_clear_btn.clicked.connect(lambda: self.set_preview_text(""))
+        preset_clear_btn.clicked.connect(partial(self.set_preview_text, ""))
         self.apply_button_style(preset_clear_btn, "preset", "small")
         
         preset_layout.addWidget(preset_vi_btn)
@@ -875,78 +1008,97 @@ class ComposerTab(QWidget):
         preset_layout.addStretch()
         
         preview_layout.addLayout(preset_layout)
-        
-        # Add to main layout
-        main_layout.addWidget(controls_group)
-        main_layout.addWidget(preview_group)
-        
-        return container
-        
-    def create_directory_input(self, label_text, placeholder):
-        """Create a directory input layout"""
-        layout = QVBoxLayout()
-        layout.setSpacing(8)
 
-        label = QLabel(label_text)
-        self._apply_overline_style(label)
-
-        input_layout = QHBoxLayout()
-        line_edit = QLineEdit()
-        line_edit.setPlaceholderText(placeholder)
-
-        browse_btn = QPushButton("Browse")
-        self.apply_button_style(browse_btn, "outline", "small")
+        self._subtitle_section_layout.replaceWidget(self._preview_placeholder, preview_group)
+        self._preview_placeholder.deleteLater()
+        self._preview_placeholder = None
 
-        self.apply_input_style(line_edit)
-        
-        input_layout.addWidget(line_edit)
-        input_layout.addWidget(browse_btn)
-        
-        layout.addWidget(label)
-        layout.addLayout(input_layout)
-        
-        return (layout, line_edit, browse_btn)
-
-    def create_file_input(self, label_text, placeholder):
-        """Create a file input layout for logo selection"""
-        layout = QVBoxLayout()
-        layout.setSpacing(8)
-
-        label = QLabel(label_text)
-        self._apply_overline_style(label)
-
-        input_layout = QHBoxLayout()
-        line_edit = QLineEdit()
-        line_edit.setPlaceholderText(placeholder)
-
-        browse_btn = QPushButton("Browse")
-        self.apply_button_style(browse_btn, "outline", "small")
-
-        self.apply_input_style(line_edit)
-        
-        input_layout.addWidget(line_edit)
-        input_layout.addWidget(browse_btn)
-        
-        layout.addWidget(label)
-        layout.addLayout(input_layout)
-        
-        return (layout, line_edit, browse_btn)
+    def _ensure_sections_built(self) -> None:
+        """Build the filter, subtitle styling and preview sections on first show."""
+        if not self._section_placeholders:
+            return
+        # Swap the sections in behind a single repaint/relayout instead of
+        # one per inserted widget tree.
+        self.setUpdatesEnabled(False)
+        try:
+            for placeholder, factory in self._section_placeholders:
+                self._sections_layout.replaceWidget(placeholder, getattr(self, factory)())
+                placeholder.deleteLater()
+            self._section_placeholders = []
+            # The preview slot lives inside the subtitle section; fill it in
+            # the same frozen pass rather than relayouting a second time.
+            self._ensure_preview_built()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.updateGeometry()
+
+    def showEvent(self, event) -> None:
+        self._ensure_sections_built()
+        self._warm_up_composer()
+        super().showEvent(event)
+
+    @property
+    def video_composer(self) -> VideoComposer:
+        """The tab's composer, built in place if the warm-up has not landed yet."""
+        if self._video_composer is None:
+            self._video_composer = VideoComposer()
+        return self._video_composer
+
+    def _warm_up_composer(self) -> None:
+        if self._video_composer is not None or self._composer_loading:
+            return
+        self._composer_loading = True
+        loader = ComposerLoader()
+        loader.finished.connect(self._handle_composer_ready, Qt.QueuedConnection)
+        loader.error.connect(self._handle_composer_failed, Qt.QueuedConnection)
+        self._start_thread(loader)
+
+    def _handle_composer_ready(self, composer: VideoComposer) -> None:
+        self._composer_loading = False
+        if self._video_composer is None:
+            self._video_composer = composer
+
+    def _handle_composer_failed(self, _message: str) -> None:
+        # Leave the composer unset: the next show retries the warm-up and
+        # a render builds one in place, reporting the failure then.
+        self._composer_loading = False
 
     def browse_logo_file(self):
         """Browse for logo file"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, 
-            "Select Logo File", 
-            "", 
-            "Image Files (*.png *.jpg *.jpeg *.svg *.bmp *.gif)"
+        file_path = self._pick_path(
+            "Select Logo File",
+            QFileDialog.ExistingFile,
+            "Image Files (*.png *.jpg *.jpeg *.svg *.bmp *.gif)",
         )
         if file_path:
             self.logo_file.setText(file_path)
 
+    def _pick_path(
+        self,
+        title: str,
+        mode: QFileDialog.FileMode = QFileDialog.Directory,
+        name_filter: str = "",
+    ) -> Optional[str]:
+        """Run the shared file dialog and return the selected path, if any."""
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+
+        dialog = self._file_dialog
+        dialog.setWindowTitle(title)
+        dialog.setFileMode(mode)
+        dialog.setOption(QFileDialog.ShowDirsOnly, mode == QFileDialog.Directory)
+        dialog.setNameFilter(name_filter)
+        if dialog.exec() != QDialog.Accepted:
+            return None
+
+        selected = dialog.selectedFiles()
+        return selected[0] if selected else None
+
     def set_logo_position(self, x: int, y: int):
         """Set logo position from preset buttons"""
-        self.logo_x.setValue(x)
-        self.logo_y.setValue(y)
+        with QSignalBlocker(self.logo_x), QSignalBlocker(self.logo_y):
+            self.logo_x.setValue(x)
+            self.logo_y.setValue(y)
 
     # ------------------------------------------------------------------
     # Render helpers
@@ -967,88 +1119,125 @@ class ComposerTab(QWidget):
 
         return audio_dir, image_dir, subtitle_dir, output_dir
 
+    def _snapshot_inputs(self) -> Dict[str, object]:
+        """Read every render control once into a plain dict."""
+        sync_mode = None
+        if hasattr(self, "sync_mode_combo") and self.sync_mode_combo:
+            sync_mode = self.sync_mode_combo.currentData()
+
+        return {
+            "frame_rate": self.frame_rate.text().strip(),
+            "audio_bitrate": self.audio_bitrate.text().strip(),
+            "video_bitrate": self.video_bitrate.text().strip(),
+            "video_codec": self.video_codec.currentText(),
+            "resolution": (self.resolution_width.value(), self.resolution_height.value()),
+            "burn_subtitles": self.burn_subtitles.isChecked(),
+            "use_hardware": self.use_hardware_checkbox.isChecked(),
+            "text_color": self.text_color_input.text().strip(),
+            "outline_color": self.outline_color_input.text().strip(),
+            "margin_bottom": self.margin_bottom_input.value(),
+            "alignment": self.alignment_combo.currentIndex(),
+            "animation_type": self.animation_type_combo.currentData(),
+            "animation_intensity": self.animation_intensity_combo.currentData(),
+            "transition_type": self.transition_type_combo.currentData(),
+            "transition_duration": self.transition_duration_spin.value(),
+            "video_filters": [
+                str(cb.property("filter_id"))
+                for cb in self.video_filter_checkboxes
+                if cb.isChecked() and cb.property("filter_id")
+            ],
+            "audio_filters": [
+                str(cb.property("filter_id"))
+                for cb in self.audio_filter_checkboxes
+                if cb.isChecked() and cb.property("filter_id")
+            ],
+            "music_directory": self.music_directory.text().strip(),
+            "sync_mode": sync_mode,
+            "logo_file": self.logo_file.text().strip(),
+            "logo_checked": self.enable_logo.isChecked(),
+            "logo_size": self.logo_size.value(),
+            "logo_opacity": self.logo_opacity.value(),
+            "logo_x": self.logo_x.value(),
+            "logo_y": self.logo_y.value(),
+            "logo_remove_background": self.remove_background.isChecked(),
+        }
+
     def _collect_render_options(self) -> RenderOptions:
+        values = self._snapshot_inputs()
+        # Font, size, outline and spacing are already tracked by the
+        # subtitle state through change signals; no need to re-read them.
+        model = self._subtitle_state
+
         try:
-            frame_rate = float(self.frame_rate.text().strip() or 30.0)
+            frame_rate = float(values["frame_rate"] or 30.0)
         except ValueError:
             frame_rate = 30.0
 
-        audio_bitrate = self.audio_bitrate.text().strip() or "192k"
-        video_bitrate = self.video_bitrate.text().strip() or "8000k"
-        video_codec = "hevc" if "HEVC" in self.video_codec.currentText() else "h264"
+        audio_bitrate = values["audio_bitrate"] or "192k"
+        video_bitrate = values["video_bitrate"] or "8000k"
+        video_codec = "hevc" if "HEVC" in values["video_codec"] else "h264"
 
         subtitle_style = SubtitleStyle(
-            font_name=self.font_combo.currentText(),
-            font_size=self.font_size_input.value(),
-            primary_color=self.text_color_input.text().strip() or self.text_color,
-            outline_color=self.outline_color_input.text().strip() or self.outline_color,
-            outline_width=float(self.outline_width_input.value()),
-            letter_spacing=float(self.letter_spacing_input.value()),
-            margin_bottom=self.margin_bottom_input.value(),
-            alignment=self.alignment_combo.currentIndex() + 1,  # Convert to ASS alignment (1, 2, 3)
+            font_name=model.font_family,
+            font_size=model.font_size,
+            primary_color=values["text_color"] or model.text_color,
+            outline_color=values["outline_color"] or model.outline_color,
+            outline_width=float(model.outline_width),
+            letter_spacing=float(model.letter_spacing),
+            margin_bottom=values["margin_bottom"],
+            alignment=values["alignment"] + 1,  # Convert to ASS alignment (1, 2, 3)
         )
 
         animation = AnimationSettings(
-            type=self.animation_type_combo.currentData() or "none",
-            intensity=self.animation_intensity_combo.currentData() or "medium",
+            type=values["animation_type"] or "none",
+            intensity=values["animation_intensity"] or "medium",
         )
 
         transition = TransitionSettings(
-            type=self.transition_type_combo.currentData() or "none",
-            duration=float(self.transition_duration_spin.value()),
+            type=values["transition_type"] or "none",
+            duration=float(values["transition_duration"]),
         )
 
-        video_filters = [
-            str(cb.property("filter_id"))
-            for cb in self.video_filter_checkboxes
-            if cb.isChecked() and cb.property("filter_id")
-        ]
-        audio_filters = [
-            str(cb.property("filter_id"))
-            for cb in self.audio_filter_checkboxes
-            if cb.isChecked() and cb.property("filter_id")
-        ]
-
-        resolution = (self.resolution_width.value(), self.resolution_height.value())
-
-        # Collect background music directory
-        music_dir = self.music_directory.text().strip() or None
-        
-        # Collect logo settings
-        logo_file = self.logo_file.text().strip() or None
-        logo_enabled = self.enable_logo.isChecked() and bool(logo_file)
-
-        sync_mode_value = "standard"
-        if hasattr(self, "sync_mode_combo") and self.sync_mode_combo:
-            sync_mode_value = self.sync_mode_combo.currentData() or "standard"
+        logo_file = values["logo_file"] or None
 
         return RenderOptions(
             frame_rate=frame_rate,
-            resolution=resolution,
+            resolution=values["resolution"],
             video_codec=video_codec,
             video_bitrate=video_bitrate,
             audio_bitrate=audio_bitrate,
-            burn_subtitles=self.burn_subtitles.isChecked(),
+            burn_subtitles=values["burn_subtitles"],
             subtitle_style=subtitle_style,
             animation=animation,
             transition=transition,
-            use_hardware_acceleration=self.use_hardware_checkbox.isChecked(),
-            video_filters=video_filters,
-            audio_filters=audio_filters,
-            sync_mode=sync_mode_value,
+            use_hardware_acceleration=values["use_hardware"],
+            video_filters=values["video_filters"],
+            audio_filters=values["audio_filters"],
+            sync_mode=values["sync_mode"] or "standard",
             # Background music
-            background_music_directory=music_dir,
+            background_music_directory=values["music_directory"] or None,
             # Logo settings
             logo_file=logo_file,
-            logo_enabled=logo_enabled,
-            logo_size=self.logo_size.value(),
-            logo_opacity=self.logo_opacity.value(),
-            logo_x=self.logo_x.value(),
-            logo_y=self.logo_y.value(),
-            logo_remove_background=self.remove_background.isChecked(),
+            logo_enabled=values["logo_checked"] and bool(logo_file),
+            logo_size=values["logo_size"],
+            logo_opacity=values["logo_opacity"],
+            logo_x=values["logo_x"],
+            logo_y=values["logo_y"],
+            logo_remove_background=values["logo_remove_background"],
         )
 
     def _prompt_combined_filename(self, suggestion: str) -> Optional[str]:
+        if self._combined_name_dialog is None:
+            self._build_combined_name_dialog()
+
+        self._combined_name_input.setText(suggestion)
+        self._combined_name_input.selectAll()
+        self._combined_name_input.setFocus()
+        if self._combined_name_dialog.exec() != QDialog.Accepted:
+            return None
+        return self._combined_name_input.text().strip()
+
+    def _build_combined_name_dialog(self) -> None:
         dialog = QDialog(self)
         dialog.setWindowTitle("Name Final Video")
         dialog.setModal(True)
@@ -1062,30 +1251,22 @@ class ComposerTab(QWidget):
         layout.addWidget(label)
 
         line_edit = QLineEdit()
-        line_edit.setText(suggestion)
         layout.addWidget(line_edit)
 
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         layout.addWidget(buttons)
 
-        accepted = {'result': None}
+        buttons.accepted.connect(self._accept_combined_name)
+        buttons.rejected.connect(dialog.reject)
 
-        def accept():
-            text = line_edit.text().strip()
-            if not text:
-                QMessageBox.warning(dialog, "Name Required", "Please enter a file name.")
-                return
-            accepted['result'] = text
-            dialog.accept()
+        self._combined_name_dialog = dialog
+        self._combined_name_input = line_edit
 
-        def reject():
-            dialog.reject()
-
-        buttons.accepted.connect(accept)
-        buttons.rejected.connect(reject)
-
-        dialog.exec()
-        return accepted['result']
+    def _accept_combined_name(self) -> None:
+        if not self._combined_name_input.text().strip():
+            QMessageBox.warning(self._combined_name_dialog, "Name Required", "Please enter a file name.")
+            return
+        self._combined_name_dialog.accept()
 
     def _start_thread(self, worker: QObject) -> None:
         thread = QThread(self)
@@ -1097,7 +1278,9 @@ class ComposerTab(QWidget):
         worker.error.connect(worker.deleteLater)
         thread.finished.connect(lambda: self._finalize_thread(thread, worker))
         thread.finished.connect(thread.deleteLater)
-        thread.start()
+        # The worker mostly waits on FFmpeg; a higher priority keeps its
+        # progress callbacks from queuing behind GUI work.
+        thread.start(QThread.HighPriority)
         self._threads.append(thread)
         self._workers.append(worker)
 
@@ -1109,12 +1292,28 @@ class ComposerTab(QWidget):
         # Worker deleted via deleteLater connection once thread stops.
 
     def _handle_render_progress(self, stage: str, ratio: float, message: str) -> None:
+        # Only remember the latest tick; _flush_render_progress paints it on
+        # the next timer interval so fast renders cannot flood the GUI thread.
         if message:
-            percent = max(0, min(int(ratio * 100), 100))
-            status_text = f"{message} ({percent}%)"
-            self.render_status.setText(status_text)
-            if self._progress_dialog:
-                self._progress_dialog.update_status(status_text, ratio)
+            self._pending_progress = (message, ratio)
+
+    def _flush_render_progress(self) -> None:
+        pending = self._pending_progress
+        if pending is None:
+            return
+        self._pending_progress = None
+
+        message, ratio = pending
+        percent = max(0, min(int(ratio * 100), 100))
+        status_text = f"{message} ({percent}%)"
+        # Progress arrives far more often than the whole-percent text
+        # changes; skip the relayout when nothing visible would change.
+        if status_text == self._last_status_text:
+            return
+        self._last_status_text = status_text
+        self.render_status.setText(status_text)
+        if self._progress_dialog:
+            self._progress_dialog.update_status(status_text, ratio)
 
     def _handle_render_finished(self, result: RenderBatchResult, mode: str) -> None:
         self._close_progress_dialog()
@@ -1138,14 +1337,7 @@ class ComposerTab(QWidget):
         lines: List[str] = []
         if result.scenes:
             lines.append("✅ Scene clips:")
-            for item in result.scenes:
-                prefix = "📁" if item.success else "⚠️"
-                name = Path(item.output_path).name if item.output_path else "(failed)"
-                duration = f"{item.duration:.2f}s" if item.duration else "--"
-                if item.success:
-                    lines.append(f"{prefix} {name} • {duration}")
-                else:
-                    lines.append(f"{prefix} {name} — {item.error}")
+            lines.extend(map(self._format_scene_line, result.scenes))
             lines.append("")
 
         if result.combined:
@@ -1154,17 +1346,32 @@ class ComposerTab(QWidget):
                 lines.append(f"🎬 Combined video: {name} • {result.combined.duration:.2f}s")
             else:
                 lines.append(f"⚠️ Combined video failed: {result.combined.error}")
+        lines.extend(f"⚠️ {warning}" for warning in result.warnings)
 
         if not lines:
             lines.append("Không có video nào được tạo.")
 
-        self.render_results.setPlainText("\n".join(lines))
+        panel = self.render_results
+        wrap_mode = panel.lineWrapMode()
+        panel.setUpdatesEnabled(False)
+        panel.setLineWrapMode(QTextEdit.NoWrap)
+        panel.setPlainText("\n".join(lines))
+        panel.setLineWrapMode(wrap_mode)
+        panel.setUpdatesEnabled(True)
         self.render_results.show()
 
         if self._last_output_dir:
             dialog = CompletionDialog(status, self._last_output_dir, self)
             dialog.exec()
 
+    @staticmethod
+    def _format_scene_line(item) -> str:
+        name = Path(item.output_path).name if item.output_path else "(failed)"
+        if not item.success:
+            return f"⚠️ {name} — {item.error}"
+        duration = f"{item.duration:.2f}s" if item.duration else "--"
+        return f"📁 {name} • {duration}"
+
     def _handle_render_error(self, message: str) -> None:
         self._close_progress_dialog()
         self.render_individual_btn.setEnabled(True)
@@ -1174,6 +1381,9 @@ class ComposerTab(QWidget):
 
     def _open_progress_dialog(self, message: str) -> None:
         self._close_progress_dialog()
+        self._last_status_text = None
+        self._pending_progress = None
+        self._progress_timer.start()
         dialog = ProgressDialog(self)
         dialog.update_status(message, 0.0)
         dialog.cancel_button.setEnabled(False)
@@ -1181,42 +1391,15 @@ class ComposerTab(QWidget):
         self._progress_dialog = dialog
 
     def _close_progress_dialog(self) -> None:
+        self._progress_timer.stop()
+        self._pending_progress = None
         if self._progress_dialog:
             self._progress_dialog.close()
             self._progress_dialog = None
+
     def apply_input_style(self, widget):
         """Apply consistent input styling"""
-        palette = UnifiedStyles.palette()
-        widget.setStyleSheet(
-            f"""
-            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {{
-                background-color: {palette.surface};
-                border: 1px solid {palette.outline_variant};
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: {palette.text_primary};
-                font-size: 12px;
-            }}
-            QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus {{
-                border-color: {palette.primary};
-                background-color: {palette.surface_bright};
-                outline: none;
-            }}
-            QComboBox::drop-down {{ border: none; }}
-            QComboBox::down-arrow {{ width: 0px; height: 0px; }}
-            QSpinBox::up-button,
-            QSpinBox::down-button,
-            QDoubleSpinBox::up-button,
-            QDoubleSpinBox::down-button {{
-                background: transparent;
-                border: none;
-                width: 14px;
-            }}
-        """
-        )
-
-        if widget not in self._input_widgets:
-            self._input_widgets.append(widget)
+        widget.setProperty("role", "input")
 
         if isinstance(widget, (QComboBox, QSpinBox, QDoubleSpinBox)):
             self._disable_wheel_event(widget)
@@ -1224,21 +1407,28 @@ class ComposerTab(QWidget):
     def _disable_wheel_event(self, widget: QWidget) -> None:
         """Ignore wheel events unless the user is actively interacting."""
         widget.setFocusPolicy(Qt.StrongFocus)
-        widget.installEventFilter(self)
+        widget.setProperty("_no_wheel", True)
+        if not self._wheel_filter_installed:
+            app = QApplication.instance()
+            if app is not None:
+                app.installEventFilter(self)
+                self._wheel_filter_installed = True
 
     def eventFilter(self, source: QObject, event: QEvent) -> bool:
-        blocked_types = (QComboBox, QSpinBox, QDoubleSpinBox)
-
-        if event.type() == QEvent.Type.Wheel and isinstance(source, blocked_types):
-            if isinstance(source, QComboBox):
-                view = source.view()
-                if view and view.isVisible():
-                    return super().eventFilter(source, event)
+        # Single application-wide filter: bail out before touching the
+        # source for anything that is not a wheel event.
+        if event.type() != QEvent.Type.Wheel:
+            return False
+        if not isinstance(source, QWidget) or not source.property("_no_wheel"):
+            return False
 
-            event.ignore()
-            return True
+        if isinstance(source, QComboBox):
+            view = source.view()
+            if view and view.isVisible():
+                return False
 
-        return super().eventFilter(source, event)
+        event.ignore()
+        return True
 
     def apply_button_style(self, button, color_scheme="primary", size="medium"):
         scheme_map = {
@@ -1249,14 +1439,78 @@ class ComposerTab(QWidget):
             "outline": "outline",
         }
         UnifiedStyles.apply_button_style(button, scheme_map.get(color_scheme, color_scheme), size)
-        if all(button is not btn for btn, _, __ in self._button_configs):
-            self._button_configs.append((button, color_scheme, size))
 
     def _apply_group_style(self, group: QGroupBox) -> None:
+        group.setProperty("role", "panel")
+
+    def _apply_header_label_style(self, label: QLabel) -> None:
+        label.setProperty("role", "header")
+
+    def _apply_section_title_style(self, label: QLabel) -> None:
+        label.setProperty("role", "section-title")
+
+    def _apply_overline_style(self, label: QLabel) -> None:
+        label.setProperty("role", "overline")
+
+    def _apply_caption_style(self, label: QLabel) -> None:
+        label.setProperty("role", "caption")
+
+    def _apply_status_style(self, label: QLabel) -> None:
+        label.setProperty("role", "status")
+
+    def _apply_text_panel_style(self, panel: QTextEdit) -> None:
+        panel.setProperty("role", "text-panel")
+
+    def _apply_checkbox_style(self, checkbox: QCheckBox) -> None:
+        checkbox.setProperty("role", "option")
+
+    def _apply_color_button_style(self, button: QPushButton, color: str) -> None:
+        # Theme refreshes and repeated picks usually produce the same sheet;
+        # skip the QSS parse and re-polish when nothing changed.
+        style = self._COLOR_BUTTON_QSS % (color, UnifiedStyles.palette().outline_variant)
+        if style != button.styleSheet():
+            button.setStyleSheet(style)
+
+    def _apply_preview_frame_style(self) -> None:
+        self.preview_frame.setProperty("role", "preview")
+
+    def _apply_info_frame_style(self, frame: QFrame) -> None:
+        frame.setProperty("role", "info")
+
+    def _role_stylesheet(self) -> str:
+        """Tab-wide rules for widgets tagged with a ``role`` property.
+
+        Installed once on the tab root (see ``refresh_theme``) so Qt parses
+        the styles a single time instead of once per widget.
+        """
         palette = UnifiedStyles.palette()
-        group.setStyleSheet(
-            f"""
-            QGroupBox {{
+        return f"""
+            QLineEdit[role="input"], QComboBox[role="input"],
+            QSpinBox[role="input"], QDoubleSpinBox[role="input"] {{
+                background-color: {palette.surface};
+                border: 1px solid {palette.outline_variant};
+                border-radius: 8px;
+                padding: 8px 12px;
+                color: {palette.text_primary};
+                font-size: 12px;
+            }}
+            QLineEdit[role="input"]:focus, QComboBox[role="input"]:focus,
+            QSpinBox[role="input"]:focus, QDoubleSpinBox[role="input"]:focus {{
+                border-color: {palette.primary};
+                background-color: {palette.surface_bright};
+                outline: none;
+            }}
+            QComboBox[role="input"]::drop-down {{ border: none; }}
+            QComboBox[role="input"]::down-arrow {{ width: 0px; height: 0px; }}
+            QSpinBox[role="input"]::up-button,
+            QSpinBox[role="input"]::down-button,
+            QDoubleSpinBox[role="input"]::up-button,
+            QDoubleSpinBox[role="input"]::down-button {{
+                background: transparent;
+                border: none;
+                width: 14px;
+            }}
+            QGroupBox[role="panel"] {{
                 border: 1.5px solid {palette.outline};
                 border-radius: 12px;
                 background-color: {palette.surface};
@@ -1264,7 +1518,7 @@ class ComposerTab(QWidget):
                 margin-top: 8px;
                 font-weight: 600;
             }}
-            QGroupBox::title {{
+            QGroupBox[role="panel"]::title {{
                 subcontrol-origin: margin;
                 subcontrol-position: top left;
                 left: 16px;
@@ -1273,64 +1527,31 @@ class ComposerTab(QWidget):
                 background-color: {palette.surface};
                 color: {palette.text_primary};
             }}
-        """
-        )
-        if group not in self._group_boxes:
-            self._group_boxes.append(group)
-
-    def _apply_header_label_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(
-            f"""
-            color: {palette.text_muted};
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-            font-weight: 700;
-            font-size: 11px;
-            margin-bottom: 16px;
-        """
-        )
-        if label not in self._header_labels:
-            self._header_labels.append(label)
-
-    def _apply_section_title_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(f"color: {palette.text_primary}; font-weight: 600; font-size: 15px; line-height: 1.4;")
-        if label not in self._section_titles:
-            self._section_titles.append(label)
-
-    def _apply_overline_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(
-            f"""
-            color: {palette.text_muted};
-            font-size: 11px;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            margin-bottom: 6px;
-        """
-        )
-        if label not in self._overline_labels:
-            self._overline_labels.append(label)
-
-    def _apply_caption_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(f"color: {palette.text_secondary}; font-size: 12px; line-height: 1.5;")
-        if label not in self._caption_labels:
-            self._caption_labels.append(label)
-
-    def _apply_status_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(f"color: {palette.primary_alt}; font-size: 12px;")
-        if label not in self._status_labels:
-            self._status_labels.append(label)
-
-    def _apply_text_panel_style(self, panel: QTextEdit) -> None:
-        palette = UnifiedStyles.palette()
-        panel.setStyleSheet(
-            f"""
-            QTextEdit {{
+            QLabel[role="header"] {{
+                color: {palette.text_muted};
+                text-transform: uppercase;
+                letter-spacing: 0.1em;
+                font-weight: 700;
+                font-size: 11px;
+                margin-bottom: 16px;
+            }}
+            QLabel[role="section-title"] {{
+                color: {palette.text_primary};
+                font-weight: 600;
+                font-size: 15px;
+                line-height: 1.4;
+            }}
+            QLabel[role="overline"] {{
+                color: {palette.text_muted};
+                font-size: 11px;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 0.08em;
+                margin-bottom: 6px;
+            }}
+            QLabel[role="caption"] {{ color: {palette.text_secondary}; font-size: 12px; line-height: 1.5; }}
+            QLabel[role="status"] {{ color: {palette.primary_alt}; font-size: 12px; }}
+            QTextEdit[role="text-panel"] {{
                 background-color: {palette.surface_container};
                 border: 1.5px solid {palette.outline};
                 border-radius: 8px;
@@ -1340,168 +1561,92 @@ class ComposerTab(QWidget):
                 line-height: 1.5;
                 font-family: 'SF Mono', 'Monaco', 'Consolas', monospace;
             }}
-        """
-        )
-        if panel not in self._text_panels:
-            self._text_panels.append(panel)
-
-    def _apply_checkbox_style(self, checkbox: QCheckBox) -> None:
-        palette = UnifiedStyles.palette()
-        checkbox.setStyleSheet(
-            f"""
-            QCheckBox {{
+            QCheckBox[role="option"] {{
                 color: {palette.text_secondary};
                 font-size: 13px;
                 font-weight: 500;
                 spacing: 8px;
             }}
-            QCheckBox::indicator {{
+            QCheckBox[role="option"]::indicator {{
                 width: 18px;
                 height: 18px;
                 border: 1.5px solid {palette.outline};
                 border-radius: 4px;
                 background-color: {palette.surface};
             }}
-            QCheckBox::indicator:hover {{
-                border-color: {palette.primary};
-            }}
-            QCheckBox::indicator:checked {{
+            QCheckBox[role="option"]::indicator:hover {{ border-color: {palette.primary}; }}
+            QCheckBox[role="option"]::indicator:checked {{
                 background-color: {palette.primary};
                 border-color: {palette.primary};
             }}
-            QCheckBox::indicator:checked:hover {{
-                background-color: {palette.primary_alt};
-            }}
-        """
-        )
-        if checkbox not in self._checkboxes:
-            self._checkboxes.append(checkbox)
-
-    def _apply_color_button_style(self, button: QPushButton, color: str) -> None:
-        palette = UnifiedStyles.palette()
-        button.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: {color};
-                border: 1px solid {palette.outline_variant};
-                border-radius: 6px;
-            }}
-        """
-        )
-        if button not in self._color_buttons:
-            self._color_buttons.append(button)
-
-    def _apply_preview_frame_style(self) -> None:
-        palette = UnifiedStyles.palette()
-        self.preview_frame.setStyleSheet(
-            f"""
-            QFrame {{
+            QCheckBox[role="option"]::indicator:checked:hover {{ background-color: {palette.primary_alt}; }}
+            QFrame[role="bare"] {{ background-color: transparent; border: none; }}
+            QFrame[role="preview"] {{
                 background-color: {palette.surface_dim};
                 border: 1px solid {palette.outline_variant};
                 border-radius: 12px;
             }}
-        """
-        )
-
-    def _apply_info_frame_style(self, frame: QFrame) -> None:
-        palette = UnifiedStyles.palette()
-        frame.setStyleSheet(
-            f"""
-            QFrame {{
+            QFrame[role="info"] {{
                 background-color: {palette.surface_container};
                 border: 1.5px solid {palette.outline};
                 border-radius: 8px;
                 padding: 14px;
             }}
         """
-        )
-        if frame not in self._info_frames:
-            self._info_frames.append(frame)
 
     def refresh_theme(self) -> None:
         """Reapply palette-driven styles when theme changes."""
-        UnifiedStyles.refresh_stylesheet(self)
-        for group in self._group_boxes:
-            self._apply_group_style(group)
-
-        for label in self._header_labels:
-            self._apply_header_label_style(label)
-
-        for label in self._section_titles:
-            self._apply_section_title_style(label)
-
-        for label in self._overline_labels:
-            self._apply_overline_style(label)
-
-        for label in self._caption_labels:
-            self._apply_caption_style(label)
-
-        for label in self._status_labels:
-            self._apply_status_style(label)
-
-        for panel in self._text_panels:
-            self._apply_text_panel_style(panel)
-
-        for checkbox in self._checkboxes:
-            self._apply_checkbox_style(checkbox)
-
-        for frame in self._info_frames:
-            self._apply_info_frame_style(frame)
-
-        if hasattr(self, "preview_frame"):
-            self._apply_preview_frame_style()
-        if hasattr(self, "text_color_btn"):
-            self._apply_color_button_style(self.text_color_btn, self.text_color)
-        if hasattr(self, "outline_color_btn"):
-            self._apply_color_button_style(self.outline_color_btn, self.outline_color)
-
-        for widget in self._input_widgets:
-            self.apply_input_style(widget)
-
-        for button, scheme, size in self._button_configs:
-            self.apply_button_style(button, scheme, size)
+        palette = UnifiedStyles.palette()
+        if palette == self._applied_palette:
+            # Same theme as last time: re-setting identical sheets would
+            # still re-polish every widget in the tab.
+            return
+        self._applied_palette = palette
+        # One sheet on the root covers every role-tagged child; Qt re-polishes
+        # the whole subtree from it. The swatches restyle in the same window
+        # with updates off, so the tab repaints once instead of per change.
+        self.setUpdatesEnabled(False)
+        try:
+            self.setStyleSheet(UnifiedStyles.get_main_stylesheet() + self._role_stylesheet())
+            if hasattr(self, "text_color_btn"):
+                self._apply_color_button_style(self.text_color_btn, self._subtitle_state.text_color)
+            if hasattr(self, "outline_color_btn"):
+                self._apply_color_button_style(self.outline_color_btn, self._subtitle_state.outline_color)
+        finally:
+            self.setUpdatesEnabled(True)
 
     # Preview and styling methods
     def update_preview_text(self, text):
         """Update preview text"""
-        self.preview_text = text or "Type content to see preview"
-        self.preview_label.setText(self.preview_text)
+        self._subtitle_state.preview_text = text or _SubtitleState.preview_text
+        if hasattr(self, "preview_label"):
+            self.preview_label.setText(self._subtitle_state.preview_text)
         
     def set_preview_text(self, text):
         """Set preview text from preset buttons"""
-        self.preview_text_input.setText(text)
-        
-    def update_font_family(self, font):
-        """Update font family"""
-        self.font_family = font
-        self.update_preview_style()
-        
-    def update_font_size(self, size):
-        """Update font size"""
-        self.font_size = size
-        self.update_preview_style()
+        with QSignalBlocker(self.preview_text_input):
+            self.preview_text_input.setText(text)
+        self.update_preview_text(text)
         
+    def _bind_preview(self, signal, key: str, convert=None) -> None:
+        """Route a control's change signal into the subtitle state."""
+        signal.connect(partial(self._set_preview_value, key, convert))
+
+    def _set_preview_value(self, key: str, convert, value) -> None:
+        setattr(self._subtitle_state, key, convert(value) if convert else value)
+        self._preview_refresh_timer.start()
+
     def update_text_color(self, color):
         """Update text color"""
-        self.text_color = color
+        self._text_qcolor = QColor(color)
         self._apply_color_button_style(self.text_color_btn, color)
-        self.update_preview_style()
+        self._set_preview_value("text_color", None, color)
         
     def update_outline_color(self, color):
         """Update outline color"""
-        self.outline_color = color
+        self._outline_qcolor = QColor(color)
         self._apply_color_button_style(self.outline_color_btn, color)
-        self.update_preview_style()
-        
-    def update_outline_width(self, width):
-        """Update outline width"""
-        self.outline_width = float(width)
-        self.update_preview_style()
-        
-    def update_letter_spacing(self, spacing):
-        """Update letter spacing"""
-        self.letter_spacing = float(spacing)
-        self.update_preview_style()
+        self._set_preview_value("outline_color", None, color)
         
     def update_margin_bottom(self, margin):
         """Update subtitle margin from bottom"""
@@ -1514,71 +1659,60 @@ class ComposerTab(QWidget):
         
     def update_preview_style(self):
         """Update preview label style"""
-        # Build text shadow for outline effect
-        shadow_parts = []
-        if self.outline_width > 0:
-            offsets = [-self.outline_width, 0, self.outline_width]
-            for x in offsets:
-                for y in offsets:
-                    if x == 0 and y == 0:
-                        continue
-                    shadow_parts.append(f"{x}px {y}px 0px {self.outline_color}")
-        
-        text_shadow = ", ".join(shadow_parts) if shadow_parts else "none"
-        
-        style = f"""
-            QLabel {{
-                font-family: {self.font_family};
-                font-size: {self.font_size}px;
-                color: {self.text_color};
-                text-align: center;
-                line-height: 1.2;
-                letter-spacing: {self.letter_spacing}px;
-            }}
-        """
-        
-        self.preview_label.setStyleSheet(style)
+        if not hasattr(self, "preview_label"):
+            return
+        model = self._subtitle_state
+        style = self._PREVIEW_LABEL_QSS % (
+            model.font_family,
+            model.font_size,
+            model.text_color,
+            model.letter_spacing,
+        )
+        # Outline changes also land here but are not part of the sheet;
+        # an identical sheet would only re-polish the label for nothing.
+        if style != self.preview_label.styleSheet():
+            self.preview_label.setStyleSheet(style)
         
     def choose_text_color(self):
         """Open color dialog for text color"""
-        color = QColorDialog.getColor(QColor(self.text_color), self)
+        color = QColorDialog.getColor(self._text_qcolor, self)
         if color.isValid():
-            self.text_color = color.name()
-            self.text_color_input.setText(self.text_color)
-            self.update_text_color(self.text_color)
+            with QSignalBlocker(self.text_color_input):
+                self.text_color_input.setText(color.name())
+            self.update_text_color(color.name())
             
     def choose_outline_color(self):
         """Open color dialog for outline color"""
-        color = QColorDialog.getColor(QColor(self.outline_color), self)
+        color = QColorDialog.getColor(self._outline_qcolor, self)
         if color.isValid():
-            self.outline_color = color.name()
-            self.outline_color_input.setText(self.outline_color)
-            self.update_outline_color(self.outline_color)
+            with QSignalBlocker(self.outline_color_input):
+                self.outline_color_input.setText(color.name())
+            self.update_outline_color(color.name())
     
     # Event handlers
     def browse_audio_directory(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Audio Directory")
+        directory = self._pick_path("Select Audio Directory")
         if directory:
             self.audio_directory.setText(directory)
             
     def browse_image_directory(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Image Directory")
+        directory = self._pick_path("Select Image Directory")
         if directory:
             self.image_directory.setText(directory)
             
     def browse_subtitle_directory(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Subtitle Directory")
+        directory = self._pick_path("Select Subtitle Directory")
         if directory:
             self.subtitle_directory.setText(directory)
             
     def browse_output_directory(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Output Directory")
+        directory = self._pick_path("Select Output Directory")
         if directory:
             self.output_directory.setText(directory)
     
     def browse_music_directory(self):
         """Browse for background music directory"""
-        directory = QFileDialog.getExistingDirectory(self, "Select Background Music Directory")
+        directory = self._pick_path("Select Background Music Directory")
         if directory:
             self.music_directory.setText(directory)
     
@@ -1590,6 +1724,13 @@ class ComposerTab(QWidget):
 
         audio_dir, image_dir, subtitle_dir, output_dir = inputs
         options = self._collect_render_options()
+        # Scene clips are independent here, so encode several at once with
+        # a couple of FFmpeg threads each instead of one wide encode.
+        options.ffmpeg_threads = 2
+        options.max_parallel_scenes = max(1, (os.cpu_count() or 1) // options.ffmpeg_threads)
+        # Clips are short stills, so process and encoder start-up is a real
+        # share of each one; open it once per four clips instead.
+        options.scene_batch_size = 4
 
         self._active_mode = "individual"
         self._last_output_dir = Path(output_dir)
@@ -1610,6 +1751,7 @@ class ComposerTab(QWidget):
             mode="individual",
             create_individual=True,
             create_combined=False,
+            composer=self.video_composer,
         )
         worker.progress.connect(self._handle_render_progress, Qt.QueuedConnection)
         worker.finished.connect(self._handle_render_finished, Qt.QueuedConnection)
@@ -1634,6 +1776,10 @@ class ComposerTab(QWidget):
         if not filename.lower().endswith(".mp4"):
             filename += ".mp4"
         options.combined_filename = filename
+        keep_clips = self.keep_clips_checkbox.isChecked()
+        # Clips and the complete video from the same encode: each clip is
+        # teed straight into the final muxer instead of being re-read.
+        options.tee_output = keep_clips
 
         self._active_mode = "combined"
         self._last_output_dir = Path(output_dir)
@@ -1652,8 +1798,9 @@ class ComposerTab(QWidget):
             subtitle_directory=subtitle_dir,
             options=options,
             mode="combined",
-            create_individual=False,
+            create_individual=keep_clips,
             create_combined=True,
+            composer=self.video_composer,
         )
         worker.progress.connect(self._handle_render_progress, Qt.QueuedConnection)
         worker.finished.connect(self._handle_render_finished, Qt.QueuedConnection)
@@ -1688,10 +1835,11 @@ class ProgressDialog(QDialog):
         self._cancel_requested = False
 
     def update_status(self, message: str, ratio: float) -> None:
-        if message:
+        if message and message != self.message_label.text():
             self.message_label.setText(message)
         percent = max(0, min(int(ratio * 100), 100))
-        self.progress_bar.setValue(percent)
+        if percent != self.progress_bar.value():
+            self.progress_bar.setValue(percent)
 
     def cancel_requested(self) -> bool:
         return self._cancel_requested
@@ -1719,7 +1867,10 @@ class CompletionDialog(QDialog):
         layout.addWidget(label)
         
         self.open_button = QPushButton("Open Folder")
-        self.open_button.clicked.connect(lambda: self._open_dir(output_dir))
+        self.open_button.clicked.connect(partial(self._open_dir, output_dir))
+        # Check the folder once here rather than on click: on a network
+        # mount each stat can stall the GUI thread.
+        self.open_button.setEnabled(output_dir.is_dir())
         layout.addWidget(self.open_button, alignment=Qt.AlignRight)
 
         close_button = QPushButton("Close")
@@ -1727,5 +1878,19 @@ class CompletionDialog(QDialog):
         layout.addWidget(close_button, alignment=Qt.AlignRight)
 
     def _open_dir(self, directory: Path) -> None:
-        if directory.exists():
-            subprocess.Popen(["open", str(directory)])
+        # Existence was checked when the dialog was built; if the folder has
+        # gone since, the opener fails and we fall through to Qt.
+        opener = "open" if sys.platform == "darwin" else "xdg-open"
+        argv = [opener, str(directory)]
+        try:
+            if sys.platform == "win32":
+                os.startfile(str(directory))  # type: ignore[attr-defined]
+            elif hasattr(os, "posix_spawnp"):
+                # posix_spawn avoids fork() copying the page tables of the
+                # (large) Qt process just to exec a tiny helper.
+                pid = os.posix_spawnp(opener, argv, os.environ)
+                threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
+            else:
+                subprocess.Popen(argv)
+        except OSError:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(str(directory)))
@@ -2,19 +2,116 @@
 Effects Tab - Video composition với visual effects và transitions
 """
 
-from typing import List
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox,
     QLabel, QLineEdit, QPushButton, QComboBox, QSpinBox, QDoubleSpinBox, QCheckBox,
-    QTextEdit, QProgressBar, QFileDialog, QMessageBox, QScrollArea,
-    QColorDialog, QSlider, QFrame
+    QTextEdit, QPlainTextEdit, QProgressBar, QFileDialog, QMessageBox, QScrollArea,
+    QColorDialog, QSlider, QFrame, QSizePolicy, QDialog
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QFont, QColor, QPalette
+from PySide6.QtCore import Qt, QThread, Signal, QTimer, QObject, QRect, QSize
+from PySide6.QtGui import QFont, QColor, QPalette, QPainter, QFontMetrics
+
+from src.core.video_composer import (
+    AnimationSettings,
+    RenderBatchResult,
+    RenderOptions,
+    SubtitleStyle,
+    TransitionSettings,
+    VideoComposer,
+    VideoComposerError,
+)
+from src.ui.composer_tab import ComposerLoader, RenderWorker, create_form_layout
+from src.ui.unified_styles import ThemePalette, UnifiedStyles
+
+class _PreviewWorker(QObject):
+    """Scans and probes the project's inputs off the GUI thread."""
+
+    finished = Signal(object)
+    error = Signal(str)
+
+    def __init__(
+        self,
+        composer: VideoComposer,
+        audio_directory: str,
+        image_directory: str,
+        options: RenderOptions,
+    ) -> None:
+        super().__init__()
+        self._composer = composer
+        self._audio_directory = audio_directory
+        self._image_directory = image_directory
+        self._options = options
+
+    def run(self) -> None:
+        try:
+            summary = self._composer.preview_project(
+                self._audio_directory, self._image_directory, self._options
+            )
+        except (OSError, VideoComposerError) as exc:
+            self.error.emit(str(exc))
+            return
+        self.finished.emit(summary)
+
+
+class _SubtitlePreview(QWidget):
+    """Paints the subtitle sample with a cached QFont and QColor.
+
+    Painting directly keeps the tab stylesheet's font and colour rules
+    out of the way, so restyling is a couple of setters and a repaint
+    rather than a QSS parse and re-polish.
+    """
+
+    def __init__(self, text: str, parent=None) -> None:
+        super().__init__(parent)
+        self._text = text
+        self._font = QFont()
+        self._color = QColor("#FFFFFF")
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+
+    def set_font_family(self, family: str) -> None:
+        self._font.setFamily(family)
+        self._font_changed()
+
+    def set_pixel_size(self, size: int) -> None:
+        self._font.setPixelSize(size)
+        self._font_changed()
+
+    def set_letter_spacing(self, spacing: float) -> None:
+        self._font.setLetterSpacing(QFont.AbsoluteSpacing, spacing)
+        self._font_changed()
+
+    def _font_changed(self) -> None:
+        self.updateGeometry()
+        self.update()
+
+    def _text_bounds(self, width: int) -> QRect:
+        return QFontMetrics(self._font).boundingRect(
+            QRect(0, 0, width, 0), Qt.AlignCenter | Qt.TextWordWrap, self._text
+        )
+
+    def sizeHint(self) -> QSize:
+        return self._text_bounds(480).size()
+
+    def hasHeightForWidth(self) -> bool:
+        return True
+
+    def heightForWidth(self, width: int) -> int:
+        return self._text_bounds(width).height()
+
+    def set_color(self, color: str) -> None:
+        self._color.setNamedColor(color)
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.setFont(self._font)
+        painter.setPen(self._color)
+        painter.drawText(self.rect(), Qt.AlignCenter | Qt.TextWordWrap, self._text)
 
-from src.core.video_composer import VideoComposer
-from src.ui.unified_styles import UnifiedStyles
 
 class EffectsTab(QWidget):
     """Tab ghép & render video với visual effects và transitions"""
@@ -22,7 +119,11 @@ class EffectsTab(QWidget):
     def __init__(self):
         super().__init__()
         self.setObjectName("EffectsTabRoot")
-        self.video_composer = VideoComposer()
+        # Palette the tab was last styled with; see refresh_theme.
+        self._applied_palette: Optional[ThemePalette] = None
+        # Built by ComposerLoader once the tab is first shown; see video_composer.
+        self._video_composer: Optional[VideoComposer] = None
+        self._composer_loading = False
         
         # Subtitle styling state
         self.font_family = "Space Grotesk"
@@ -33,18 +134,25 @@ class EffectsTab(QWidget):
         self.letter_spacing = 0.0
         self.preview_text = "Type content to see preview"
         
-        self._group_boxes: List[QGroupBox] = []
-        self._header_labels: List[QLabel] = []
-        self._section_titles: List[QLabel] = []
-        self._overline_labels: List[QLabel] = []
-        self._caption_labels: List[QLabel] = []
-        self._status_labels: List[QLabel] = []
-        self._text_panels: List[QTextEdit] = []
-        self._input_widgets: List[QWidget] = []
-        self._button_configs: List[tuple] = []
-        self._checkboxes: List[QCheckBox] = []
-        self._color_buttons: List[QPushButton] = []
-        self._info_frames: List[QFrame] = []
+        # Shared by every header/section title; QFont is implicitly shared,
+        # so setFont() with the same instance skips a fresh font resolve.
+        self._header_font = QFont("Space Grotesk", 11, QFont.Bold)
+        self._section_font = QFont("Space Grotesk", 14, QFont.Bold)
+        self._last_log_line = ""
+        self._threads: List[QThread] = []
+        self._workers: List[QObject] = []
+        self._file_dialog: Optional[QFileDialog] = None
+        self._preview_values: Dict[str, object] = {}
+        # Inputs the running render was started with; the finish handlers
+        # report these rather than whatever the controls show by then.
+        self._render_values: Dict[str, object] = {}
+        self._render_active = False
+        # Held spinbox arrows fire valueChanged per step; only the value the
+        # user settles on reaches the preview.
+        self._preview_refresh_timer = QTimer(self)
+        self._preview_refresh_timer.setSingleShot(True)
+        self._preview_refresh_timer.setInterval(100)
+        self._preview_refresh_timer.timeout.connect(self._apply_pending_font_size)
 
         self.init_ui()
         self.refresh_theme()
@@ -70,7 +178,7 @@ class EffectsTab(QWidget):
         
         # Header
         header = QLabel("VISUAL EFFECTS & COMPOSITION")
-        header.setFont(QFont("Space Grotesk", 11, QFont.Bold))
+        header.setFont(self._header_font)
         self._apply_header_label_style(header)
         layout.addWidget(header)
         
@@ -82,19 +190,20 @@ class EffectsTab(QWidget):
         input_dirs_widget = self.create_input_directories_widget()
         directories_grid.addWidget(input_dirs_widget, 0, 0)
         
-        # Right column - Output settings
-        output_settings_widget = self.create_output_settings_widget()
-        directories_grid.addWidget(output_settings_widget, 0, 1)
-        
+        # Right column - Output settings, effects and subtitle styling are
+        # built on first show (see _ensure_sections_built)
+        self._section_placeholders: List[Tuple[QWidget, str]] = [
+            (QWidget(), "create_output_settings_widget"),
+            (QWidget(), "create_visual_effects_section"),
+            (QWidget(), "create_subtitle_styling_section"),
+        ]
+        self._sections_layout = layout
+        directories_grid.addWidget(self._section_placeholders[0][0], 0, 1)
+        self._directories_grid = directories_grid
+
         layout.addLayout(directories_grid)
-        
-        # Visual Effects section - NEW
-        effects_section = self.create_visual_effects_section()
-        layout.addWidget(effects_section)
-        
-        # Subtitle styling section
-        subtitle_section = self.create_subtitle_styling_section()
-        layout.addWidget(subtitle_section)
+        layout.addWidget(self._section_placeholders[1][0])
+        layout.addWidget(self._section_placeholders[2][0])
         
         # Two render buttons
         render_buttons_layout = QHBoxLayout()
@@ -120,7 +229,10 @@ class EffectsTab(QWidget):
         self._apply_status_style(self.render_status)
         layout.addWidget(self.render_status)
         
-        self.render_results = QTextEdit()
+        # Plain line buffer with a cap: render logs are append-only text.
+        self.render_results = QPlainTextEdit()
+        self.render_results.setReadOnly(True)
+        self.render_results.setMaximumBlockCount(500)
         self.render_results.setMaximumHeight(200)
         self._apply_text_panel_style(self.render_results)
         self.render_results.hide()
@@ -132,12 +244,7 @@ class EffectsTab(QWidget):
         """Create visual effects section - NEW"""
         # Main container
         container = QFrame()
-        container.setStyleSheet("""
-            QFrame {
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        container.setProperty("role", "bare")
         
         main_layout = QHBoxLayout(container)
         main_layout.setSpacing(24)
@@ -151,7 +258,7 @@ class EffectsTab(QWidget):
         
         # Header
         image_title = QLabel("Image Animations")
-        image_title.setFont(QFont("Space Grotesk", 14, QFont.Bold))
+        image_title.setFont(self._section_font)
         self._apply_section_title_style(image_title)
         image_layout.addWidget(image_title)
         
@@ -160,47 +267,38 @@ class EffectsTab(QWidget):
         self._apply_overline_style(animation_label)
         
         self.animation_type = QComboBox()
-        self.animation_type.addItems([
-            "None",
-            "Zoom In", 
-            "Zoom Out",
-            "Ken Burns (Zoom + Pan)",
-            "Pan Left",
-            "Pan Right", 
-            "Pan Up",
-            "Pan Down",
-            "Fade In",
-            "Fade Out"
-        ])
+        animation_items = [
+            ("None", "none"),
+            ("Zoom In", "zoom_in"),
+            ("Zoom Out", "zoom_out"),
+            ("Ken Burns (Zoom + Pan)", "ken_burns"),
+            ("Pan Left", "pan_left"),
+            ("Pan Right", "pan_right"),
+            ("Pan Up", "pan_up"),
+            ("Pan Down", "pan_down"),
+            ("Fade In", "fade_in"),
+            ("Fade Out", "fade_out"),
+        ]
+        for text, value in animation_items:
+            self.animation_type.addItem(text, value)
         self.apply_input_style(self.animation_type)
         
         image_layout.addWidget(animation_label)
         image_layout.addWidget(self.animation_type)
         
         # Animation settings
-        settings_grid = QGridLayout()
-        settings_grid.setSpacing(12)
-        
-        # Duration per image
-        duration_label = QLabel("DURATION (SEC)")
-        self._apply_overline_style(duration_label)
-        self.image_duration = QSpinBox()
-        self.image_duration.setRange(1, 30)
-        self.image_duration.setValue(5)
-        self.apply_input_style(self.image_duration)
+        settings_grid = create_form_layout()
         
         # Animation intensity
         intensity_label = QLabel("INTENSITY")
         self._apply_overline_style(intensity_label)
         self.animation_intensity = QComboBox()
-        self.animation_intensity.addItems(["Subtle", "Medium", "Strong"])
+        for text, value in (("Subtle", "subtle"), ("Medium", "medium"), ("Strong", "strong")):
+            self.animation_intensity.addItem(text, value)
         self.animation_intensity.setCurrentIndex(1)  # Medium default
         self.apply_input_style(self.animation_intensity)
         
-        settings_grid.addWidget(duration_label, 0, 0)
-        settings_grid.addWidget(self.image_duration, 1, 0)
-        settings_grid.addWidget(intensity_label, 0, 1)
-        settings_grid.addWidget(self.animation_intensity, 1, 1)
+        settings_grid.addRow(intensity_label, self.animation_intensity)
         
         image_layout.addLayout(settings_grid)
         
@@ -213,7 +311,7 @@ class EffectsTab(QWidget):
         
         # Header
         transition_title = QLabel("Transition Effects")
-        transition_title.setFont(QFont("Space Grotesk", 14, QFont.Bold))
+        transition_title.setFont(self._section_font)
         self._apply_section_title_style(transition_title)
         transition_layout.addWidget(transition_title)
         
@@ -222,27 +320,28 @@ class EffectsTab(QWidget):
         self._apply_overline_style(trans_type_label)
         
         self.transition_type = QComboBox()
-        self.transition_type.addItems([
-            "None",
-            "Fade",
-            "Dissolve", 
-            "Crossfade",
-            "Wipe Left",
-            "Wipe Right",
-            "Wipe Up", 
-            "Wipe Down",
-            "Slide Left",
-            "Slide Right",
-            "Blur Transition"
-        ])
+        transition_items = [
+            ("None", "none"),
+            ("Fade", "fade"),
+            ("Dissolve", "dissolve"),
+            ("Crossfade", "crossfade"),
+            ("Wipe Left", "wipe_left"),
+            ("Wipe Right", "wipe_right"),
+            ("Wipe Up", "wipe_up"),
+            ("Wipe Down", "wipe_down"),
+            ("Slide Left", "slide_left"),
+            ("Slide Right", "slide_right"),
+            ("Blur Transition", "blur"),
+        ]
+        for text, value in transition_items:
+            self.transition_type.addItem(text, value)
         self.apply_input_style(self.transition_type)
         
         transition_layout.addWidget(trans_type_label)
         transition_layout.addWidget(self.transition_type)
         
         # Transition settings
-        trans_settings_grid = QGridLayout()
-        trans_settings_grid.setSpacing(12)
+        trans_settings_grid = create_form_layout()
         
         # Transition duration
         trans_duration_label = QLabel("DURATION (SEC)")
@@ -252,22 +351,15 @@ class EffectsTab(QWidget):
         self.transition_duration.setValue(2)
         self.apply_input_style(self.transition_duration)
 
-        # Apply to all checkbox
-        self.apply_to_all = QCheckBox("Apply to All Images")
-        self.apply_to_all.setChecked(True)
-        self._apply_checkbox_style(self.apply_to_all)
-        
-        trans_settings_grid.addWidget(trans_duration_label, 0, 0)
-        trans_settings_grid.addWidget(self.transition_duration, 1, 0)
-        trans_settings_grid.addWidget(self.apply_to_all, 1, 1)
+        trans_settings_grid.addRow(trans_duration_label, self.transition_duration)
         
         transition_layout.addLayout(trans_settings_grid)
         
         # Preview button
-        preview_btn = QPushButton("Preview Effects")
-        preview_btn.clicked.connect(self.preview_effects)
-        self.apply_button_style(preview_btn, "secondary")
-        transition_layout.addWidget(preview_btn)
+        self.preview_btn = QPushButton("Preview Effects")
+        self.preview_btn.clicked.connect(self.preview_effects)
+        self.apply_button_style(self.preview_btn, "secondary")
+        transition_layout.addWidget(self.preview_btn)
         
         # Add to main layout
         main_layout.addWidget(image_effects_group)
@@ -275,6 +367,57 @@ class EffectsTab(QWidget):
         
         return container
         
+    def _ensure_sections_built(self) -> None:
+        """Build the settings, effects and subtitle sections on first show."""
+        if not self._section_placeholders:
+            return
+        # Swap all three sections in behind a single repaint/relayout
+        # instead of one per inserted widget tree.
+        self.setUpdatesEnabled(False)
+        try:
+            for placeholder, factory in self._section_placeholders:
+                section = getattr(self, factory)()
+                if factory == "create_output_settings_widget":
+                    self._directories_grid.replaceWidget(placeholder, section)
+                else:
+                    self._sections_layout.replaceWidget(placeholder, section)
+                placeholder.deleteLater()
+            self._section_placeholders = []
+        finally:
+            self.setUpdatesEnabled(True)
+        self.updateGeometry()
+
+    def showEvent(self, event) -> None:
+        self._ensure_sections_built()
+        self._warm_up_composer()
+        super().showEvent(event)
+
+    @property
+    def video_composer(self) -> VideoComposer:
+        """The tab's composer, built in place if the warm-up has not landed yet."""
+        if self._video_composer is None:
+            self._video_composer = VideoComposer()
+        return self._video_composer
+
+    def _warm_up_composer(self) -> None:
+        if self._video_composer is not None or self._composer_loading:
+            return
+        self._composer_loading = True
+        loader = ComposerLoader()
+        loader.finished.connect(self._handle_composer_ready, Qt.QueuedConnection)
+        loader.error.connect(self._handle_composer_failed, Qt.QueuedConnection)
+        self._start_thread(loader)
+
+    def _handle_composer_ready(self, composer: VideoComposer) -> None:
+        self._composer_loading = False
+        if self._video_composer is None:
+            self._video_composer = composer
+
+    def _handle_composer_failed(self, _message: str) -> None:
+        # Leave the composer unset: the next show retries the warm-up and
+        # a render builds one in place, reporting the failure then.
+        self._composer_loading = False
+
     def create_input_directories_widget(self):
         """Create input directories widget"""
         group = QGroupBox()
@@ -283,33 +426,22 @@ class EffectsTab(QWidget):
         layout = QVBoxLayout(group)
         layout.setSpacing(16)
 
-        # Audio directory
-        audio_layout = self.create_directory_input("AUDIO DIRECTORY", "Path to audio folder")
-        self.audio_directory = audio_layout[1]
-        audio_browse_btn = audio_layout[2]
-        audio_browse_btn.clicked.connect(self.browse_audio_directory)
-        layout.addLayout(audio_layout[0])
-
-        # Image directory  
-        image_layout = self.create_directory_input("IMAGE DIRECTORY", "Path to image folder")
-        self.image_directory = image_layout[1]
-        image_browse_btn = image_layout[2]
-        image_browse_btn.clicked.connect(self.browse_image_directory)
-        layout.addLayout(image_layout[0])
-
-        # Subtitle directory (optional)
-        subtitle_layout = self.create_directory_input("SUBTITLE DIRECTORY (OPTIONAL)", "Path to subtitle .srt folder")
-        self.subtitle_directory = subtitle_layout[1]
-        subtitle_browse_btn = subtitle_layout[2]
-        subtitle_browse_btn.clicked.connect(self.browse_subtitle_directory)
-        layout.addLayout(subtitle_layout[0])
-
-        # Output directory
-        output_layout = self.create_directory_input("OUTPUT DIRECTORY", "Path to save videos (.mp4)")
-        self.output_directory = output_layout[1]
-        output_browse_btn = output_layout[2]
-        output_browse_btn.clicked.connect(self.browse_output_directory)
-        layout.addLayout(output_layout[0])
+        directory_inputs = (
+            ("audio_directory", "AUDIO DIRECTORY", "Path to audio folder", self.browse_audio_directory),
+            ("image_directory", "IMAGE DIRECTORY", "Path to image folder", self.browse_image_directory),
+            (
+                "subtitle_directory",
+                "SUBTITLE DIRECTORY (OPTIONAL)",
+                "Path to subtitle .srt folder",
+                self.browse_subtitle_directory,
+            ),
+            ("output_directory", "OUTPUT DIRECTORY", "Path to save videos (.mp4)", self.browse_output_directory),
+        )
+        for attribute, label_text, placeholder, browse in directory_inputs:
+            row_layout, line_edit, browse_btn = self.create_directory_input(label_text, placeholder)
+            browse_btn.clicked.connect(browse)
+            setattr(self, attribute, line_edit)
+            layout.addLayout(row_layout)
         
         return group
         
@@ -318,8 +450,8 @@ class EffectsTab(QWidget):
         group = QGroupBox()
         self._apply_group_style(group)
         
-        layout = QVBoxLayout(group)
-        layout.setSpacing(16)
+        layout = create_form_layout(group)
+        layout.setVerticalSpacing(16)
         
         # Frame rate
         frame_rate_label = QLabel("FRAME RATE")
@@ -329,21 +461,20 @@ class EffectsTab(QWidget):
         self.frame_rate.setText("30")
         self.apply_input_style(self.frame_rate)
         
-        layout.addWidget(frame_rate_label)
-        layout.addWidget(self.frame_rate)
+        layout.addRow(frame_rate_label, self.frame_rate)
         
         # Video codec
         codec_label = QLabel("VIDEO CODEC")
         self._apply_overline_style(codec_label)
         self.video_codec = QComboBox()
         self.video_codec.addItems([
-            "H.264 (VideoToolbox)",
-            "HEVC H.265 (VideoToolbox)"
+            "H.264",
+            "HEVC H.265",
+            "Auto (fastest hardware codec)"
         ])
         self.apply_input_style(self.video_codec)
         
-        layout.addWidget(codec_label)
-        layout.addWidget(self.video_codec)
+        layout.addRow(codec_label, self.video_codec)
         
         # Audio bitrate
         bitrate_label = QLabel("AUDIO BITRATE")
@@ -353,32 +484,23 @@ class EffectsTab(QWidget):
         self.audio_bitrate.setText("192k")
         self.apply_input_style(self.audio_bitrate)
         
-        layout.addWidget(bitrate_label)
-        layout.addWidget(self.audio_bitrate)
+        layout.addRow(bitrate_label, self.audio_bitrate)
+
+        # Parallel jobs: scene clips are independent, so several FFmpeg
+        # encodes can run side by side
+        jobs_label = QLabel("PARALLEL JOBS")
+        self._apply_overline_style(jobs_label)
+        self.parallel_jobs = QSpinBox()
+        self.parallel_jobs.setRange(1, max(1, os.cpu_count() or 1))
+        self.parallel_jobs.setValue(max(1, (os.cpu_count() or 1) // 2))
+        self.apply_input_style(self.parallel_jobs)
+
+        layout.addRow(jobs_label, self.parallel_jobs)
         
         # Burn subtitles checkbox
         self.burn_subtitles = QCheckBox("Burn subtitles directly into video")
-        self.burn_subtitles.setStyleSheet("""
-            QCheckBox {
-                color: #94a3b8;
-                font-size: 10px;
-                text-transform: uppercase;
-                font-weight: 600;
-                letter-spacing: 1px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 1px solid #475569;
-                border-radius: 3px;
-                background-color: #1e293b;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #4f46e5;
-                border-color: #6366f1;
-            }
-        """)
-        layout.addWidget(self.burn_subtitles)
+        self._apply_checkbox_style(self.burn_subtitles)
+        layout.addRow(self.burn_subtitles)
         
         return group
         
@@ -386,44 +508,30 @@ class EffectsTab(QWidget):
         """Create subtitle styling section"""
         # Main container
         container = QFrame()
-        container.setStyleSheet("""
-            QFrame {
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        container.setProperty("role", "bare")
         
         main_layout = QHBoxLayout(container)
         main_layout.setSpacing(24)
         
         # Left Panel - Controls
         controls_group = QGroupBox()
-        controls_group.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #334155;
-                border-radius: 16px;
-                background-color: rgba(30, 41, 59, 0.6);
-                padding-top: 20px;
-                margin-top: 12px;
-            }
-        """)
+        self._apply_group_style(controls_group)
         
         controls_layout = QVBoxLayout(controls_group)
         controls_layout.setSpacing(16)
         
         # Header
         controls_title = QLabel("Subtitle Styling (Burn-in)")
-        controls_title.setFont(QFont("Space Grotesk", 14, QFont.Bold))
-        controls_title.setStyleSheet("color: #e2e8f0; margin-bottom: 8px;")
+        controls_title.setFont(self._section_font)
+        self._apply_section_title_style(controls_title)
         controls_layout.addWidget(controls_title)
         
         # Font controls in grid
-        font_grid = QGridLayout()
-        font_grid.setSpacing(12)
+        font_grid = create_form_layout()
         
         # Font family
         font_label = QLabel("FONT")
-        font_label.setStyleSheet("color: #94a3b8; font-size: 10px; font-weight: 600; text-transform: uppercase;")
+        self._apply_overline_style(font_label)
         self.font_combo = QComboBox()
         self.font_combo.addItems(
             [
@@ -437,81 +545,48 @@ class EffectsTab(QWidget):
             ]
         )
         self.font_combo.currentTextChanged.connect(self.update_font_family)
-        self.font_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #1e293b;
-                border: 1px solid #475569;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #e2e8f0;
-                font-size: 12px;
-            }
-        """)
+        self.apply_input_style(self.font_combo)
         
         # Font size
         size_label = QLabel("SIZE")
-        size_label.setStyleSheet("color: #94a3b8; font-size: 10px; font-weight: 600; text-transform: uppercase;")
+        self._apply_overline_style(size_label)
         self.font_size_input = QSpinBox()
         self.font_size_input.setRange(12, 120)
         self.font_size_input.setValue(48)
         self.font_size_input.valueChanged.connect(self.update_font_size)
-        self.font_size_input.setStyleSheet("""
-            QSpinBox {
-                background-color: #1e293b;
-                border: 1px solid #475569;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #e2e8f0;
-                font-size: 12px;
-            }
-        """)
+        self.apply_input_style(self.font_size_input)
         
-        font_grid.addWidget(font_label, 0, 0)
-        font_grid.addWidget(self.font_combo, 1, 0)
-        font_grid.addWidget(size_label, 0, 1)
-        font_grid.addWidget(self.font_size_input, 1, 1)
+        font_grid.addRow(font_label, self.font_combo)
+        font_grid.addRow(size_label, self.font_size_input)
         
         controls_layout.addLayout(font_grid)
         
         # Right Panel - Preview
         preview_group = QGroupBox()
-        preview_group.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #334155;
-                border-radius: 16px;
-                background-color: rgba(30, 41, 59, 0.6);
-                padding-top: 20px;
-                margin-top: 12px;
-            }
-        """)
+        self._apply_group_style(preview_group)
         
         preview_layout = QVBoxLayout(preview_group)
         preview_layout.setSpacing(16)
         
         # Preview header
         preview_title = QLabel("Preview")
-        preview_title.setFont(QFont("Space Grotesk", 14, QFont.Bold))
-        preview_title.setStyleSheet("color: #e2e8f0; margin-bottom: 8px;")
+        preview_title.setFont(self._section_font)
+        self._apply_section_title_style(preview_title)
         preview_layout.addWidget(preview_title)
         
         # Preview area
         self.preview_frame = QFrame()
         self.preview_frame.setMinimumHeight(200)
-        self.preview_frame.setStyleSheet("""
-            QFrame {
-                background-color: rgba(0, 0, 0, 0.95);
-                border: 1px solid #475569;
-                border-radius: 12px;
-            }
-        """)
+        self.preview_frame.setProperty("role", "preview")
         
         preview_frame_layout = QVBoxLayout(self.preview_frame)
         preview_frame_layout.setAlignment(Qt.AlignCenter)
         
-        self.preview_label = QLabel(self.preview_text)
-        self.preview_label.setAlignment(Qt.AlignCenter)
-        self.preview_label.setWordWrap(True)
-        self.update_preview_style()
+        self.preview_label = _SubtitlePreview(self.preview_text)
+        self.preview_label.set_font_family(self.font_family)
+        self.preview_label.set_pixel_size(self.font_size)
+        self.preview_label.set_letter_spacing(self.letter_spacing)
+        self.preview_label.set_color(self.text_color)
         
         preview_frame_layout.addWidget(self.preview_label)
         preview_layout.addWidget(self.preview_frame)
@@ -547,12 +622,16 @@ class EffectsTab(QWidget):
         
         return (layout, line_edit, browse_btn)
         
-    def apply_input_style(self, widget):
-        """Apply consistent input styling"""
+    def _role_stylesheet(self) -> str:
+        """Tab-wide rules for widgets tagged with a ``role`` property.
+
+        Installed once on the tab root (see ``refresh_theme``) so Qt parses
+        the styles a single time instead of once per widget.
+        """
         palette = UnifiedStyles.palette()
-        widget.setStyleSheet(
-            f"""
-            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {{
+        return f"""
+            QLineEdit[role="input"], QComboBox[role="input"],
+            QSpinBox[role="input"], QDoubleSpinBox[role="input"] {{
                 background-color: {palette.surface};
                 border: 1px solid {palette.outline_variant};
                 border-radius: 8px;
@@ -560,111 +639,53 @@ class EffectsTab(QWidget):
                 color: {palette.text_primary};
                 font-size: 12px;
             }}
-            QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus {{
+            QLineEdit[role="input"]:focus, QComboBox[role="input"]:focus,
+            QSpinBox[role="input"]:focus, QDoubleSpinBox[role="input"]:focus {{
                 border-color: {palette.primary};
                 background-color: {palette.surface_bright};
                 outline: none;
             }}
-            QComboBox::drop-down {{ border: none; }}
-            QComboBox::down-arrow {{ width: 0px; height: 0px; }}
-            QSpinBox::up-button,
-            QSpinBox::down-button,
-            QDoubleSpinBox::up-button,
-            QDoubleSpinBox::down-button {{
+            QComboBox[role="input"]::drop-down {{ border: none; }}
+            QComboBox[role="input"]::down-arrow {{ width: 0px; height: 0px; }}
+            QSpinBox[role="input"]::up-button,
+            QSpinBox[role="input"]::down-button,
+            QDoubleSpinBox[role="input"]::up-button,
+            QDoubleSpinBox[role="input"]::down-button {{
                 background: transparent;
                 border: none;
                 width: 14px;
             }}
-        """
-        )
-
-        if widget not in self._input_widgets:
-            self._input_widgets.append(widget)
-
-    def apply_button_style(self, button, color_scheme="primary", size="medium"):
-        scheme_map = {
-            "indigo": "secondary",
-            "emerald": "primary",
-            "gradient": "primary",
-            "outline": "outline",
-        }
-        UnifiedStyles.apply_button_style(button, scheme_map.get(color_scheme, color_scheme), size)
-        if all(button is not btn for btn, _, __ in self._button_configs):
-            self._button_configs.append((button, color_scheme, size))
-
-    def _apply_group_style(self, group: QGroupBox) -> None:
-        palette = UnifiedStyles.palette()
-        group.setStyleSheet(
-            f"""
-            QGroupBox {{
+            QGroupBox[role="panel"] {{
                 border: 1px solid {palette.outline_variant};
                 border-radius: 16px;
                 background-color: {palette.surface};
                 padding-top: 20px;
                 margin-top: 12px;
             }}
-            QGroupBox::title {{
+            QGroupBox[role="panel"]::title {{
                 subcontrol-origin: margin;
                 left: 16px;
                 top: 10px;
                 padding: 0 4px;
             }}
-        """
-        )
-        if group not in self._group_boxes:
-            self._group_boxes.append(group)
-
-    def _apply_header_label_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(
-            f"""
-            color: {palette.text_secondary};
-            text-transform: uppercase;
-            letter-spacing: 2px;
-            font-weight: 600;
-            margin-bottom: 12px;
-        """
-        )
-        if label not in self._header_labels:
-            self._header_labels.append(label)
-
-    def _apply_section_title_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(f"color: {palette.text_primary}; font-weight: 600;")
-        if label not in self._section_titles:
-            self._section_titles.append(label)
-
-    def _apply_overline_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(
-            f"""
-            color: {palette.text_muted};
-            font-size: 10px;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        """
-        )
-        if label not in self._overline_labels:
-            self._overline_labels.append(label)
-
-    def _apply_caption_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(f"color: {palette.text_secondary}; font-size: 10px;")
-        if label not in self._caption_labels:
-            self._caption_labels.append(label)
-
-    def _apply_status_style(self, label: QLabel) -> None:
-        palette = UnifiedStyles.palette()
-        label.setStyleSheet(f"color: {palette.primary_alt}; font-size: 12px;")
-        if label not in self._status_labels:
-            self._status_labels.append(label)
-
-    def _apply_text_panel_style(self, panel: QTextEdit) -> None:
-        palette = UnifiedStyles.palette()
-        panel.setStyleSheet(
-            f"""
-            QTextEdit {{
+            QLabel[role="header"] {{
+                color: {palette.text_secondary};
+                text-transform: uppercase;
+                letter-spacing: 2px;
+                font-weight: 600;
+                margin-bottom: 12px;
+            }}
+            QLabel[role="section-title"] {{ color: {palette.text_primary}; font-weight: 600; }}
+            QLabel[role="overline"] {{
+                color: {palette.text_muted};
+                font-size: 10px;
+                font-weight: 600;
+                text-transform: uppercase;
+                letter-spacing: 1px;
+            }}
+            QLabel[role="caption"] {{ color: {palette.text_secondary}; font-size: 10px; }}
+            QLabel[role="status"] {{ color: {palette.primary_alt}; font-size: 12px; }}
+            QPlainTextEdit[role="text-panel"] {{
                 background-color: {palette.surface};
                 border: 1px solid {palette.outline_variant};
                 border-radius: 8px;
@@ -672,279 +693,418 @@ class EffectsTab(QWidget):
                 font-size: 10px;
                 padding: 8px;
             }}
-        """
-        )
-        if panel not in self._text_panels:
-            self._text_panels.append(panel)
-
-    def _apply_checkbox_style(self, checkbox: QCheckBox) -> None:
-        palette = UnifiedStyles.palette()
-        checkbox.setStyleSheet(
-            f"""
-            QCheckBox {{
+            QCheckBox[role="option"] {{
                 color: {palette.text_secondary};
                 font-size: 10px;
                 text-transform: uppercase;
                 font-weight: 600;
                 letter-spacing: 1px;
             }}
-            QCheckBox::indicator {{
+            QCheckBox[role="option"]::indicator {{
                 width: 16px;
                 height: 16px;
                 border: 1px solid {palette.outline_variant};
                 border-radius: 3px;
                 background-color: {palette.surface};
             }}
-            QCheckBox::indicator:checked {{
+            QCheckBox[role="option"]::indicator:checked {{
                 background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
                     stop:0 {palette.primary}, stop:1 {palette.primary_alt});
                 border-color: {palette.primary};
             }}
-        """
-        )
-        if checkbox not in self._checkboxes:
-            self._checkboxes.append(checkbox)
-
-    def _apply_color_button_style(self, button: QPushButton, color: str) -> None:
-        palette = UnifiedStyles.palette()
-        button.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: {color};
-                border: 1px solid {palette.outline_variant};
-                border-radius: 6px;
-            }}
-        """
-        )
-        if button not in self._color_buttons:
-            self._color_buttons.append(button)
-
-    def _apply_preview_frame_style(self) -> None:
-        palette = UnifiedStyles.palette()
-        self.preview_frame.setStyleSheet(
-            f"""
-            QFrame {{
+            QFrame[role="bare"] {{ background-color: transparent; border: none; }}
+            QFrame[role="preview"] {{
                 background-color: {palette.surface_dim};
                 border: 1px solid {palette.outline_variant};
                 border-radius: 12px;
             }}
-        """
-        )
-
-    def _apply_info_frame_style(self, frame: QFrame) -> None:
-        palette = UnifiedStyles.palette()
-        frame.setStyleSheet(
-            f"""
-            QFrame {{
+            QFrame[role="info"] {{
                 background-color: {palette.surface};
                 border: 1px solid {palette.outline_variant};
                 border-radius: 8px;
                 padding: 12px;
             }}
         """
-        )
-        if frame not in self._info_frames:
-            self._info_frames.append(frame)
 
-    def refresh_theme(self) -> None:
-        """Reapply palette-driven styles when theme changes."""
-        UnifiedStyles.refresh_stylesheet(self)
-        for group in self._group_boxes:
-            self._apply_group_style(group)
+    def apply_input_style(self, widget):
+        """Apply consistent input styling"""
+        widget.setProperty("role", "input")
 
-        for label in self._header_labels:
-            self._apply_header_label_style(label)
+    def apply_button_style(self, button, color_scheme="primary", size="medium"):
+        scheme_map = {
+            "indigo": "secondary",
+            "emerald": "primary",
+            "gradient": "primary",
+            "outline": "outline",
+        }
+        UnifiedStyles.apply_button_style(button, scheme_map.get(color_scheme, color_scheme), size)
 
-        for label in self._section_titles:
-            self._apply_section_title_style(label)
+    def _apply_group_style(self, group: QGroupBox) -> None:
+        group.setProperty("role", "panel")
 
-        for label in self._overline_labels:
-            self._apply_overline_style(label)
+    def _apply_header_label_style(self, label: QLabel) -> None:
+        label.setProperty("role", "header")
 
-        for label in self._caption_labels:
-            self._apply_caption_style(label)
+    def _apply_section_title_style(self, label: QLabel) -> None:
+        label.setProperty("role", "section-title")
 
-        for label in self._status_labels:
-            self._apply_status_style(label)
+    def _apply_overline_style(self, label: QLabel) -> None:
+        label.setProperty("role", "overline")
 
-        for panel in self._text_panels:
-            self._apply_text_panel_style(panel)
+    def _apply_caption_style(self, label: QLabel) -> None:
+        label.setProperty("role", "caption")
 
-        for checkbox in self._checkboxes:
-            self._apply_checkbox_style(checkbox)
+    def _apply_status_style(self, label: QLabel) -> None:
+        label.setProperty("role", "status")
 
-        for frame in self._info_frames:
-            self._apply_info_frame_style(frame)
+    def _apply_text_panel_style(self, panel: QPlainTextEdit) -> None:
+        panel.setProperty("role", "text-panel")
 
-        if hasattr(self, "preview_frame"):
-            self._apply_preview_frame_style()
-        if hasattr(self, "text_color_btn"):
-            self._apply_color_button_style(self.text_color_btn, self.text_color)
-        if hasattr(self, "outline_color_btn"):
-            self._apply_color_button_style(self.outline_color_btn, self.outline_color)
+    def _apply_checkbox_style(self, checkbox: QCheckBox) -> None:
+        checkbox.setProperty("role", "option")
 
-        for widget in self._input_widgets:
-            self.apply_input_style(widget)
+    def _apply_info_frame_style(self, frame: QFrame) -> None:
+        frame.setProperty("role", "info")
 
-        for button, scheme, size in self._button_configs:
-            self.apply_button_style(button, scheme, size)
+    def refresh_theme(self) -> None:
+        """Reapply palette-driven styles when theme changes."""
+        palette = UnifiedStyles.palette()
+        if palette == self._applied_palette:
+            # Same theme as last time: re-setting identical sheets would
+            # still re-polish every widget in the tab.
+            return
+        self._applied_palette = palette
+        # One sheet on the root covers every role-tagged child; Qt re-polishes
+        # the whole subtree from it.
+        self.setStyleSheet(UnifiedStyles.get_main_stylesheet() + self._role_stylesheet())
 
-    
     # Subtitle styling methods
     def update_font_family(self, font):
         """Update font family"""
         self.font_family = font
-        self.update_preview_style()
+        self.preview_label.set_font_family(font)
         
     def update_font_size(self, size):
         """Update font size"""
         self.font_size = size
-        self.update_preview_style()
-        
-    def update_preview_style(self):
-        """Update preview label style"""
-        style = f"""
-            QLabel {{
-                font-family: {self.font_family};
-                font-size: {self.font_size}px;
-                color: {self.text_color};
-                text-align: center;
-                line-height: 1.2;
-                letter-spacing: {self.letter_spacing}px;
-            }}
-        """
-        
-        self.preview_label.setStyleSheet(style)
+        self._preview_refresh_timer.start()
+
+    def _apply_pending_font_size(self) -> None:
+        self.preview_label.set_pixel_size(self.font_size)
     
     # Event handlers
     def browse_audio_directory(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Audio Directory")
+        directory = self._pick_directory("Select Audio Directory")
         if directory:
             self.audio_directory.setText(directory)
             
     def browse_image_directory(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Image Directory")
+        directory = self._pick_directory("Select Image Directory")
         if directory:
             self.image_directory.setText(directory)
             
     def browse_subtitle_directory(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Subtitle Directory")
+        directory = self._pick_directory("Select Subtitle Directory")
         if directory:
             self.subtitle_directory.setText(directory)
             
     def browse_output_directory(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Output Directory")
+        directory = self._pick_directory("Select Output Directory")
         if directory:
             self.output_directory.setText(directory)
     
-    def start_individual_render(self):
-        """Start individual video render with effects"""
-        if not self.audio_directory.text() or not self.image_directory.text() or not self.output_directory.text():
+    def _pick_directory(self, title: str) -> Optional[str]:
+        """Run the shared directory dialog and return the selection, if any."""
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self)
+            self._file_dialog.setFileMode(QFileDialog.Directory)
+            self._file_dialog.setOption(QFileDialog.ShowDirsOnly, True)
+
+        dialog = self._file_dialog
+        dialog.setWindowTitle(title)
+        if dialog.exec() != QDialog.Accepted:
+            return None
+
+        selected = dialog.selectedFiles()
+        return selected[0] if selected else None
+
+    def _collect_render_inputs(
+        self, values: Dict[str, object]
+    ) -> Optional[Tuple[str, str, Optional[str], str]]:
+        audio_dir = values["audio_directory"]
+        image_dir = values["image_directory"]
+        output_dir = values["output_directory"]
+        subtitle_dir = values["subtitle_directory"] or None
+
+        if not audio_dir or not image_dir or not output_dir:
             QMessageBox.warning(self, "Error", "Please select audio, image and output directories.")
+            return None
+
+        return audio_dir, image_dir, subtitle_dir, output_dir
+
+    def _snapshot_inputs(self) -> Dict[str, object]:
+        """Read every render control once into a plain dict.
+
+        Validation, the status line and the worker all work from this
+        snapshot, never the widgets themselves, so nothing touches Qt off
+        the GUI thread.
+        """
+        return {
+            "audio_directory": self.audio_directory.text().strip(),
+            "image_directory": self.image_directory.text().strip(),
+            "output_directory": self.output_directory.text().strip(),
+            "subtitle_directory": self.subtitle_directory.text().strip(),
+            "frame_rate": self.frame_rate.text().strip(),
+            "audio_bitrate": self.audio_bitrate.text().strip(),
+            "video_codec": self.video_codec.currentText(),
+            "burn_subtitles": self.burn_subtitles.isChecked(),
+            "animation_type": self.animation_type.currentData(),
+            "animation_label": self.animation_type.currentText(),
+            "animation_intensity": self.animation_intensity.currentData(),
+            "transition_type": self.transition_type.currentData(),
+            "transition_label": self.transition_type.currentText(),
+            "transition_duration": self.transition_duration.value(),
+            "parallel_jobs": self.parallel_jobs.value(),
+        }
+
+    def _collect_render_options(self, values: Dict[str, object]) -> RenderOptions:
+        try:
+            frame_rate = float(values["frame_rate"] or 30.0)
+        except ValueError:
+            frame_rate = 30.0
+
+        return RenderOptions(
+            frame_rate=frame_rate,
+            video_codec=(
+                "auto" if values["video_codec"].startswith("Auto")
+                else "hevc" if "HEVC" in values["video_codec"]
+                else "h264"
+            ),
+            audio_bitrate=values["audio_bitrate"] or "192k",
+            burn_subtitles=values["burn_subtitles"],
+            subtitle_style=SubtitleStyle(
+                font_name=self.font_family,
+                font_size=self.font_size,
+                primary_color=self.text_color,
+                outline_color=self.outline_color,
+                outline_width=float(self.outline_width),
+                letter_spacing=float(self.letter_spacing),
+            ),
+            animation=AnimationSettings(
+                type=values["animation_type"] or "none",
+                intensity=values["animation_intensity"] or "medium",
+            ),
+            transition=TransitionSettings(
+                type=values["transition_type"] or "none",
+                duration=float(values["transition_duration"]),
+            ),
+            max_parallel_scenes=values["parallel_jobs"],
+            # Two threads per encode: N narrow encodes beat one wide one
+            # when the clips are independent.
+            ffmpeg_threads=2 if values["parallel_jobs"] > 1 else 0,
+            # Clips are short stills, so hardware encoder start-up is a real
+            # share of each one; open it once per four clips instead.
+            scene_batch_size=4,
+        )
+
+    def _start_render(self, mode: str, values: Dict[str, object], status: str) -> None:
+        # A queued click that lands before the buttons grey out must not
+        # start a second render over the first one's status and log.
+        if self._render_active:
             return
-            
-        animation = self.animation_type.currentText()
-        transition = self.transition_type.currentText()
-        
-        self.render_status.setText(f"Creating individual videos with {animation} + {transition}...")
-        self.render_individual_btn.setEnabled(False)
-        self.render_complete_btn.setEnabled(False)
-        
-        # Simulate processing
-        QTimer.singleShot(4000, lambda: self.finish_individual_render())
-        
+        inputs = self._collect_render_inputs(values)
+        if not inputs:
+            return
+
+        audio_dir, image_dir, subtitle_dir, output_dir = inputs
+        options = self._collect_render_options(values)
+
+        self.render_status.setText(status)
+        self.render_results.clear()
+        self.render_results.show()
+        self._last_log_line = ""
+        self._render_values = values
+        self._set_render_active(True)
+
+        worker = RenderWorker(
+            audio_directory=audio_dir,
+            image_directory=image_dir,
+            output_directory=output_dir,
+            subtitle_directory=subtitle_dir,
+            options=options,
+            mode=mode,
+            create_individual=mode == "individual",
+            create_combined=mode == "combined",
+            composer=self.video_composer,
+        )
+        worker.progress.connect(self._handle_render_progress, Qt.QueuedConnection)
+        worker.finished.connect(self._handle_render_finished, Qt.QueuedConnection)
+        worker.error.connect(self._handle_render_error, Qt.QueuedConnection)
+        self._start_thread(worker)
+
+    def _start_thread(self, worker: QObject) -> None:
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        worker.error.connect(worker.deleteLater)
+        thread.finished.connect(lambda: self._finalize_thread(thread, worker))
+        thread.finished.connect(thread.deleteLater)
+        thread.start()
+        self._threads.append(thread)
+        self._workers.append(worker)
+
+    def _finalize_thread(self, thread: QThread, worker: QObject) -> None:
+        if thread in self._threads:
+            self._threads.remove(thread)
+        if worker in self._workers:
+            self._workers.remove(worker)
+
+    def start_individual_render(self):
+        """Start individual video render with effects"""
+        values = self._snapshot_inputs()
+        self._start_render(
+            "individual",
+            values,
+            f"Creating individual videos with {values['animation_label']} + {values['transition_label']}...",
+        )
+
     def start_complete_render(self):
         """Start complete video render with effects"""
-        if not self.audio_directory.text() or not self.image_directory.text() or not self.output_directory.text():
-            QMessageBox.warning(self, "Error", "Please select audio, image and output directories.")
+        values = self._snapshot_inputs()
+        self._start_render("combined", values, f"Creating complete video with {values['animation_label']}...")
+
+    def _handle_render_progress(self, stage: str, ratio: float, message: str) -> None:
+        if not message:
             return
-            
-        animation = self.animation_type.currentText()
-        transition = self.transition_type.currentText()
-        
-        self.render_status.setText(f"Step 1/2: Creating individual videos with {animation}...")
-        self.render_individual_btn.setEnabled(False)
-        self.render_complete_btn.setEnabled(False)
-        
-        # Simulate step 1: Create individual videos
-        QTimer.singleShot(3000, lambda: self.complete_render_step2())
-        
-    def complete_render_step2(self):
-        """Step 2: Concatenate individual videos with transitions"""
-        transition = self.transition_type.currentText()
-        self.render_status.setText(f"Step 2/2: Adding {transition} transitions and concatenating...")
-        
-        # Simulate step 2: Concatenate videos
-        QTimer.singleShot(4000, lambda: self.finish_complete_render())
-        
-    def finish_individual_render(self):
+        self.render_status.setText(f"{message} ({ratio * 100:.0f}%)")
+        # Log each new step once; ratio-only ticks just move the status.
+        if message != self._last_log_line:
+            self._last_log_line = message
+            self.render_results.appendPlainText(message)
+
+    def _set_render_active(self, active: bool) -> None:
+        self._render_active = active
+        self.render_individual_btn.setEnabled(not active)
+        self.render_complete_btn.setEnabled(not active)
+
+    def _handle_render_error(self, message: str) -> None:
+        self.render_status.setText("Render failed.")
+        self._set_render_active(False)
+        QMessageBox.critical(self, "Render Error", message)
+
+    def _handle_render_finished(self, result: RenderBatchResult, mode: str) -> None:
+        self._set_render_active(False)
+        if mode == "combined":
+            self.finish_complete_render(result, self._render_values)
+        else:
+            self.finish_individual_render(result, self._render_values)
+
+    def finish_individual_render(self, result: RenderBatchResult, values: Dict[str, object]):
         """Finish individual video render with effects"""
-        animation = self.animation_type.currentText()
-        transition = self.transition_type.currentText()
-        
-        self.render_status.setText("Created 5 videos with visual effects!")
-        self.render_individual_btn.setEnabled(True)
-        self.render_complete_btn.setEnabled(True)
-        
-        # Show results
-        results_text = f"""✅ VIDEOS WITH EFFECTS CREATED:
-🎬 Animation: {animation} ({self.image_duration.value()}s duration)
-🔄 Transition: {transition} ({self.transition_duration.value()}s duration)
-📁 output_001.mp4 • 15s with effects
-📁 output_002.mp4 • 15s with effects  
-📁 output_003.mp4 • 15s with effects
-📁 output_004.mp4 • 15s with effects
-📁 output_005.mp4 • 15s with effects
-
-Total: 5 videos • Each with visual effects + subtitles"""
-        
-        self.render_results.setText(results_text)
+        animation = values["animation_label"]
+        transition = values["transition_label"]
+
+        clips = [scene for scene in result.scenes if scene.success]
+        self.render_status.setText(f"Created {len(clips)} videos with visual effects!")
+
+        lines = [
+            "✅ VIDEOS WITH EFFECTS CREATED:",
+            f"🎬 Animation: {animation}",
+            f"🔄 Transition: {transition} ({values['transition_duration']}s duration)",
+        ]
+        lines.extend(f"📁 {Path(scene.output_path).name} • {scene.duration:.0f}s with effects" for scene in clips)
+        lines.append("")
+        lines.append(f"Total: {len(clips)} videos • Each with visual effects + subtitles")
+
+        self.render_results.setPlainText("\n".join(lines))
         self.render_results.show()
-        
-    def finish_complete_render(self):
+
+    def finish_complete_render(self, result: RenderBatchResult, values: Dict[str, object]):
         """Finish complete video render with effects"""
-        animation = self.animation_type.currentText()
-        transition = self.transition_type.currentText()
-        
+        animation = values["animation_label"]
+        transition = values["transition_label"]
+        combined = result.combined
+
+        if not combined or not combined.success:
+            self.render_status.setText("Complete video failed.")
+            error = combined.error if combined else "No combined video was produced."
+            self.render_results.setPlainText(f"⚠️ Combined video failed: {error}")
+            self.render_results.show()
+            return
+
         self.render_status.setText("Complete video with effects created!")
-        self.render_individual_btn.setEnabled(True)
-        self.render_complete_btn.setEnabled(True)
-        
-        # Show results
+
         results_text = f"""✅ COMPLETE VIDEO WITH EFFECTS:
-🎬 Step 1: Created 5 videos with {animation} animation
-   • Each image: {self.image_duration.value()}s with smooth effects
+🎬 Animation: {animation}
+🔗 {transition} transitions ({values['transition_duration']}s each)
+   • {Path(combined.output_path).name} • {combined.duration:.0f}s total
 
-🔗 Step 2: Added {transition} transitions ({self.transition_duration.value()}s each)
-   • complete_video_effects.mp4 • 85s total
-   • Seamless transitions between all segments
-   
 ✅ Professional video with cinematic effects completed!"""
-        
-        self.render_results.setText(results_text)
+        for warning in result.warnings:
+            results_text += f"\n⚠️ {warning}"
+
+        self.render_results.setPlainText(results_text)
         self.render_results.show()
-        
+
     def preview_effects(self):
         """Preview visual effects"""
-        animation = self.animation_type.currentText()
-        transition = self.transition_type.currentText()
-        
-        self.render_status.setText(f"Previewing: {animation} + {transition} transition...")
-        
-        # Simulate preview
-        QTimer.singleShot(2000, lambda: self.finish_preview())
-        
-    def finish_preview(self):
+        values = self._snapshot_inputs()
+        if not values["audio_directory"] or not values["image_directory"]:
+            QMessageBox.warning(self, "Error", "Please select audio and image directories.")
+            return
+
+        self.render_status.setText(
+            f"Previewing: {values['animation_label']} + {values['transition_label']} transition..."
+        )
+        self.preview_btn.setEnabled(False)
+        self._preview_values = values
+
+        worker = _PreviewWorker(
+            self.video_composer,
+            values["audio_directory"],
+            values["image_directory"],
+            self._collect_render_options(values),
+        )
+        # Bound methods of the tab are delivered on the GUI thread
+        worker.finished.connect(self.finish_preview, Qt.QueuedConnection)
+        worker.error.connect(self._handle_preview_error, Qt.QueuedConnection)
+        self._start_thread(worker)
+
+    def _handle_preview_error(self, message: str) -> None:
+        self.preview_btn.setEnabled(True)
+        self.render_status.setText(f"Preview failed: {message}")
+
+    @staticmethod
+    def _format_render_estimate(seconds: Optional[float]) -> str:
+        if seconds is None:
+            return "⏳ Estimated render time: unavailable (test encode failed)"
+        minutes, secs = divmod(int(round(seconds)), 60)
+        return f"⏳ Estimated render time: ~{minutes}m {secs:02d}s"
+
+    def finish_preview(self, summary: Dict[str, Any]):
         """Finish preview"""
+        values = self._preview_values
+        self.preview_btn.setEnabled(True)
         self.render_status.setText("Preview completed! Ready for rendering.")
-        
-        preview_text = """✅ EFFECTS PREVIEW:
-🎬 Animation: Zoom In (Medium intensity, 5s per image)
-🔄 Transition: Fade (2s duration)
-📊 Applied to all images
-⚡ Estimated render time: 2-3 minutes
 
-Ready to create videos with effects!"""
-        
-        self.render_results.setText(preview_text)
+        transition = values["transition_label"]
+        if values["transition_type"] != "none":
+            transition = f"{transition} ({values['transition_duration']}s duration)"
+        preview_text = (
+            "✅ EFFECTS PREVIEW:\n"
+            f"🎬 Animation: {values['animation_label']} ({str(values['animation_intensity']).capitalize()} intensity)\n"
+            f"🔄 Transition: {transition}\n"
+            f"🎵 {summary['audio_files']} audio files • {summary['image_files']} images\n"
+            f"⏱️ Total length: {summary['total_duration']:.0f}s "
+            f"(longest scene {summary['longest_duration']:.0f}s)\n"
+            f"⚙️ Encoder: {summary['video_encoder']}\n"
+            f"{self._format_render_estimate(summary['estimated_render_seconds'])}\n"
+            "\n"
+            "Ready to create videos with effects!"
+        )
+
+        self.render_results.setPlainText(preview_text)
         self.render_results.show()
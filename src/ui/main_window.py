@@ -71,12 +71,18 @@ class MainWindow(QMainWindow):
             UnifiedStyles.apply_qpalette(app)
         self.setStyleSheet(UnifiedStyles.get_main_stylesheet())
 
-        if hasattr(self.project_tab, "refresh_stylesheet"):
-            self.project_tab.refresh_stylesheet()
-        if hasattr(self.automation_tab, "refresh_theme"):
-            self.automation_tab.refresh_theme()
-        if hasattr(self.composer_tab, "refresh_theme"):
-            self.composer_tab.refresh_theme()
+        # Every tab restyles itself and skips the work when its palette
+        # is already current.
+        for index in range(self.tab_widget.count()):
+            self.tab_widget.widget(index).refresh_theme()
+
+    def closeEvent(self, event) -> None:  # type: ignore[override]
+        # Tabs inside the QTabWidget never get a closeEvent of their own.
+        if not self.project_tab.can_close():
+            event.ignore()
+            return
+        self.project_tab.shutdown()
+        super().closeEvent(event)
 
     def update_status(self, message: str):
         """Update status bar message"""
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import json
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, Qt, QThread, Signal
 from PySide6.QtWidgets import (
     QFileDialog,
     QFrame,
@@ -25,7 +27,71 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from .unified_styles import UnifiedStyles
+from .unified_styles import ThemePalette, UnifiedStyles
+
+try:  # orjson is optional: without it project files go through stdlib json
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _decode_project_file(raw: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _read_project_file(path: Path) -> Dict[str, Any]:
+    return _decode_project_file(path.read_bytes())
+
+
+def _read_project_bytes(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _encode_project_file(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        # NON_STR_KEYS matches json.dump, which stringifies int/float keys.
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def _write_project_file(path: Path, payload: Dict[str, Any]) -> None:
+    _replace_file(path, _encode_project_file(payload))
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    # Write then rename so a crash mid-write never leaves a torn file.
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+
+
+class ProjectIOWorker(QObject):
+    """Writes encoded project bytes to disk, or reads a project file back."""
+
+    finished = Signal(object, object)
+    error = Signal(str)
+
+    def __init__(self, path: Path, payload: Optional[bytes] = None) -> None:
+        super().__init__()
+        self._path = path
+        self._payload = payload
+
+    def run(self) -> None:
+        try:
+            if self._payload is None:
+                result = _read_project_file(self._path)
+            else:
+                _replace_file(self._path, self._payload)
+                result = None
+        except Exception as exc:
+            self.error.emit(str(exc))
+            return
+        self.finished.emit(self._path, result)
 
 
 @dataclass
@@ -100,12 +166,30 @@ class ProjectRecord:
 class ProjectTab(QWidget):
     """Project management workspace inspired by shadcn/ui."""
 
+    # List metadata for every project file, keyed by file name; see _load_projects.
+    INDEX_FILENAME = "_index.json"
+
     def __init__(self) -> None:
         super().__init__()
         self.projects_directory = self._get_projects_directory()
         self.projects: List[ProjectRecord] = []
+        # Records built from the index alone; the full file is read on
+        # first selection (see _get_project_by_id).
+        self._summary_ids: Set[str] = set()
+        # Summary record whose file is being read for the current selection.
+        self._pending_load_id: Optional[str] = None
+        # Record whose save is in flight; the save button stays off meanwhile.
+        self._saving_record: Optional[ProjectRecord] = None
+        # Bumped on every edit; a save only clears unsaved_changes when no
+        # edit landed while its payload was being written.
+        self._change_generation = 0
+        self._saving_generation = 0
+        self._threads: List[QThread] = []
+        self._workers: List[QObject] = []
         self.current_project: ProjectRecord = ProjectRecord.new()
         self.unsaved_changes = False
+        # Palette the tab was last styled with; see refresh_theme.
+        self._applied_palette: Optional[ThemePalette] = None
 
         self._build_ui()
         self._load_projects()
@@ -115,7 +199,7 @@ class ProjectTab(QWidget):
     # UI Construction
     # ------------------------------------------------------------------
     def _build_ui(self) -> None:
-        UnifiedStyles.refresh_stylesheet(self)
+        self.refresh_theme()
 
         root_layout = QHBoxLayout(self)
         root_layout.setContentsMargins(24, 20, 24, 24)
@@ -396,18 +480,76 @@ class ProjectTab(QWidget):
         return base
 
     def _load_projects(self) -> None:
-        self.projects = []
-        for path in sorted(self.projects_directory.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
+        """Rebuild the project list, parsing only files the index does not cover.
+
+        The index maps each project file name to its mtime and the fields
+        the list shows. A file whose mtime still matches becomes a summary
+        record without being opened; new or changed files are read side by
+        side on a small pool, then parsed and their entries refreshed.
+        """
+        index_path = self.projects_directory / self.INDEX_FILENAME
+        try:
+            index = _read_project_file(index_path)
+        except Exception:
+            index = {}
+
+        fresh: Dict[str, Dict[str, Any]] = {}
+        records: List[Tuple[int, ProjectRecord]] = []
+        summary_ids: Set[str] = set()
+        misses: List[Tuple[str, int, Path]] = []
+        with os.scandir(self.projects_directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or entry.name == self.INDEX_FILENAME or not entry.is_file():
+                    continue
+                path = Path(entry.path)
+                mtime_ns = entry.stat().st_mtime_ns
+                cached = index.get(entry.name)
+                if cached and cached.get("mtime_ns") == mtime_ns:
+                    record = ProjectRecord.from_dict(cached, source=path)
+                    summary_ids.add(record.id)
+                    fresh[entry.name] = self._index_entry(mtime_ns, record)
+                    records.append((mtime_ns, record))
+                else:
+                    misses.append((entry.name, mtime_ns, path))
+
+        # Only the reads go to the pool; parsing holds the GIL either way.
+        paths = [path for _, _, path in misses]
+        if len(paths) < 2:
+            contents = [_read_project_bytes(path) for path in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths)), thread_name_prefix="project") as pool:
+                contents = list(pool.map(_read_project_bytes, paths))
+        for (name, mtime_ns, path), raw in zip(misses, contents):
+            if raw is None:
+                continue
             try:
-                with path.open("r", encoding="utf-8") as handle:
-                    data = json.load(handle)
-                record = ProjectRecord.from_dict(data, source=path)
-                self.projects.append(record)
+                record = ProjectRecord.from_dict(_decode_project_file(raw), source=path)
             except Exception:
                 continue
+            fresh[name] = self._index_entry(mtime_ns, record)
+            records.append((mtime_ns, record))
+
+        records.sort(key=lambda item: item[0], reverse=True)
+        self.projects = [record for _, record in records]
+        self._summary_ids = summary_ids
+
+        if fresh != index:
+            try:
+                _write_project_file(index_path, fresh)
+            except OSError:
+                pass
 
         self._populate_project_list()
 
+    @staticmethod
+    def _index_entry(mtime_ns: int, record: ProjectRecord) -> Dict[str, Any]:
+        return {
+            "mtime_ns": mtime_ns,
+            "id": record.id,
+            "name": record.name,
+            "updated_at": record.updated_at,
+        }
+
     def _populate_project_list(self, query: str = "") -> None:
         self.project_list.blockSignals(True)
         self.project_list.clear()
@@ -438,9 +580,37 @@ class ProjectTab(QWidget):
         selected = self.project_list.selectedItems()[0]
         project_id = selected.data(Qt.UserRole)
         record = self._get_project_by_id(project_id)
-        if record:
+        if not record:
+            return
+        if project_id in self._summary_ids:
+            # Only the list fields are loaded; bind once the file is read.
+            self._pending_load_id = project_id
+            self._start_thread(
+                ProjectIOWorker(record.file_path),
+                self._handle_project_loaded,
+                self._handle_project_load_failed,
+            )
+            return
+        self._pending_load_id = None
+        self._bind_project(record)
+
+    def _handle_project_loaded(self, path: Path, data: Dict[str, Any]) -> None:
+        record = ProjectRecord.from_dict(data, source=path)
+        if record.id not in self._summary_ids:
+            return
+        for position, existing in enumerate(self.projects):
+            if existing.id == record.id:
+                self.projects[position] = record
+                self._summary_ids.discard(record.id)
+                break
+        if record.id == self._pending_load_id:
+            self._pending_load_id = None
             self._bind_project(record)
 
+    def _handle_project_load_failed(self, message: str) -> None:
+        self._pending_load_id = None
+        QMessageBox.critical(self, "Open project", f"Failed to load project:\n{message}")
+
     def _get_project_by_id(self, project_id: str) -> Optional[ProjectRecord]:
         for record in self.projects:
             if record.id == project_id:
@@ -495,8 +665,18 @@ class ProjectTab(QWidget):
         for key, label in self.resource_labels.items():
             label.setText(str(self.current_project.resources.get(key, 0)))
 
+    @property
+    def unsaved_changes(self) -> bool:
+        return self._unsaved_changes
+
+    @unsaved_changes.setter
+    def unsaved_changes(self, value: bool) -> None:
+        if value:
+            self._change_generation += 1
+        self._unsaved_changes = value
+
     def _update_save_button_state(self) -> None:
-        self.save_btn.setEnabled(self.unsaved_changes)
+        self.save_btn.setEnabled(self.unsaved_changes and self._saving_record is None)
         self.delete_btn.setEnabled(self.current_project.file_path is not None)
         self.duplicate_btn.setEnabled(self.current_project.file_path is not None)
 
@@ -579,28 +759,69 @@ class ProjectTab(QWidget):
             QMessageBox.warning(self, "Save project", "Please enter a project name before saving.")
             return
 
+        if self._saving_record is not None:
+            return
+
         self.current_project.updated_at = datetime.now().isoformat()
-        payload = self.current_project.to_dict()
+        # Encode here so the worker never sees the record while it is edited.
+        payload = _encode_project_file(self.current_project.to_dict())
 
         target_path = self.current_project.file_path
         if target_path is None:
             target_path = self.projects_directory / f"{self.current_project.id}.json"
             self.current_project.file_path = target_path
 
-        try:
-            with target_path.open("w", encoding="utf-8") as handle:
-                json.dump(payload, handle, indent=2)
-        except Exception as exc:
-            QMessageBox.critical(self, "Save project", f"Failed to save project:\n{exc}")
-            return
+        self._saving_record = self.current_project
+        self._saving_generation = self._change_generation
+        self._update_save_button_state()
+        self._start_thread(
+            ProjectIOWorker(target_path, payload),
+            self._handle_project_saved,
+            self._handle_project_save_failed,
+        )
 
-        self.current_project.push_history("Project saved")
-        self.unsaved_changes = False
-        self._populate_history()
-        self._update_metadata_labels()
+    def _handle_project_saved(self, path: Path, _result: object) -> None:
+        record, self._saving_record = self._saving_record, None
+        record.push_history("Project saved")
+        if record is self.current_project:
+            if self._change_generation == self._saving_generation:
+                self.unsaved_changes = False
+            self._populate_history()
+            self._update_metadata_labels()
         self._update_save_button_state()
         self._load_projects()
 
+    def _handle_project_save_failed(self, message: str) -> None:
+        self._saving_record = None
+        self._update_save_button_state()
+        QMessageBox.critical(self, "Save project", f"Failed to save project:\n{message}")
+
+    def _start_thread(self, worker: QObject, on_finished, on_error) -> None:
+        thread = QThread(self)
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(on_finished, Qt.QueuedConnection)
+        worker.error.connect(on_error, Qt.QueuedConnection)
+
+        worker.finished.connect(thread.quit)
+        worker.error.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        worker.error.connect(worker.deleteLater)
+
+        thread.finished.connect(lambda: self._finalize_thread(thread, worker))
+        thread.finished.connect(thread.deleteLater)
+        thread.start()
+
+        self._threads.append(thread)
+        self._workers.append(worker)
+
+    def _finalize_thread(self, thread: QThread, worker: QObject) -> None:
+        if thread in self._threads:
+            self._threads.remove(thread)
+        if worker in self._workers:
+            self._workers.remove(worker)
+
     def _duplicate_project(self) -> None:
         clone = ProjectRecord.from_dict(self.current_project.to_dict())
         clone.id = str(uuid.uuid4())
@@ -682,11 +903,26 @@ class ProjectTab(QWidget):
         )
         return response == QMessageBox.Yes
 
-    def closeEvent(self, event) -> None:  # type: ignore[override]
-        if not self._confirm_discard_changes():
-            event.ignore()
+    def can_close(self) -> bool:
+        """Whether the application may exit, asking first about unsaved edits."""
+        saving_everything = (
+            self._saving_record is self.current_project
+            and self._saving_generation == self._change_generation
+        )
+        if saving_everything:
+            return True
+        return self._confirm_discard_changes()
+
+    def shutdown(self) -> None:
+        """Let an in-flight save or load finish before the window goes away."""
+        for thread in list(self._threads):
+            thread.quit()
+            thread.wait()
+
+    def refresh_theme(self) -> None:
+        """Reapply the global stylesheet when the theme changes."""
+        palette = UnifiedStyles.palette()
+        if palette == self._applied_palette:
             return
-        super().closeEvent(event)
-
-    def refresh_stylesheet(self) -> None:
+        self._applied_palette = palette
         UnifiedStyles.refresh_stylesheet(self)
@@ -114,10 +114,8 @@ class UnifiedStyles:
     def palette(cls) -> ThemePalette:
         return cls._THEMES[cls._ACTIVE_THEME]
 
-    @classmethod
-    def get_main_stylesheet(cls) -> str:
-        palette = cls.palette()
-        template = Template(dedent("""
+    # Dedented once at import; get_main_stylesheet only substitutes colours.
+    _MAIN_STYLESHEET_TEMPLATE = Template(dedent("""
             QWidget {
                 background-color: $surface_dim;
                 color: $text_primary;
@@ -339,7 +337,18 @@ class UnifiedStyles:
             .bg-info { background-color: $info; }
         """))
 
-        return template.substitute(
+    # Rendered main sheet per palette. Palettes are frozen, so a theme's
+    # sheet never changes once built and every tab refresh can share it.
+    _main_stylesheets: Dict[ThemePalette, str] = {}
+
+    @classmethod
+    def get_main_stylesheet(cls) -> str:
+        palette = cls.palette()
+        sheet = cls._main_stylesheets.get(palette)
+        if sheet is not None:
+            return sheet
+
+        sheet = cls._MAIN_STYLESHEET_TEMPLATE.substitute(
             surface_dim=palette.surface_dim,
             text_primary=palette.text_primary,
             font_family=UnifiedTypography.FONT_FAMILY,
@@ -361,6 +370,8 @@ class UnifiedStyles:
             error=palette.error,
             info=palette.info,
         )
+        cls._main_stylesheets[palette] = sheet
+        return sheet
 
     @staticmethod
     def apply_typography(widget, style_name):